@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import re
+
 
 def is_unified_diff(text: str) -> bool:
     """Return ``True`` when ``text`` looks like a ``diff --git`` payload."""
@@ -16,39 +18,24 @@ def is_unified_diff(text: str) -> bool:
     return False
 
 
+_FILE_HEADER_RE = re.compile(
+    r"^(?:diff --git[^\S\n]+\S+[^\S\n]+(\S+)|\+\+\+ b/([^\r\n]*))", re.MULTILINE
+)
+
+
 def summarize_unified_diff(text: str) -> dict[str, int]:
     """Return a light summary similar to ``git diff --numstat``."""
 
     changed_files: set[str] = set()
-    additions = 0
-    deletions = 0
+    for match in _FILE_HEADER_RE.finditer(text):
+        git_path, new_path = match.groups()
+        changed_files.add(git_path[2:] if git_path is not None else new_path)
 
-    current_file: str | None = None
-
-    for line in text.splitlines():
-        if line.startswith("diff --git "):
-            parts = line.split()
-            if len(parts) >= 4:
-                current_file = parts[3][2:]
-                changed_files.add(current_file)
-            continue
-        if line.startswith("+++"):
-            if line.startswith("+++ b/"):
-                current_file = line[6:]
-                changed_files.add(current_file)
-            continue
-        if line.startswith("--- "):
-            continue
-        if line.startswith("@@"):
-            continue
-        if line.startswith("+") and not line.startswith("+++"):
-            additions += 1
-            continue
-        if line.startswith("-") and not line.startswith("---"):
-            deletions += 1
-            continue
-        if line.startswith("new file mode") and current_file:
-            changed_files.add(current_file)
+    # Count added/removed lines with substring scans instead of a per-line
+    # loop; file headers (``+++``/``---``) are subtracted back out.
+    body = "\n" + text
+    additions = body.count("\n+") - body.count("\n+++")
+    deletions = body.count("\n-") - body.count("\n---")
 
     return {
         "changed_files": len(changed_files),
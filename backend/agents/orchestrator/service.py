@@ -7,7 +7,11 @@ from enum import Enum
 from typing import Iterable, Protocol
 
 from backend.core.contracts.work_order import WorkOrder
-from backend.core.events.lifecycle import LifecycleEvent, LifecycleEventType
+from backend.core.events.lifecycle import (
+    LifecycleEvent,
+    LifecycleEventPayload,
+    LifecycleEventType,
+)
 from backend.core.logging import get_logger
 from backend.core.models.step import Step
 from backend.core.models.validation import ValidationReport
@@ -99,7 +103,7 @@ class Orchestrator:
             run_id=step.run_id,
             step_id=step.id,
             occurred_at=step.updated_at,
-            payload={"status": step.status},
+            payload=LifecycleEventPayload(status=step.status),
         )
         self.event_publisher.publish(event)
 
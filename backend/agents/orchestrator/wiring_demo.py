@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
-from typing import Mapping
+from typing import Mapping, Sequence
 
 from backend.agents.coder.coder_adapter_fake import CoderAdapterFake
 from backend.agents.github.github_client_fake import GitHubClientFake
@@ -12,6 +12,7 @@ from backend.agents.orchestrator.orchestrator_agent import OrchestratorAgent
 from backend.agents.planner.sub_planner_adapter_fake import SubPlannerAdapterFake
 from backend.agents.validator.fake_validator import FakeValidator
 from core.events.capture import InMemoryEventsPublisher
+from core.events.types import LifecycleEvent
 from core.store.memory_repos import (
     InMemoryArtifactRepo,
     InMemoryPRBindingRepo,
@@ -33,6 +34,30 @@ class DemoOrchestratorContext:
     pr_repo: InMemoryPRBindingRepo
     events: InMemoryEventsPublisher
 
+    def snapshot(self, run_id: str) -> DemoRunSnapshot:
+        """Read the steps, events, artifacts and reports for ``run_id`` once."""
+
+        return DemoRunSnapshot(
+            steps=tuple(self.step_repo.list_steps(run_id)),
+            events=tuple(self.events.list_events(run_id)),
+            artifacts=tuple(
+                artifact
+                for artifact in self.artifact_repo.all_artifacts()
+                if artifact["run_id"] == run_id
+            ),
+            reports=tuple(self.report_repo.list_reports(run_id)),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class DemoRunSnapshot:
+    """Point-in-time view of a demo run returned by :meth:`DemoOrchestratorContext.snapshot`."""
+
+    steps: Sequence[Mapping[str, object]]
+    events: Sequence[LifecycleEvent]
+    artifacts: Sequence[Mapping[str, object]]
+    reports: Sequence[Mapping[str, object]]
+
 
 class PlannerPassthrough:
     """Minimal planner adapter that echoes step metadata.
@@ -94,4 +119,4 @@ def build_demo_orchestrator(*, config: Mapping[str, object] | None = None) -> De
     )
 
 
-__all__ = ["DemoOrchestratorContext", "build_demo_orchestrator"]
+__all__ = ["DemoOrchestratorContext", "DemoRunSnapshot", "build_demo_orchestrator"]
@@ -130,7 +130,8 @@ class BasicSubPlanner:
         else:
             self._log("Preserved explicit dependency requests")
 
-        work_order = WorkOrder(
+        # Every field below is already normalized to its declared type.
+        work_order = WorkOrder.trusted_build(
             work_order_id=work_order_id,
             title=title,
             objective=objective,
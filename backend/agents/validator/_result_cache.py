@@ -0,0 +1,216 @@
+"""Content-addressed on-disk cache for per-file linter findings."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import shelve
+import threading
+from collections.abc import Iterable, Iterator, Sequence
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+
+from backend.agents.validator.process import run_command
+from backend.agents.validator.report_model import FatalItem, WarningItem
+
+
+def cache_dir() -> Path | None:
+    """Return the configured cache directory, or None when caching is off."""
+
+    value = os.getenv("VALIDATOR_CACHE_DIR", "").strip()
+    return Path(value) if value else None
+
+
+@dataclass(slots=True)
+class CachedFindings:
+    """Findings replayed from the cache for unchanged files."""
+
+    fatal: list[FatalItem] = field(default_factory=list)
+    warnings: list[WarningItem] = field(default_factory=list)
+
+
+class ResultCache:
+    """Per-tool mapping of file content hashes to previously parsed findings."""
+
+    def __init__(
+        self,
+        store: shelve.Shelf,
+        salt: bytes,
+        keys: dict[str, str | None] | None = None,
+    ) -> None:
+        self._store = store
+        self._salt = salt
+        self._keys: dict[str, str | None] = {} if keys is None else keys
+
+    @property
+    def keys(self) -> dict[str, str | None]:
+        """Content keys computed so far, reusable by a later :func:`store_cached`."""
+
+        return self._keys
+
+    def partition(self, paths: Sequence[str]) -> tuple[CachedFindings, list[str]]:
+        """Split ``paths`` into replayed findings and paths that must be linted."""
+
+        cached = CachedFindings()
+        misses: list[str] = []
+        for path in paths:
+            key = self._key(path)
+            entry = self._store.get(key) if key is not None else None
+            if entry is None:
+                misses.append(path)
+                continue
+            cached.fatal.extend(FatalItem(**item) for item in entry["fatal"])
+            cached.warnings.extend(WarningItem(**item) for item in entry["warnings"])
+        return cached, misses
+
+    def store(
+        self,
+        paths: Sequence[str],
+        fatal: Iterable[FatalItem],
+        warnings: Iterable[WarningItem] = (),
+    ) -> None:
+        """Record fresh findings for ``paths``, grouped by the file they target."""
+
+        fatal = list(fatal)
+        # Tool-level failures are not attributable to a file; never cache them.
+        if any(not item.file for item in fatal):
+            return
+
+        entries: dict[str, dict[str, list[dict[str, object]]]] = {}
+        owners: dict[str, str] = {}
+        for path in paths:
+            entries[path] = {"fatal": [], "warnings": []}
+            owners[path] = path
+            owners[os.path.abspath(path)] = path
+        for kind, items in (("fatal", fatal), ("warnings", warnings)):
+            for item in items:
+                owner = owners.get(item.file) or owners.get(os.path.abspath(item.file))
+                if owner is not None:
+                    entries[owner][kind].append(item.model_dump())
+
+        for path, entry in entries.items():
+            key = self._key(path)
+            if key is not None:
+                self._store[key] = entry
+
+    def _key(self, path: str) -> str | None:
+        if path not in self._keys:
+            try:
+                content = Path(path).read_bytes()
+            except OSError:
+                self._keys[path] = None
+            else:
+                # Findings carry their file and config such as per-file-ignores
+                # is path dependent, so identical files at different paths must
+                # not share an entry.
+                location = os.path.relpath(os.path.abspath(path)).encode()
+                digest = hashlib.blake2b(content + self._salt)
+                digest.update(b"\0" + location)
+                self._keys[path] = digest.hexdigest()
+        return self._keys[path]
+
+
+# One lock per tool: the shelf's dbm file must not be opened twice at once.
+_SHELF_LOCKS: dict[str, threading.Lock] = {}
+_SHELF_LOCKS_GUARD = threading.Lock()
+
+
+def _shelf_lock(tool: str) -> threading.Lock:
+    with _SHELF_LOCKS_GUARD:
+        return _SHELF_LOCKS.setdefault(tool, threading.Lock())
+
+
+@contextmanager
+def open_result_cache(
+    tool: str,
+    version_command: Sequence[str],
+    config_files: Sequence[str],
+    keys: dict[str, str | None] | None = None,
+) -> Iterator[ResultCache | None]:
+    """Open the cache for ``tool``; yields None when caching is unavailable.
+
+    The shelf is held exclusively for the duration of the ``with`` block, so
+    keep the block short and never await inside it.
+    """
+
+    directory = cache_dir()
+    version = _tool_version(tuple(version_command)) if directory else None
+    if directory is None or version is None:
+        yield None
+        return
+
+    directory.mkdir(parents=True, exist_ok=True)
+    salt = b"\0".join(
+        (tool.encode(), version.encode(), _config_fingerprint(config_files).encode())
+    )
+    with _shelf_lock(tool), shelve.open(str(directory / tool)) as store:
+        yield ResultCache(store, salt, keys)
+
+
+def partition_cached(
+    tool: str,
+    version_command: Sequence[str],
+    config_files: Sequence[str],
+    paths: Sequence[str],
+) -> tuple[CachedFindings, list[str], dict[str, str | None]] | None:
+    """Blocking cache lookup for ``paths``; returns None when caching is off.
+
+    Returns the replayed findings, the paths still to lint and the content keys
+    to hand back to :func:`store_cached`. Meant for ``asyncio.to_thread``.
+    """
+
+    with open_result_cache(tool, version_command, config_files) as cache:
+        if cache is None:
+            return None
+        cached, misses = cache.partition(paths)
+        return cached, misses, cache.keys
+
+
+def store_cached(
+    tool: str,
+    version_command: Sequence[str],
+    config_files: Sequence[str],
+    keys: dict[str, str | None],
+    paths: Sequence[str],
+    fatal: Iterable[FatalItem],
+    warnings: Iterable[WarningItem] = (),
+) -> None:
+    """Blocking counterpart of :meth:`ResultCache.store` for async callers."""
+
+    with open_result_cache(tool, version_command, config_files, keys) as cache:
+        if cache is not None:
+            cache.store(paths, fatal, warnings)
+
+
+@lru_cache(maxsize=None)
+def _tool_version(command: tuple[str, ...]) -> str | None:
+    try:
+        completed = run_command(command)
+    except FileNotFoundError:
+        return None
+    if completed.returncode != 0:
+        return None
+    return completed.stdout.strip()
+
+
+def _config_fingerprint(config_files: Sequence[str]) -> str:
+    parts: list[str] = []
+    for name in config_files:
+        try:
+            stat = os.stat(name)
+        except OSError:
+            continue
+        parts.append(f"{name}:{stat.st_mtime_ns}:{stat.st_size}")
+    return "|".join(parts)
+
+
+__all__ = [
+    "CachedFindings",
+    "ResultCache",
+    "cache_dir",
+    "open_result_cache",
+    "partition_cached",
+    "store_cached",
+]
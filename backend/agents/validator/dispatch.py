@@ -0,0 +1,42 @@
+"""Async dispatch of the Python and JavaScript validator backends."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Sequence
+from uuid import UUID
+
+from backend.agents.validator.js_validator import run_js_validators_async
+from backend.agents.validator.python_validator import run_python_validators_async
+from backend.agents.validator.report_model import Metrics, ValidationReport
+
+
+async def run_all_validators_async(
+    step_id: UUID,
+    python_paths: Sequence[str],
+    js_paths: Sequence[str],
+) -> ValidationReport:
+    """Run every validator backend concurrently and merge their findings.
+
+    Ruff, MyPy, ESLint, and tsc all run as asyncio subprocesses, so a server
+    can overlap many validations on one event loop instead of tying up a
+    worker thread per blocking ``subprocess.run`` call.
+    """
+
+    python_result, js_result = await asyncio.gather(
+        run_python_validators_async(python_paths),
+        run_js_validators_async(js_paths),
+    )
+    return ValidationReport(
+        step_id=step_id,
+        fatal=(*python_result.fatal, *js_result.fatal),
+        warnings=(*python_result.warnings, *js_result.warnings),
+        metrics=Metrics(
+            lint_errors=python_result.lint_errors + js_result.lint_errors,
+            tests_run=0,
+            tests_failed=0,
+        ),
+    )
+
+
+__all__ = ["run_all_validators_async"]
@@ -2,15 +2,56 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
-import subprocess
+import re
+import sys
 from collections.abc import Sequence
-from dataclasses import dataclass
-
+from dataclasses import dataclass, replace
+
+from backend.agents.validator._result_cache import (
+    open_result_cache,
+    partition_cached,
+    store_cached,
+)
+from backend.agents.validator.pipeline import PipelineConfig, run_pipeline
+from backend.agents.validator.process import (
+    CommandResult,
+    run_command,
+    run_command_async,
+)
 from backend.agents.validator.report_model import FatalItem, WarningItem
 
-
-@dataclass
+# ``--max-warnings`` is deliberately omitted: warnings are collected per batch
+# and merged, so a global threshold would be applied to each batch separately.
+_ESLINT_COMMAND = ("eslint", "--format", "json")
+_ESLINT_VERSION_COMMAND = ("eslint", "--version")
+_ESLINT_CONFIG_FILES = (
+    ".eslintrc",
+    ".eslintrc.json",
+    ".eslintrc.js",
+    ".eslintrc.cjs",
+    ".eslintrc.yml",
+    ".eslintrc.yaml",
+    "eslint.config.js",
+    "eslint.config.mjs",
+    "eslint.config.cjs",
+    "package.json",
+)
+_TSC_COMMAND = ("tsc", "--noEmit")
+# One match per non-blank line with surrounding whitespace excluded. Error
+# lines look like ``path.ts(line,col): error TS1234: message``.
+_TSC_LINE_RE = re.compile(
+    r"^[^\S\n]*(?P<text>"
+    r"(?=.*? error )(?P<file>[^(\n]*?)(?:\((?:(?P<lineno>\d+)(?=,))?.*?\))?"
+    r": error(?P<msg>.*?)"
+    r"|.*?\S"
+    r")[^\S\n]*$",
+    re.MULTILINE,
+)
+
+
+@dataclass(slots=True)
 class ValidatorOutput:
     """Container describing validator findings and metrics."""
 
@@ -28,7 +69,7 @@ def run_js_validators(paths: Sequence[str]) -> ValidatorOutput:
     fatal: list[FatalItem] = []
     warnings: list[WarningItem] = []
 
-    eslint_result = _run_eslint(paths)
+    eslint_result = _run_eslint_cached(paths)
     fatal.extend(eslint_result.fatal)
     warnings.extend(eslint_result.warnings)
 
@@ -40,34 +81,126 @@ def run_js_validators(paths: Sequence[str]) -> ValidatorOutput:
     return ValidatorOutput(fatal=fatal, warnings=warnings, lint_errors=lint_errors)
 
 
-@dataclass
+async def run_js_validators_async(paths: Sequence[str]) -> ValidatorOutput:
+    """Execute ESLint and tsc concurrently without blocking the event loop."""
+
+    if not paths:
+        return ValidatorOutput(fatal=[], warnings=[], lint_errors=0)
+
+    eslint_result, tsc_fatal = await asyncio.gather(
+        _run_eslint_cached_async(paths), _run_tsc_async()
+    )
+    fatal = [*eslint_result.fatal, *tsc_fatal]
+
+    return ValidatorOutput(
+        fatal=fatal, warnings=list(eslint_result.warnings), lint_errors=len(fatal)
+    )
+
+
+@dataclass(slots=True)
 class _ESLintResult:
     fatal: list[FatalItem]
     warnings: list[WarningItem]
 
 
+def _run_eslint_cached(paths: Sequence[str]) -> _ESLintResult:
+    """Run ESLint only on files whose content changed since the last cached run."""
+
+    with open_result_cache(
+        "eslint", _ESLINT_VERSION_COMMAND, _ESLINT_CONFIG_FILES
+    ) as cache:
+        if cache is None:
+            return _run_eslint_parallel(paths)
+        cached, misses = cache.partition(paths)
+        fresh = _run_eslint_parallel(misses) if misses else _ESLintResult([], [])
+        cache.store(misses, fresh.fatal, fresh.warnings)
+    return _ESLintResult(
+        fatal=[*cached.fatal, *fresh.fatal],
+        warnings=[*cached.warnings, *fresh.warnings],
+    )
+
+
+async def _run_eslint_cached_async(paths: Sequence[str]) -> _ESLintResult:
+    # Cache IO and hashing run in a worker thread and the shelf is closed
+    # before ESLint is awaited, so the event loop never blocks on it.
+    tool = ("eslint", _ESLINT_VERSION_COMMAND, _ESLINT_CONFIG_FILES)
+    lookup = await asyncio.to_thread(partition_cached, *tool, paths)
+    if lookup is None:
+        return await _run_eslint_async(paths)
+    cached, misses, keys = lookup
+    fresh = await _run_eslint_async(misses) if misses else _ESLintResult([], [])
+    await asyncio.to_thread(
+        store_cached, *tool, keys, misses, fresh.fatal, fresh.warnings
+    )
+    return _ESLintResult(
+        fatal=[*cached.fatal, *fresh.fatal],
+        warnings=[*cached.warnings, *fresh.warnings],
+    )
+
+
+def _run_eslint_parallel(
+    paths: Sequence[str], io_threads: int | None = None
+) -> _ESLintResult:
+    """Run ESLint over ``paths`` through the batch pipeline once the set is large."""
+
+    config = PipelineConfig.from_env()
+    if io_threads:
+        config = replace(config, io_threads=io_threads)
+    if len(paths) <= config.batch_size or config.io_threads < 2:
+        return _run_eslint(paths)
+
+    merged = _ESLintResult(fatal=[], warnings=[])
+    for result in run_pipeline(paths, _execute_eslint, _parse_eslint_batch, config):
+        for item in result.fatal:
+            # Tool-level failures (missing binary, bad exit) repeat per batch.
+            if not item.file and item in merged.fatal:
+                continue
+            merged.fatal.append(item)
+        merged.warnings.extend(result.warnings)
+    return merged
+
+
 def _run_eslint(paths: Sequence[str]) -> _ESLintResult:
+    return _parse_eslint_batch(_execute_eslint(paths))
+
+
+def _execute_eslint(paths: Sequence[str]) -> CommandResult | None:
     try:
-        completed = subprocess.run(
-            ["eslint", "--format", "json", "--max-warnings", "0", *paths],
-            capture_output=True,
-            text=True,
-            check=False,
-        )
+        return run_command([*_ESLINT_COMMAND, *paths])
     except FileNotFoundError:  # pragma: no cover - defensive
-        fatal = [
-            FatalItem(
-                code="JS_ESLINT_MISSING",
-                file="",
-                line=None,
-                msg=(
-                    "eslint executable not found: install JavaScript tooling "
-                    "to enable linting."
-                ),
-            )
-        ]
-        return _ESLintResult(fatal=fatal, warnings=[])
+        return None
+
 
+def _parse_eslint_batch(completed: CommandResult | None) -> _ESLintResult:
+    if completed is None:
+        return _eslint_missing()
+    return _parse_eslint(completed)
+
+
+async def _run_eslint_async(paths: Sequence[str]) -> _ESLintResult:
+    try:
+        completed = await run_command_async([*_ESLINT_COMMAND, *paths])
+    except FileNotFoundError:  # pragma: no cover - defensive
+        return _eslint_missing()
+    return _parse_eslint(completed)
+
+
+def _eslint_missing() -> _ESLintResult:
+    fatal = [
+        FatalItem(
+            code="JS_ESLINT_MISSING",
+            file="",
+            line=None,
+            msg=(
+                "eslint executable not found: install JavaScript tooling "
+                "to enable linting."
+            ),
+        )
+    ]
+    return _ESLintResult(fatal=fatal, warnings=[])
+
+
+def _parse_eslint(completed: CommandResult) -> _ESLintResult:
     stdout = completed.stdout.strip()
     if not stdout and completed.returncode == 0:
         return _ESLintResult(fatal=[], warnings=[])
@@ -92,7 +225,8 @@ def _run_eslint(paths: Sequence[str]) -> _ESLintResult:
         file_path = file_result.get("filePath", "")
         for message in file_result.get("messages", []):
             severity = message.get("severity", 2)
-            code = message.get("ruleId") or "JS_ESLINT"
+            # Rule ids repeat across thousands of findings; share one string each.
+            code = sys.intern(message.get("ruleId") or "JS_ESLINT")
             text = message.get("message", "ESLint reported an issue.")
             line_number = message.get("line")
             if severity == 2:
@@ -131,62 +265,54 @@ def _run_eslint(paths: Sequence[str]) -> _ESLintResult:
 
 def _run_tsc() -> list[FatalItem]:
     try:
-        completed = subprocess.run(
-            ["tsc", "--noEmit"],
-            capture_output=True,
-            text=True,
-            check=False,
-        )
+        completed = run_command(_TSC_COMMAND)
     except FileNotFoundError:  # pragma: no cover - defensive
-        return [
-            FatalItem(
-                code="JS_TSC_MISSING",
-                file="",
-                line=None,
-                msg=(
-                    "tsc executable not found: install TypeScript tooling "
-                    "to enable type checking."
-                ),
-            )
-        ]
+        return _tsc_missing()
+    return _parse_tsc(completed)
 
+
+async def _run_tsc_async() -> list[FatalItem]:
+    try:
+        completed = await run_command_async(_TSC_COMMAND)
+    except FileNotFoundError:  # pragma: no cover - defensive
+        return _tsc_missing()
+    return _parse_tsc(completed)
+
+
+def _tsc_missing() -> list[FatalItem]:
+    return [
+        FatalItem(
+            code="JS_TSC_MISSING",
+            file="",
+            line=None,
+            msg=(
+                "tsc executable not found: install TypeScript tooling "
+                "to enable type checking."
+            ),
+        )
+    ]
+
+
+def _parse_tsc(completed: CommandResult) -> list[FatalItem]:
     if completed.returncode == 0:
         return []
 
     fatal: list[FatalItem] = []
-    stdout_lines = completed.stdout.splitlines()
-    for line in stdout_lines:
-        stripped = line.strip()
-        if not stripped:
-            continue
-        if " error " not in stripped:
+    for match in _TSC_LINE_RE.finditer(completed.stdout):
+        if match["msg"] is None:
             fatal.append(
-                FatalItem(
-                    code="JS_TSC",
-                    file="",
-                    line=None,
-                    msg=stripped,
+                FatalItem.model_construct(
+                    code="JS_TSC", file="", line=None, msg=match["text"]
                 )
             )
             continue
-        # Typical TypeScript output: path.ts(x)(line,col): error TS1234: message
-        prefix, message = stripped.split(": error", maxsplit=1)
-        file_part = prefix
-        line_number = None
-        if "(" in file_part and ")" in file_part:
-            path_part, remainder = file_part.split("(", maxsplit=1)
-            coordinates = remainder.rstrip(")")
-            if "," in coordinates:
-                line_text, _ = coordinates.split(",", maxsplit=1)
-                if line_text.isdigit():
-                    line_number = int(line_text)
-            file_part = path_part
+        line_number = match["lineno"]
         fatal.append(
-            FatalItem(
+            FatalItem.model_construct(
                 code="JS_TSC",
-                file=file_part,
-                line=line_number,
-                msg="error" + message,
+                file=match["file"],
+                line=int(line_number) if line_number is not None else None,
+                msg="error" + match["msg"],
             )
         )
 
@@ -206,4 +332,4 @@ def _run_tsc() -> list[FatalItem]:
     return fatal
 
 
-__all__ = ["ValidatorOutput", "run_js_validators"]
+__all__ = ["ValidatorOutput", "run_js_validators", "run_js_validators_async"]
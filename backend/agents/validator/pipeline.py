@@ -0,0 +1,188 @@
+"""Bounded producer/consumer pipeline for running validators over many files."""
+
+from __future__ import annotations
+
+import math
+import os
+import queue
+import threading
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+RawT = TypeVar("RawT")
+ResultT = TypeVar("ResultT")
+_ItemT = TypeVar("_ItemT")
+_InT = TypeVar("_InT")
+_OutT = TypeVar("_OutT")
+
+# Paths per tool invocation; at or below this a single invocation beats the
+# cost of fanning out.
+_BATCH_SIZE = 200
+
+# Idle stage threads re-check for shutdown at this interval (seconds).
+_POLL_INTERVAL = 0.05
+
+
+def io_threads() -> int:
+    """Return the number of threads executing tool subprocesses."""
+
+    try:
+        return max(1, int(os.getenv("VALIDATOR_IO_THREADS", "")))
+    except ValueError:
+        return os.cpu_count() or 1
+
+
+def workers() -> int:
+    """Return the number of threads parsing tool output."""
+
+    try:
+        return max(1, int(os.getenv("VALIDATOR_WORKERS", "2")))
+    except ValueError:
+        return 2
+
+
+def queue_depth() -> int:
+    """Return the maximum number of items buffered between pipeline stages."""
+
+    try:
+        return max(1, int(os.getenv("VALIDATOR_QUEUE_DEPTH", "16")))
+    except ValueError:
+        return 16
+
+
+@dataclass(frozen=True, slots=True)
+class PipelineConfig:
+    """Thread counts and buffering for :func:`run_pipeline`."""
+
+    io_threads: int
+    workers: int
+    queue_depth: int
+    batch_size: int = _BATCH_SIZE
+
+    @classmethod
+    def from_env(cls) -> PipelineConfig:
+        return cls(
+            io_threads=io_threads(), workers=workers(), queue_depth=queue_depth()
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class _Failure:
+    error: BaseException
+
+
+@dataclass(frozen=True, slots=True)
+class _Tagged(Generic[RawT]):
+    index: int
+    value: RawT | _Failure
+
+
+def run_pipeline(
+    paths: Sequence[str],
+    execute: Callable[[Sequence[str]], RawT],
+    parse: Callable[[RawT], ResultT],
+    config: PipelineConfig | None = None,
+) -> list[ResultT]:
+    """Run ``execute`` then ``parse`` over batches of ``paths``.
+
+    A producer thread slices ``paths`` into batches, ``io_threads`` threads run
+    ``execute`` per batch and ``workers`` threads ``parse`` the raw output,
+    while the calling thread collects results. Every hand-off goes through a
+    queue bounded by ``queue_depth``, so a slow stage blocks the ones feeding
+    it instead of buffering the whole file set. Results are returned in batch
+    order; the first exception raised by a stage is re-raised here.
+    """
+
+    if not paths:
+        return []
+
+    config = config or PipelineConfig.from_env()
+    batch_size = max(
+        1, min(config.batch_size, math.ceil(len(paths) / config.io_threads))
+    )
+    batch_count = math.ceil(len(paths) / batch_size)
+
+    batches: queue.Queue[_Tagged[Sequence[str]]] = queue.Queue(config.queue_depth)
+    outputs: queue.Queue[_Tagged[RawT]] = queue.Queue(config.queue_depth)
+    results: queue.Queue[_Tagged[ResultT]] = queue.Queue(config.queue_depth)
+    stop = threading.Event()
+
+    def put(target: queue.Queue[_Tagged[_ItemT]], item: _Tagged[_ItemT]) -> bool:
+        while not stop.is_set():
+            try:
+                target.put(item, timeout=_POLL_INTERVAL)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        for index in range(batch_count):
+            start = index * batch_size
+            if not put(batches, _Tagged(index, paths[start : start + batch_size])):
+                return
+
+    def stage(
+        source: queue.Queue[_Tagged[_InT]],
+        target: queue.Queue[_Tagged[_OutT]],
+        func: Callable[[_InT], _OutT],
+    ) -> None:
+        while not stop.is_set():
+            try:
+                item = source.get(timeout=_POLL_INTERVAL)
+            except queue.Empty:
+                continue
+            value: _OutT | _Failure
+            if isinstance(item.value, _Failure):
+                value = item.value
+            else:
+                try:
+                    value = func(item.value)
+                except BaseException as exc:  # re-raised by the consumer
+                    value = _Failure(exc)
+            if not put(target, _Tagged(item.index, value)):
+                return
+
+    threads = [threading.Thread(target=produce, name="validator-producer")]
+    threads.extend(
+        threading.Thread(
+            target=stage, args=(batches, outputs, execute), name=f"validator-io-{n}"
+        )
+        for n in range(min(config.io_threads, batch_count))
+    )
+    threads.extend(
+        threading.Thread(
+            target=stage, args=(outputs, results, parse), name=f"validator-parse-{n}"
+        )
+        for n in range(min(config.workers, batch_count))
+    )
+
+    collected: dict[int, ResultT] = {}
+    started: list[threading.Thread] = []
+    try:
+        for thread in threads:
+            thread.start()
+            started.append(thread)
+        for _ in range(batch_count):
+            item = results.get()
+            if isinstance(item.value, _Failure):
+                raise item.value.error
+            collected[item.index] = item.value
+    finally:
+        # Idle stages notice ``stop`` within one poll interval; a stage still
+        # inside ``execute`` or ``parse`` is waited for rather than abandoned.
+        stop.set()
+        for thread in started:
+            thread.join()
+
+    return [collected[index] for index in range(batch_count)]
+
+
+__all__ = [
+    "PipelineConfig",
+    "io_threads",
+    "queue_depth",
+    "run_pipeline",
+    "workers",
+]
@@ -0,0 +1,61 @@
+"""Subprocess helpers shared by the validator backends."""
+
+from __future__ import annotations
+
+import asyncio
+import subprocess
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class CommandResult:
+    """Exit status and captured output of a validator tool invocation."""
+
+    returncode: int
+    stdout: str
+    stderr: str
+
+
+def run_command(argv: Sequence[str]) -> CommandResult:
+    """Run ``argv`` to completion, blocking the calling thread."""
+
+    completed = subprocess.run(
+        list(argv),
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    return CommandResult(
+        returncode=completed.returncode,
+        stdout=completed.stdout,
+        stderr=completed.stderr,
+    )
+
+
+async def run_command_async(argv: Sequence[str]) -> CommandResult:
+    """Run ``argv`` without blocking the event loop.
+
+    Raises:
+        FileNotFoundError: If the executable is not installed, matching
+            :func:`run_command`.
+    """
+
+    process = await asyncio.create_subprocess_exec(
+        *argv,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    stdout, stderr = await process.communicate()
+    return CommandResult(
+        returncode=process.returncode if process.returncode is not None else -1,
+        stdout=stdout.decode("utf-8", errors="replace"),
+        stderr=stderr.decode("utf-8", errors="replace"),
+    )
+
+
+__all__ = [
+    "CommandResult",
+    "run_command",
+    "run_command_async",
+]
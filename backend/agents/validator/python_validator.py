@@ -2,15 +2,42 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
-import subprocess
+import re
+import sys
 from collections.abc import Sequence
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 
+from backend.agents.validator._result_cache import (
+    open_result_cache,
+    partition_cached,
+    store_cached,
+)
+from backend.agents.validator.pipeline import PipelineConfig, run_pipeline
+from backend.agents.validator.process import (
+    CommandResult,
+    run_command,
+    run_command_async,
+)
 from backend.agents.validator.report_model import FatalItem, WarningItem
 
+_RUFF_COMMAND = ("ruff", "check", "--output-format", "json")
+_RUFF_VERSION_COMMAND = ("ruff", "--version")
+_RUFF_CONFIG_FILES = ("ruff.toml", ".ruff.toml", "pyproject.toml")
+_MYPY_COMMAND = ("mypy", "--strict")
+# One match per non-blank line with surrounding whitespace excluded. Error
+# lines look like ``path:line[:col]: error: message``.
+_MYPY_LINE_RE = re.compile(
+    r"^[^\S\n]*(?P<text>"
+    r"(?P<file>[^:\n]*)(?::(?P<lineno>\d+)(?=:))?.*?: error:[^\S\n]*(?P<msg>.*?)"
+    r"|.*?\S"
+    r")[^\S\n]*$",
+    re.MULTILINE,
+)
 
-@dataclass
+
+@dataclass(slots=True)
 class ValidatorOutput:
     """Container describing validator findings and metrics."""
 
@@ -28,32 +55,113 @@ def run_python_validators(paths: Sequence[str]) -> ValidatorOutput:
     fatal: list[FatalItem] = []
     warnings: list[WarningItem] = []
 
-    fatal.extend(_run_ruff(paths))
+    fatal.extend(_run_ruff_cached(paths))
     fatal.extend(_run_mypy(paths))
 
     return ValidatorOutput(fatal=fatal, warnings=warnings, lint_errors=len(fatal))
 
 
+async def run_python_validators_async(paths: Sequence[str]) -> ValidatorOutput:
+    """Execute Ruff and MyPy concurrently without blocking the event loop."""
+
+    if not paths:
+        return ValidatorOutput(fatal=[], warnings=[], lint_errors=0)
+
+    ruff_fatal, mypy_fatal = await asyncio.gather(
+        _run_ruff_cached_async(paths), _run_mypy_async(paths)
+    )
+    fatal = [*ruff_fatal, *mypy_fatal]
+
+    return ValidatorOutput(fatal=fatal, warnings=[], lint_errors=len(fatal))
+
+
+def _run_ruff_cached(paths: Sequence[str]) -> list[FatalItem]:
+    """Run Ruff only on files whose content changed since the last cached run."""
+
+    with open_result_cache(
+        "ruff", _RUFF_VERSION_COMMAND, _RUFF_CONFIG_FILES
+    ) as cache:
+        if cache is None:
+            return _run_ruff_parallel(paths)
+        cached, misses = cache.partition(paths)
+        fresh = _run_ruff_parallel(misses) if misses else []
+        cache.store(misses, fresh)
+    return [*cached.fatal, *fresh]
+
+
+async def _run_ruff_cached_async(paths: Sequence[str]) -> list[FatalItem]:
+    # Cache IO and hashing run in a worker thread and the shelf is closed
+    # before Ruff is awaited, so the event loop never blocks on it.
+    tool = ("ruff", _RUFF_VERSION_COMMAND, _RUFF_CONFIG_FILES)
+    lookup = await asyncio.to_thread(partition_cached, *tool, paths)
+    if lookup is None:
+        return await _run_ruff_async(paths)
+    cached, misses, keys = lookup
+    fresh = await _run_ruff_async(misses) if misses else []
+    await asyncio.to_thread(store_cached, *tool, keys, misses, fresh)
+    return [*cached.fatal, *fresh]
+
+
+def _run_ruff_parallel(
+    paths: Sequence[str], io_threads: int | None = None
+) -> list[FatalItem]:
+    """Run Ruff over ``paths`` through the batch pipeline once the set is large."""
+
+    config = PipelineConfig.from_env()
+    if io_threads:
+        config = replace(config, io_threads=io_threads)
+    if len(paths) <= config.batch_size or config.io_threads < 2:
+        return _run_ruff(paths)
+
+    fatal: list[FatalItem] = []
+    for batch_fatal in run_pipeline(paths, _execute_ruff, _parse_ruff_batch, config):
+        for item in batch_fatal:
+            # Tool-level failures (missing binary, bad exit) repeat per batch.
+            if not item.file and item in fatal:
+                continue
+            fatal.append(item)
+    return fatal
+
+
 def _run_ruff(paths: Sequence[str]) -> list[FatalItem]:
+    return _parse_ruff_batch(_execute_ruff(paths))
+
+
+def _execute_ruff(paths: Sequence[str]) -> CommandResult | None:
     try:
-        completed = subprocess.run(
-            ["ruff", "check", "--output-format", "json", *paths],
-            capture_output=True,
-            text=True,
-            check=False,
-        )
+        return run_command([*_RUFF_COMMAND, *paths])
     except FileNotFoundError:  # pragma: no cover - defensive
-        return [
-            FatalItem(
-                code="PY_RUFF_MISSING",
-                file="",
-                line=None,
-                msg=(
-                    "ruff executable not found: install dependencies to enable linting."
-                ),
-            )
-        ]
+        return None
 
+
+def _parse_ruff_batch(completed: CommandResult | None) -> list[FatalItem]:
+    if completed is None:
+        return _ruff_missing()
+    return _parse_ruff(completed)
+
+
+async def _run_ruff_async(paths: Sequence[str]) -> list[FatalItem]:
+    try:
+        completed = await run_command_async([*_RUFF_COMMAND, *paths])
+    except FileNotFoundError:  # pragma: no cover - defensive
+        return _ruff_missing()
+    return _parse_ruff(completed)
+
+
+def _ruff_missing() -> list[FatalItem]:
+    return [
+        FatalItem(
+            code="PY_RUFF_MISSING",
+            file="",
+            line=None,
+            msg=(
+                "ruff executable not found: install dependencies to enable linting."
+            ),
+        )
+    ]
+
+
+def _parse_ruff(completed: CommandResult) -> list[FatalItem]:
     if not completed.stdout.strip() and completed.returncode == 0:
         return []
 
@@ -74,7 +182,7 @@ def _run_ruff(paths: Sequence[str]) -> list[FatalItem]:
     for item in findings:
         fatal.append(
             FatalItem(
-                code=item.get("code", "PY_RUFF"),
+                code=sys.intern(item.get("code") or "PY_RUFF"),
                 file=item.get("filename", ""),
                 line=item.get("location", {}).get("row"),
                 msg=item.get("message", "Ruff reported a violation."),
@@ -99,60 +207,56 @@ def _run_ruff(paths: Sequence[str]) -> list[FatalItem]:
 
 def _run_mypy(paths: Sequence[str]) -> list[FatalItem]:
     try:
-        completed = subprocess.run(
-            ["mypy", "--strict", *paths],
-            capture_output=True,
-            text=True,
-            check=False,
-        )
+        completed = run_command([*_MYPY_COMMAND, *paths])
     except FileNotFoundError:  # pragma: no cover - defensive
-        return [
-            FatalItem(
-                code="PY_MYPY_MISSING",
-                file="",
-                line=None,
-                msg=(
-                    "mypy executable not found: install dependencies to enable type "
-                    "checking."
-                ),
-            )
-        ]
+        return _mypy_missing()
+    return _parse_mypy(completed)
+
+
+async def _run_mypy_async(paths: Sequence[str]) -> list[FatalItem]:
+    try:
+        completed = await run_command_async([*_MYPY_COMMAND, *paths])
+    except FileNotFoundError:  # pragma: no cover - defensive
+        return _mypy_missing()
+    return _parse_mypy(completed)
+
+
+def _mypy_missing() -> list[FatalItem]:
+    return [
+        FatalItem(
+            code="PY_MYPY_MISSING",
+            file="",
+            line=None,
+            msg=(
+                "mypy executable not found: install dependencies to enable type "
+                "checking."
+            ),
+        )
+    ]
 
+
+def _parse_mypy(completed: CommandResult) -> list[FatalItem]:
     if completed.returncode == 0:
         return []
 
     fatal: list[FatalItem] = []
-    stdout_lines = completed.stdout.splitlines()
-    for raw_line in stdout_lines:
-        stripped = raw_line.strip()
-        if not stripped or stripped.startswith("Found ") or stripped.startswith(
-            "Success: "
-        ):
+    for match in _MYPY_LINE_RE.finditer(completed.stdout):
+        text = match["text"]
+        if text.startswith(("Found ", "Success: ")):
             continue
-        if ": error:" not in stripped:
+        if match["msg"] is None:
             # Fallback for unexpected output while still surfacing context.
             fatal.append(
-                FatalItem(
-                    code="PY_MYPY",
-                    file="",
-                    line=None,
-                    msg=stripped,
-                )
+                FatalItem.model_construct(code="PY_MYPY", file="", line=None, msg=text)
             )
             continue
-
-        prefix, message = stripped.split(": error:", maxsplit=1)
-        parts = prefix.split(":")
-        file_path = parts[0]
-        line_number = None
-        if len(parts) > 1 and parts[1].isdigit():
-            line_number = int(parts[1])
+        line_number = match["lineno"]
         fatal.append(
-            FatalItem(
+            FatalItem.model_construct(
                 code="PY_MYPY",
-                file=file_path,
-                line=line_number,
-                msg=message.strip(),
+                file=match["file"],
+                line=int(line_number) if line_number is not None else None,
+                msg=match["msg"],
             )
         )
 
@@ -172,4 +276,4 @@ def _run_mypy(paths: Sequence[str]) -> list[FatalItem]:
     return fatal
 
 
-__all__ = ["ValidatorOutput", "run_python_validators"]
+__all__ = ["ValidatorOutput", "run_python_validators", "run_python_validators_async"]
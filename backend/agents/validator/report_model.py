@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from functools import cached_property
+from typing import Any, ClassVar
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field
@@ -67,20 +69,29 @@ class Metrics(BaseModel):
 
 
 class ValidationReport(BaseModel):
-    """Structured validator output returned to the orchestrator."""
+    """Structured validator output returned to the orchestrator.
 
-    model_config = ConfigDict(extra="forbid")
+    Reports are frozen once built so their serialized forms can be cached and
+    shared between the log sink, event emission, and CLI/HTTP responses.
+    """
+
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+    _SERIALIZED_CACHE_KEYS: ClassVar[tuple[str, ...]] = (
+        "serialized_dict",
+        "serialized_json",
+    )
 
     step_id: UUID = Field(
         ...,
         description="Identifier of the step associated with this report.",
     )
-    fatal: list[FatalItem] = Field(
-        default_factory=list,
+    fatal: tuple[FatalItem, ...] = Field(
+        default_factory=tuple,
         description="Fatal findings that should halt automated execution.",
     )
-    warnings: list[WarningItem] = Field(
-        default_factory=list,
+    warnings: tuple[WarningItem, ...] = Field(
+        default_factory=tuple,
         description="Warnings that inform operators without blocking execution.",
     )
     metrics: Metrics = Field(
@@ -94,5 +105,30 @@ class ValidationReport(BaseModel):
 
         return bool(self.fatal)
 
+    @cached_property
+    def serialized_dict(self) -> dict[str, Any]:
+        """Return the JSON-compatible mapping, computed once per report.
+
+        Callers must treat the returned mapping as read-only.
+        """
+
+        return self.model_dump(mode="json")
+
+    @cached_property
+    def serialized_json(self) -> str:
+        """Return the compact JSON document, computed once per report."""
+
+        return self.model_dump_json()
+
+    def model_copy(
+        self, *, update: dict[str, Any] | None = None, deep: bool = False
+    ) -> ValidationReport:
+        """Copy the report without carrying over cached serializations."""
+
+        copied = super().model_copy(update=update, deep=deep)
+        for key in self._SERIALIZED_CACHE_KEYS:
+            copied.__dict__.pop(key, None)
+        return copied
+
 
 __all__ = ["FatalItem", "WarningItem", "Metrics", "ValidationReport"]
@@ -8,7 +8,7 @@ from dataclasses import dataclass
 from backend.agents.validator.report_model import FatalItem
 
 
-@dataclass
+@dataclass(slots=True)
 class DiffSummary:
     """Aggregated information about the current diff under validation."""
 
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict
+from pathlib import Path, PurePosixPath
+from typing import Any, Dict, Mapping, Sequence
+from uuid import UUID, uuid4
 
+from backend.agents.validator.dispatch import run_all_validators_async
 from backend.core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -30,6 +33,7 @@ def register_routes(app: Any) -> None:
 
     Note:
         # TODO(team, 2024-05-22): Define API routes for orchestrating runs.
+        ``POST /validate`` should delegate to :func:`handle_validate`.
     """
 
     raise NotImplementedError("Route registration is not yet implemented.")
@@ -47,3 +51,63 @@ def run_server(settings: Dict[str, Any]) -> None:
 
     logger.info("server.start", extra={"meta": {"settings_keys": list(settings.keys())}})
     raise NotImplementedError("Server execution is not yet implemented.")
+
+
+async def handle_validate(payload: Mapping[str, Any]) -> Dict[str, Any]:
+    """Validate the paths in ``payload`` and return the serialized report.
+
+    Framework-agnostic body for the ``POST /validate`` route. Validators run as
+    asyncio subprocesses so concurrent requests share the event loop rather than
+    blocking a worker thread each.
+
+    Args:
+        payload: Request body with optional ``step_id``, ``python_paths``, and
+            ``js_paths`` keys.
+
+    Returns:
+        JSON-compatible validation report.
+
+    Raises:
+        ValueError: If a path list is malformed or names a file outside the
+            workspace.
+    """
+
+    raw_step_id = payload.get("step_id")
+    step_id = UUID(str(raw_step_id)) if raw_step_id else uuid4()
+    workspace = Path.cwd().resolve()
+    python_paths = _workspace_paths(payload, "python_paths", workspace)
+    js_paths = _workspace_paths(payload, "js_paths", workspace)
+    report = await run_all_validators_async(step_id, python_paths, js_paths)
+    logger.info(
+        "validate.completed",
+        extra={"meta": {"step_id": str(step_id), "fatal": len(report.fatal)}},
+    )
+    return report.serialized_dict
+
+
+def _workspace_paths(
+    payload: Mapping[str, Any], key: str, workspace: Path
+) -> Sequence[str]:
+    """Return ``payload[key]`` as repo-relative paths safe to pass to linters.
+
+    Entries end up in tool argv, so anything that could be read as an option or
+    that resolves outside ``workspace`` is rejected.
+    """
+
+    value = payload.get(key)
+    if value is None:
+        return ()
+    if not isinstance(value, list):
+        raise ValueError(f"{key} must be a list of paths.")
+    paths: list[str] = []
+    for entry in value:
+        if not isinstance(entry, str) or not entry:
+            raise ValueError(f"{key} entries must be non-empty strings.")
+        if entry.startswith("-"):
+            raise ValueError(f"{key} entry {entry!r} must not start with '-'.")
+        if PurePosixPath(entry).is_absolute() or Path(entry).is_absolute():
+            raise ValueError(f"{key} entry {entry!r} must be repo-relative.")
+        if not (workspace / entry).resolve().is_relative_to(workspace):
+            raise ValueError(f"{key} entry {entry!r} is outside the workspace.")
+        paths.append(entry)
+    return paths
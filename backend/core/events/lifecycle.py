@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import json
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Dict, Optional
+from typing import Dict, Optional, Union
+
+_ENCODER = json.JSONEncoder(separators=(",", ":"))
 
 
 class LifecycleEventType(str, Enum):
@@ -21,12 +24,57 @@ class LifecycleEventType(str, Enum):
     STEP_MERGED = "step.merged"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
+class LifecycleEventPayload:
+    """Typed payload for the keys lifecycle events commonly carry."""
+
+    status: Optional[str] = None
+    reason: Optional[str] = None
+    commit_sha: Optional[str] = None
+    pr_number: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, str]:
+        """Return the payload as a mapping, omitting unset keys."""
+
+        values = (
+            ("status", self.status),
+            ("reason", self.reason),
+            ("commit_sha", self.commit_sha),
+            ("pr_number", self.pr_number),
+        )
+        return {key: value for key, value in values if value is not None}
+
+
+@dataclass(frozen=True, slots=True)
 class LifecycleEvent:
-    """Represents a structured lifecycle event payload."""
+    """Represents a structured lifecycle event payload.
+
+    ``payload`` is normally a :class:`LifecycleEventPayload`; a plain mapping is
+    still accepted for event types that carry keys outside the typed struct.
+    """
 
     event_type: LifecycleEventType
     run_id: str
     step_id: Optional[str]
     occurred_at: datetime
-    payload: Dict[str, str]
+    payload: Union[LifecycleEventPayload, Dict[str, str]]
+
+    def payload_dict(self) -> Dict[str, str]:
+        """Return the payload as a plain mapping."""
+
+        if isinstance(self.payload, LifecycleEventPayload):
+            return self.payload.to_dict()
+        return dict(self.payload)
+
+    def to_json(self) -> str:
+        """Encode the event in its compact wire format."""
+
+        return _ENCODER.encode(
+            {
+                "event_type": self.event_type.value,
+                "run_id": str(self.run_id),
+                "step_id": str(self.step_id) if self.step_id is not None else None,
+                "occurred_at": self.occurred_at.isoformat(),
+                "payload": self.payload_dict(),
+            }
+        )
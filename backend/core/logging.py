@@ -4,8 +4,8 @@ from __future__ import annotations
 
 import json
 import logging
-from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+import time
+from typing import Any, Dict, Optional, Tuple
 
 _LOGGER_CACHE: Dict[str, logging.Logger] = {}
 
@@ -13,6 +13,27 @@ _LOGGER_CACHE: Dict[str, logging.Logger] = {}
 class JsonLogFormatter(logging.Formatter):
     """JSON formatter that enforces structured log output."""
 
+    def __init__(self) -> None:
+        super().__init__()
+        # (epoch second, ISO prefix) pair swapped atomically so concurrent
+        # handlers never observe a second/prefix mismatch.
+        self._ts_cache: Tuple[int, str] = (-1, "")
+
+    def _timestamp(self) -> str:
+        """Return the current UTC time as an ISO-8601 string.
+
+        The ``YYYY-MM-DDTHH:MM:SS`` prefix only changes once per second, so it is
+        cached and only the microsecond suffix is rendered per record.
+        """
+
+        now = time.time()
+        second = int(now)
+        cached_second, prefix = self._ts_cache
+        if second != cached_second:
+            prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+            self._ts_cache = (second, prefix)
+        return f"{prefix}.{int((now - second) * 1_000_000):06d}+00:00"
+
     def format(self, record: logging.LogRecord) -> str:
         """Format the log record into a JSON string.
 
@@ -23,14 +44,16 @@ class JsonLogFormatter(logging.Formatter):
             A JSON-formatted string representing the log entry.
         """
 
+        # Keys are inserted in canonical order so no per-record sort is needed;
+        # plain ``json.dumps`` also reuses the module's cached default encoder.
         payload = {
-            "ts": datetime.now(tz=timezone.utc).isoformat(),
+            "ts": self._timestamp(),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
             "meta": getattr(record, "meta", {}),
         }
-        return json.dumps(payload, sort_keys=True)
+        return json.dumps(payload)
 
 
 def get_logger(name: str, level: int = logging.INFO) -> logging.Logger:
@@ -33,7 +33,7 @@ class Artifact(Base):
     id: Mapped[uuid.UUID] = mapped_column(
         PGUUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        server_default=text("gen_random_uuid()"),
     )
     step_id: Mapped[uuid.UUID] = mapped_column(
         PGUUID(as_uuid=True),
@@ -8,7 +8,7 @@ from typing import Dict, Optional
 
 import uuid
 
-from sqlalchemy import BigInteger, Enum as SAEnum, ForeignKey, func, text
+from sqlalchemy import BigInteger, Enum as SAEnum, ForeignKey, Index, func, text
 from sqlalchemy.dialects.postgresql import JSONB, TIMESTAMP, UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -33,13 +33,27 @@ class Event(Base):
     """Persistence model representing run and step lifecycle events."""
 
     __tablename__ = "events"
+    __table_args__ = (
+        Index("ix_events_run_id_ts", "run_id", text("ts DESC")),
+        Index(
+            "ix_events_payload_gin",
+            "payload",
+            postgresql_using="gin",
+            postgresql_ops={"payload": "jsonb_path_ops"},
+        ),
+        Index(
+            "ix_events_ts_brin",
+            "ts",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+    )
 
     id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
     run_id: Mapped[uuid.UUID] = mapped_column(
         PGUUID(as_uuid=True),
         ForeignKey("runs.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     step_id: Mapped[Optional[uuid.UUID]] = mapped_column(
         PGUUID(as_uuid=True),
@@ -8,7 +8,7 @@ from enum import Enum
 from typing import List, Optional
 
 from sqlalchemy import Enum as SAEnum
-from sqlalchemy import ForeignKey, Integer, Text, func, text
+from sqlalchemy import ForeignKey, Index, Integer, Text, func, text
 from sqlalchemy.dialects.postgresql import TIMESTAMP, UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -29,11 +29,19 @@ class Run(Base):
     """Persistence model representing a workflow run."""
 
     __tablename__ = "runs"
+    __table_args__ = (
+        Index(
+            "ix_runs_status_updated_at",
+            "status",
+            text("updated_at DESC"),
+            postgresql_where=text("status IN ('pending', 'running')"),
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         PGUUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        server_default=text("gen_random_uuid()"),
     )
     repo: Mapped[str] = mapped_column(Text, nullable=False)
     base_ref: Mapped[str] = mapped_column(Text, nullable=False)
@@ -49,10 +57,13 @@ class Run(Base):
         nullable=False,
         server_default=func.now(),
     )
+    # Maintained by SQLAlchemy on every ORM flush and Core UPDATE statement;
+    # writers bypassing SQLAlchemy must set it explicitly.
     updated_at: Mapped[datetime] = mapped_column(
         TIMESTAMP(timezone=True),
         nullable=False,
         server_default=func.now(),
+        onupdate=func.now(),
     )
 
     steps: Mapped[List["Step"]] = relationship(
@@ -34,13 +34,12 @@ class Step(Base):
     id: Mapped[uuid.UUID] = mapped_column(
         PGUUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        server_default=text("gen_random_uuid()"),
     )
     run_id: Mapped[uuid.UUID] = mapped_column(
         PGUUID(as_uuid=True),
         ForeignKey("runs.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     idx: Mapped[int] = mapped_column(Integer, nullable=False)
     title: Mapped[str] = mapped_column(Text, nullable=False)
@@ -62,10 +61,13 @@ class Step(Base):
         nullable=False,
         server_default=func.now(),
     )
+    # Maintained by SQLAlchemy on every ORM flush and Core UPDATE statement;
+    # writers bypassing SQLAlchemy must set it explicitly.
     updated_at: Mapped[datetime] = mapped_column(
         TIMESTAMP(timezone=True),
         nullable=False,
         server_default=func.now(),
+        onupdate=func.now(),
     )
 
     run: Mapped["Run"] = relationship(
@@ -6,7 +6,7 @@ import uuid
 from datetime import datetime
 from typing import Dict
 
-from sqlalchemy import ForeignKey, Integer, func, text
+from sqlalchemy import ForeignKey, Index, Integer, UniqueConstraint, func, text
 from sqlalchemy.dialects.postgresql import JSONB, TIMESTAMP, UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -17,17 +17,25 @@ class ValidationReport(Base):
     """Persistence model capturing validator outputs for a step."""
 
     __tablename__ = "validation_reports"
+    __table_args__ = (
+        UniqueConstraint("step_id"),
+        Index(
+            "ix_validation_reports_report_gin",
+            "report",
+            postgresql_using="gin",
+            postgresql_ops={"report": "jsonb_path_ops"},
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         PGUUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        server_default=text("gen_random_uuid()"),
     )
     step_id: Mapped[uuid.UUID] = mapped_column(
         PGUUID(as_uuid=True),
         ForeignKey("steps.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     report: Mapped[Dict[str, object]] = mapped_column(JSONB, nullable=False)
     fatal_count: Mapped[int] = mapped_column(
@@ -1,15 +1,23 @@
 """Database store package exports."""
 
 from backend.core.store.session import (
+    async_session_scope,
+    configure_async_engine,
     configure_engine,
     get_engine,
     get_session_factory,
+    pool_settings,
+    read_only_session_scope,
     session_scope,
 )
 
 __all__ = [
+    "async_session_scope",
+    "configure_async_engine",
     "configure_engine",
     "get_engine",
     "get_session_factory",
+    "pool_settings",
+    "read_only_session_scope",
     "session_scope",
 ]
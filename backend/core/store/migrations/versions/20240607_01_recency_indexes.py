@@ -0,0 +1,66 @@
+"""Add recency indexes for dashboard and latest-record lookups."""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "20240607_01"
+down_revision = "20240606_01"
+branch_labels = None
+depends_on = None
+
+
+ACTIVE_RUN_FILTER = "status IN ('pending', 'running')"
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside the migration transaction.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_runs_status_updated_at",
+            "runs",
+            ["status", sa.text("updated_at DESC")],
+            unique=False,
+            postgresql_where=sa.text(ACTIVE_RUN_FILTER),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_events_run_id_ts",
+            "events",
+            ["run_id", sa.text("ts DESC")],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_validation_reports_step_id_created_at",
+            "validation_reports",
+            ["step_id", sa.text("created_at DESC")],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_validation_reports_step_id_created_at",
+            table_name="validation_reports",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_events_run_id_ts",
+            table_name="events",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_runs_status_updated_at",
+            table_name="runs",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,51 @@
+"""Add GIN jsonb_path_ops indexes for JSONB containment queries."""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "20240608_01"
+down_revision = "20240607_01"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside the migration transaction.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_validation_reports_report_gin",
+            "validation_reports",
+            ["report"],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_ops={"report": "jsonb_path_ops"},
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_events_payload_gin",
+            "events",
+            ["payload"],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_ops={"payload": "jsonb_path_ops"},
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_events_payload_gin",
+            table_name="events",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_validation_reports_report_gin",
+            table_name="validation_reports",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
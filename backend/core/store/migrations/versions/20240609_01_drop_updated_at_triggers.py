@@ -0,0 +1,52 @@
+"""Drop updated_at triggers in favour of ORM-side onupdate defaults."""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "20240609_01"
+down_revision = "20240608_01"
+branch_labels = None
+depends_on = None
+
+
+CREATE_UPDATED_AT_TRIGGER = """
+CREATE OR REPLACE FUNCTION set_updated_at()
+RETURNS TRIGGER AS $$
+BEGIN
+    NEW.updated_at = NOW();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+
+RUN_TRIGGER = """
+CREATE TRIGGER runs_set_updated_at
+BEFORE UPDATE ON runs
+FOR EACH ROW EXECUTE PROCEDURE set_updated_at();
+"""
+
+
+STEP_TRIGGER = """
+CREATE TRIGGER steps_set_updated_at
+BEFORE UPDATE ON steps
+FOR EACH ROW EXECUTE PROCEDURE set_updated_at();
+"""
+
+
+DROP_RUN_TRIGGER = "DROP TRIGGER IF EXISTS runs_set_updated_at ON runs;"
+DROP_STEP_TRIGGER = "DROP TRIGGER IF EXISTS steps_set_updated_at ON steps;"
+DROP_TRIGGER_FUNCTION = "DROP FUNCTION IF EXISTS set_updated_at();"
+
+
+def upgrade() -> None:
+    op.execute(DROP_RUN_TRIGGER)
+    op.execute(DROP_STEP_TRIGGER)
+    op.execute(DROP_TRIGGER_FUNCTION)
+
+
+def downgrade() -> None:
+    op.execute(CREATE_UPDATED_AT_TRIGGER)
+    op.execute(RUN_TRIGGER)
+    op.execute(STEP_TRIGGER)
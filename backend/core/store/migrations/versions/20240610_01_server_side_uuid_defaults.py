@@ -0,0 +1,26 @@
+"""Generate primary key UUIDs server-side with gen_random_uuid()."""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "20240610_01"
+down_revision = "20240609_01"
+branch_labels = None
+depends_on = None
+
+
+UUID_TABLES = ("runs", "steps", "artifacts", "validation_reports")
+
+
+def upgrade() -> None:
+    # gen_random_uuid() is built in from Postgres 13; pgcrypto covers older servers.
+    op.execute("CREATE EXTENSION IF NOT EXISTS pgcrypto")
+    for table in UUID_TABLES:
+        op.alter_column(table, "id", server_default=sa.text("gen_random_uuid()"))
+
+
+def downgrade() -> None:
+    for table in UUID_TABLES:
+        op.alter_column(table, "id", server_default=None)
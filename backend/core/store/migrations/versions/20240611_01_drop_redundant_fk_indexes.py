@@ -0,0 +1,62 @@
+"""Drop foreign key indexes covered by composite indexes with the same prefix."""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "20240611_01"
+down_revision = "20240610_01"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # uq_steps_run_id_idx, ix_events_run_id_ts and
+    # ix_validation_reports_step_id_created_at lead with these columns.
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_steps_run_id",
+            table_name="steps",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_events_run_id",
+            table_name="events",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_validation_reports_step_id",
+            table_name="validation_reports",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_validation_reports_step_id",
+            "validation_reports",
+            ["step_id"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_events_run_id",
+            "events",
+            ["run_id"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_steps_run_id",
+            "steps",
+            ["run_id"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
@@ -0,0 +1,45 @@
+"""Keep a single validation report per step to allow upserts."""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "20240612_01"
+down_revision = "20240611_01"
+branch_labels = None
+depends_on = None
+
+
+DELETE_SUPERSEDED_REPORTS = """
+DELETE FROM validation_reports AS older
+USING validation_reports AS newer
+WHERE older.step_id = newer.step_id
+  AND (older.created_at, older.id) < (newer.created_at, newer.id);
+"""
+
+
+def upgrade() -> None:
+    op.execute(DELETE_SUPERSEDED_REPORTS)
+    op.create_unique_constraint(
+        "uq_validation_reports_step_id", "validation_reports", ["step_id"]
+    )
+    # The unique constraint's index now serves every step_id lookup.
+    op.drop_index(
+        "ix_validation_reports_step_id_created_at",
+        table_name="validation_reports",
+        if_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.create_index(
+        "ix_validation_reports_step_id_created_at",
+        "validation_reports",
+        ["step_id", sa.text("created_at DESC")],
+        unique=False,
+        if_not_exists=True,
+    )
+    op.drop_constraint(
+        "uq_validation_reports_step_id", "validation_reports", type_="unique"
+    )
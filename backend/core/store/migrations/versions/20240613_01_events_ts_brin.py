@@ -0,0 +1,35 @@
+"""Add a BRIN index on events.ts for time-range purges."""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "20240613_01"
+down_revision = "20240612_01"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Events are append-only, so ts tracks physical order and BRIN stays tiny.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_events_ts_brin",
+            "events",
+            ["ts"],
+            unique=False,
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_events_ts_brin",
+            table_name="events",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
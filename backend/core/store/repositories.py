@@ -1,12 +1,23 @@
-"""Repository stubs for database persistence."""
+"""Repository stubs for database persistence.
+
+Read paths load the relationships their callers need up front and finish
+with ``raiseload("*")``, so touching any other relationship raises
+``InvalidRequestError`` instead of silently issuing a lazy SELECT per row.
+Callers that only read should open their session with
+``read_only_session_scope`` so Postgres runs them as read-only transactions.
+"""
 
 from __future__ import annotations
 
 import uuid
-from datetime import datetime
-from typing import Optional, Sequence
+from datetime import datetime, timezone
+from itertools import groupby
+from operator import attrgetter
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, TypeVar
 
-from sqlalchemy.orm import Session
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session, load_only, raiseload, selectinload
 
 from backend.core.models.artifact import Artifact, ArtifactKind
 from backend.core.models.event import Event, EventType
@@ -15,6 +26,30 @@ from backend.core.models.step import Step, StepStatus
 from backend.core.models.validation import ValidationReport
 
 
+_EVENT_COPY_SQL = (
+    "COPY events (run_id, step_id, type, payload, ts) FROM STDIN WITH (FORMAT BINARY)"
+)
+_EVENT_COPY_TYPES = ("uuid", "uuid", "varchar", "jsonb", "timestamptz")
+
+# Events deleted per statement by EventRepository.purge_before.
+_PURGE_BATCH_SIZE = 10_000
+
+_RowT = TypeVar("_RowT")
+
+
+def _group_by_key(
+    keys: Sequence[uuid.UUID],
+    rows: Sequence[_RowT],
+    key: Callable[[_RowT], uuid.UUID],
+) -> Dict[uuid.UUID, List[_RowT]]:
+    """Group rows already ordered by ``key``; every requested key is present."""
+
+    grouped: Dict[uuid.UUID, List[_RowT]] = {value: [] for value in keys}
+    for value, group in groupby(rows, key=key):
+        grouped[value] = list(group)
+    return grouped
+
+
 class RunRepository:
     """CRUD operations for run aggregates."""
 
@@ -27,19 +62,47 @@ class RunRepository:
         raise NotImplementedError
 
     def get(self, run_id: uuid.UUID) -> Optional[Run]:
-        """Retrieve a run by identifier."""
-
-        raise NotImplementedError
+        """Retrieve a run by identifier with its steps and PR binding loaded."""
+
+        return self._session.get(
+            Run,
+            run_id,
+            options=[
+                selectinload(Run.steps).selectinload(Step.artifacts),
+                selectinload(Run.steps).selectinload(Step.validation_reports),
+                selectinload(Run.pull_request_binding),
+            ],
+        )
 
     def list(self) -> Sequence[Run]:
-        """List all persisted runs."""
+        """List all persisted runs.
 
-        raise NotImplementedError
+        Relationships are fetched with one ``IN`` query per collection rather
+        than lazily per run, keeping the round-trips constant in the run count.
+        """
 
-    def update_status(self, run_id: uuid.UUID, status: RunStatus) -> Run:
-        """Update the status of an existing run."""
+        stmt = select(Run).options(
+            selectinload(Run.steps),
+            selectinload(Run.events),
+            selectinload(Run.pull_request_binding),
+        )
+        return self._session.scalars(stmt).all()
 
-        raise NotImplementedError
+    def update_status(self, run_id: uuid.UUID, status: RunStatus) -> Run:
+        """Update the status of an existing run in a single round-trip."""
+
+        stmt = (
+            update(Run).where(Run.id == run_id).values(status=status).returning(Run)
+        )
+        # The RETURNING row must overwrite any instance already in the session,
+        # otherwise a previously loaded object comes back with its stale status.
+        return self._session.scalars(
+            stmt,
+            execution_options={
+                "synchronize_session": False,
+                "populate_existing": True,
+            },
+        ).one()
 
     def delete(self, run_id: uuid.UUID) -> None:
         """Delete a run and cascade to dependents."""
@@ -66,20 +129,120 @@ class StepRepository:
 
         raise NotImplementedError
 
+    def create_many(
+        self, run_id: uuid.UUID, rows: Sequence[Mapping[str, Any]]
+    ) -> Sequence[uuid.UUID]:
+        """Persist several steps for a run in a single multi-row INSERT.
+
+        Each row carries ``idx``, ``title``, ``body`` and optional step
+        columns. Returns the generated step identifiers in row order.
+        """
+
+        if not rows:
+            return []
+        # Ids are generated server-side, so match them back to rows by the
+        # (run_id, idx) unique key rather than forcing ordered RETURNING.
+        stmt = insert(Step).returning(Step.idx, Step.id)
+        ids_by_idx = dict(
+            self._session.execute(
+                stmt, [{**row, "run_id": run_id} for row in rows]
+            ).tuples()
+        )
+        return [ids_by_idx[row["idx"]] for row in rows]
+
     def get(self, step_id: uuid.UUID) -> Optional[Step]:
         """Fetch a step by identifier."""
 
-        raise NotImplementedError
+        return self._session.get(
+            Step,
+            step_id,
+            options=[
+                selectinload(Step.artifacts),
+                selectinload(Step.validation_reports),
+                raiseload("*"),
+            ],
+        )
 
     def list_for_run(self, run_id: uuid.UUID) -> Sequence[Step]:
         """List all steps for a given run."""
 
-        raise NotImplementedError
+        stmt = (
+            select(Step)
+            .where(Step.run_id == run_id)
+            .order_by(Step.idx)
+            .options(
+                selectinload(Step.artifacts),
+                selectinload(Step.validation_reports),
+                raiseload("*"),
+            )
+        )
+        return self._session.scalars(stmt).all()
+
+    def list_summaries_for_run(self, run_id: uuid.UUID) -> Sequence[Step]:
+        """List steps for a run with only the columns list views render.
+
+        ``body`` and ``plan_md`` are not fetched; accessing them on the
+        returned instances raises rather than lazily loading.
+        """
+
+        stmt = (
+            select(Step)
+            .where(Step.run_id == run_id)
+            .order_by(Step.idx)
+            .options(
+                load_only(Step.id, Step.idx, Step.title, Step.status, raiseload=True),
+                raiseload("*"),
+            )
+        )
+        return self._session.scalars(stmt).all()
+
+    def list_for_runs(
+        self, run_ids: Sequence[uuid.UUID]
+    ) -> Mapping[uuid.UUID, Sequence[Step]]:
+        """List steps for several runs with one query, keyed by run id."""
+
+        if not run_ids:
+            return {}
+        stmt = (
+            select(Step)
+            .where(Step.run_id.in_(run_ids))
+            .order_by(Step.run_id, Step.idx)
+            .options(
+                selectinload(Step.artifacts),
+                selectinload(Step.validation_reports),
+                raiseload("*"),
+            )
+        )
+        rows = self._session.scalars(stmt).all()
+        return _group_by_key(run_ids, rows, attrgetter("run_id"))
 
     def update_status(self, step_id: uuid.UUID, status: StepStatus) -> Step:
-        """Update the lifecycle status for a step."""
-
-        raise NotImplementedError
+        """Update the lifecycle status for a step in a single round-trip."""
+
+        stmt = (
+            update(Step).where(Step.id == step_id).values(status=status).returning(Step)
+        )
+        # The RETURNING row must overwrite any instance already in the session,
+        # otherwise a previously loaded object comes back with its stale status.
+        return self._session.scalars(
+            stmt,
+            execution_options={
+                "synchronize_session": False,
+                "populate_existing": True,
+            },
+        ).one()
+
+    def update_status_many(
+        self, step_ids: Sequence[uuid.UUID], status: StepStatus
+    ) -> int:
+        """Move several steps to ``status`` with one UPDATE; returns rows changed."""
+
+        if not step_ids:
+            return 0
+        stmt = update(Step).where(Step.id.in_(step_ids)).values(status=status)
+        return self._session.execute(
+            stmt, execution_options={"synchronize_session": False}
+        ).rowcount
 
     def delete(self, step_id: uuid.UUID) -> None:
         """Remove a step and its dependents."""
@@ -105,6 +268,18 @@ class ArtifactRepository:
 
         raise NotImplementedError
 
+    def create_many(self, rows: Sequence[Mapping[str, Any]]) -> None:
+        """Persist several artifacts in a single multi-row INSERT.
+
+        Each row carries ``step_id``, ``kind``, ``uri`` and optional ``meta``.
+        """
+
+        if not rows:
+            return
+        self._session.execute(
+            insert(Artifact), [{**row, "meta": row.get("meta") or {}} for row in rows]
+        )
+
     def get(self, artifact_id: uuid.UUID) -> Optional[Artifact]:
         """Retrieve an artifact by identifier."""
 
@@ -115,6 +290,22 @@ class ArtifactRepository:
 
         raise NotImplementedError
 
+    def list_for_steps(
+        self, step_ids: Sequence[uuid.UUID]
+    ) -> Mapping[uuid.UUID, Sequence[Artifact]]:
+        """List artifacts for several steps with one query, keyed by step id."""
+
+        if not step_ids:
+            return {}
+        stmt = (
+            select(Artifact)
+            .where(Artifact.step_id.in_(step_ids))
+            .order_by(Artifact.step_id, Artifact.created_at)
+            .options(raiseload("*"))
+        )
+        rows = self._session.scalars(stmt).all()
+        return _group_by_key(step_ids, rows, attrgetter("step_id"))
+
     def delete(self, artifact_id: uuid.UUID) -> None:
         """Delete an artifact."""
 
@@ -147,7 +338,65 @@ class ValidationReportRepository:
     def get_for_step(self, step_id: uuid.UUID) -> Optional[ValidationReport]:
         """Retrieve the latest validation report for a step."""
 
-        raise NotImplementedError
+        stmt = (
+            select(ValidationReport)
+            .where(ValidationReport.step_id == step_id)
+            .order_by(ValidationReport.created_at.desc())
+            .limit(1)
+            .options(raiseload("*"))
+        )
+        return self._session.scalars(stmt).first()
+
+    def upsert(
+        self,
+        *,
+        step_id: uuid.UUID,
+        report: dict,
+        fatal_count: int = 0,
+        warnings_count: int = 0,
+    ) -> ValidationReport:
+        """Store the report for a step, replacing any previous one atomically."""
+
+        values = {
+            "report": report,
+            "fatal_count": fatal_count,
+            "warnings_count": warnings_count,
+        }
+        stmt = (
+            pg_insert(ValidationReport)
+            .values(step_id=step_id, **values)
+            .on_conflict_do_update(
+                index_elements=[ValidationReport.step_id],
+                set_={**values, "created_at": func.now()},
+            )
+            .returning(ValidationReport)
+        )
+        return self._session.scalars(
+            stmt, execution_options={"populate_existing": True}
+        ).one()
+
+    def list_counts_for_steps(
+        self, step_ids: Sequence[uuid.UUID]
+    ) -> Sequence[ValidationReport]:
+        """List reports for several steps without loading the ``report`` JSONB."""
+
+        if not step_ids:
+            return []
+        stmt = (
+            select(ValidationReport)
+            .where(ValidationReport.step_id.in_(step_ids))
+            .options(
+                load_only(
+                    ValidationReport.id,
+                    ValidationReport.step_id,
+                    ValidationReport.fatal_count,
+                    ValidationReport.warnings_count,
+                    raiseload=True,
+                ),
+                raiseload("*"),
+            )
+        )
+        return self._session.scalars(stmt).all()
 
     def update_counts(
         self,
@@ -175,7 +424,18 @@ class PullRequestBindingRepository:
     def bind(self, run_id: uuid.UUID, pr_number: int, pr_url: str) -> PullRequestBinding:
         """Create or update a PR binding for a run."""
 
-        raise NotImplementedError
+        stmt = (
+            pg_insert(PullRequestBinding)
+            .values(run_id=run_id, pr_number=pr_number, pr_url=pr_url)
+            .on_conflict_do_update(
+                index_elements=[PullRequestBinding.run_id],
+                set_={"pr_number": pr_number, "pr_url": pr_url},
+            )
+            .returning(PullRequestBinding)
+        )
+        return self._session.scalars(
+            stmt, execution_options={"populate_existing": True}
+        ).one()
 
     def get(self, run_id: uuid.UUID) -> Optional[PullRequestBinding]:
         """Retrieve the PR binding for a run."""
@@ -206,17 +466,94 @@ class EventRepository:
 
         raise NotImplementedError
 
+    def record_many(self, rows: Sequence[Mapping[str, Any]]) -> None:
+        """Persist a burst of lifecycle events in a single multi-row INSERT.
+
+        Each row carries ``run_id``, ``step_id``, ``type`` and optional
+        ``payload``.
+        """
+
+        if not rows:
+            return
+        self._session.execute(
+            insert(Event), [{**row, "payload": row.get("payload") or {}} for row in rows]
+        )
+
+    def record_bulk(self, events: Iterable[Event]) -> int:
+        """Stream many events into the table with a binary ``COPY``.
+
+        Intended for replaying or importing large event batches; the regular
+        write paths keep using :meth:`record` and :meth:`record_many`.
+        Returns the number of rows written.
+        """
+
+        from psycopg.types.json import Jsonb
+
+        raw = self._session.connection().connection.dbapi_connection
+        written = 0
+        with raw.cursor() as cursor:
+            with cursor.copy(_EVENT_COPY_SQL) as copy:
+                copy.set_types(_EVENT_COPY_TYPES)
+                for event in events:
+                    copy.write_row(
+                        (
+                            event.run_id,
+                            event.step_id,
+                            EventType(event.type).value,
+                            Jsonb(event.payload or {}),
+                            event.ts or datetime.now(timezone.utc),
+                        )
+                    )
+                    written += 1
+        return written
+
     def list_for_run(self, run_id: uuid.UUID) -> Sequence[Event]:
         """List events associated with a run."""
 
         raise NotImplementedError
 
+    def list_for_runs(
+        self, run_ids: Sequence[uuid.UUID]
+    ) -> Mapping[uuid.UUID, Sequence[Event]]:
+        """List events for several runs with one query, keyed by run id."""
+
+        if not run_ids:
+            return {}
+        stmt = (
+            select(Event)
+            .where(Event.run_id.in_(run_ids))
+            .order_by(Event.run_id, Event.ts, Event.id)
+            .options(raiseload("*"))
+        )
+        rows = self._session.scalars(stmt).all()
+        return _group_by_key(run_ids, rows, attrgetter("run_id"))
+
     def delete_for_run(self, run_id: uuid.UUID) -> None:
         """Delete all events for a run."""
 
         raise NotImplementedError
 
-    def purge_before(self, threshold_ts: datetime) -> int:
-        """Delete events older than a timestamp threshold."""
-
-        raise NotImplementedError
+    def purge_before(
+        self, threshold_ts: datetime, *, batch_size: int = _PURGE_BATCH_SIZE
+    ) -> int:
+        """Delete events older than a timestamp threshold.
+
+        Rows are removed in ``batch_size`` chunks, which bounds the size of
+        each DELETE statement; the ``ts`` BRIN index narrows each chunk's scan
+        to the oldest heap ranges. All chunks run in the caller's transaction,
+        so row locks are held until the caller commits. Returns the number of
+        rows deleted.
+        """
+
+        doomed = (
+            select(Event.id).where(Event.ts < threshold_ts).limit(batch_size)
+        ).scalar_subquery()
+        stmt = delete(Event).where(Event.id.in_(doomed))
+        total = 0
+        while True:
+            deleted = self._session.execute(
+                stmt, execution_options={"synchronize_session": False}
+            ).rowcount
+            total += deleted
+            if deleted < batch_size:
+                return total
@@ -2,41 +2,130 @@
 
 from __future__ import annotations
 
+import json
 import os
-from contextlib import contextmanager
-from typing import Generator
+from contextlib import asynccontextmanager, contextmanager
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Dict, Generator
 
 from sqlalchemy import create_engine
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session, sessionmaker
 
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
 _ENGINE: Engine | None = None
 _SESSION_FACTORY: sessionmaker[Session] | None = None
+_ASYNC_ENGINE: AsyncEngine | None = None
+_ASYNC_SESSION_FACTORY: async_sessionmaker[AsyncSession] | None = None
+
+# Compact, non-ASCII-escaping JSON keeps JSONB parameters small on the wire.
+_JSON_ENCODER = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+_JSON_DECODER = json.JSONDecoder()
+
+_POOL_DEFAULTS = {
+    "pool_size": ("DB_POOL_SIZE", 10),
+    "max_overflow": ("DB_MAX_OVERFLOW", 20),
+    "pool_recycle": ("DB_POOL_RECYCLE", 1800),
+    "pool_timeout": ("DB_POOL_TIMEOUT", 30),
+}
+
+
+def engine_settings(*, pooled: bool = False) -> Dict[str, Any]:
+    """Return engine keyword arguments: pool settings plus JSON codecs.
+
+    Args:
+        pooled: Whether connections go through a transaction-pooling proxy such
+            as PgBouncer. Server-side prepared statements are then disabled,
+            since consecutive transactions may land on different backends.
+    """
+
+    settings: Dict[str, Any] = {
+        **pool_settings(),
+        "json_serializer": _JSON_ENCODER.encode,
+        "json_deserializer": _JSON_DECODER.decode,
+    }
+    if pooled:
+        settings["connect_args"] = {"prepare_threshold": None}
+    return settings
+
+
+def pool_settings() -> Dict[str, Any]:
+    """Return connection pool keyword arguments, honouring env overrides."""
+
+    settings: Dict[str, Any] = {"pool_pre_ping": True}
+    for option, (env_name, default) in _POOL_DEFAULTS.items():
+        try:
+            settings[option] = int(os.getenv(env_name, str(default)))
+        except ValueError:
+            settings[option] = default
+    return settings
+
+
+def _resolve_dsn(dsn: str | None) -> str:
+    database_dsn = dsn or os.getenv("DB_DSN")
+    if not database_dsn:
+        raise RuntimeError("DB_DSN environment variable is required to configure the engine.")
+    # Plain postgres URLs default to psycopg2; psycopg 3 is the declared driver
+    # and serves both the sync and async engines.
+    for prefix in ("postgresql://", "postgres://"):
+        if database_dsn.startswith(prefix):
+            return "postgresql+psycopg://" + database_dsn[len(prefix) :]
+    return database_dsn
 
 
-def configure_engine(dsn: str | None = None) -> None:
+def configure_engine(dsn: str | None = None, *, pooled: bool = False) -> None:
     """Configure the global SQLAlchemy engine.
 
     Args:
         dsn: Optional database connection string. If omitted, ``DB_DSN`` is read from
             the environment.
+        pooled: Set when connecting through PgBouncer in transaction mode; see
+            :func:`engine_settings`.
 
     Raises:
         RuntimeError: If no DSN is provided or found in the environment.
 
     Note:
-        # TODO(team, 2024-05-22): Harden connection pooling and retries for production.
+        Pool sizing comes from :func:`pool_settings` (``DB_POOL_SIZE``,
+        ``DB_MAX_OVERFLOW``, ``DB_POOL_RECYCLE``, ``DB_POOL_TIMEOUT``).
     """
 
-    database_dsn = dsn or os.getenv("DB_DSN")
-    if not database_dsn:
-        raise RuntimeError("DB_DSN environment variable is required to configure the engine.")
+    database_dsn = _resolve_dsn(dsn)
 
     global _ENGINE, _SESSION_FACTORY
-    _ENGINE = create_engine(database_dsn, pool_pre_ping=True, future=True)
+    _ENGINE = create_engine(database_dsn, future=True, **engine_settings(pooled=pooled))
     _SESSION_FACTORY = sessionmaker(bind=_ENGINE, class_=Session, expire_on_commit=False)
 
 
+def configure_async_engine(dsn: str | None = None, *, pooled: bool = False) -> None:
+    """Configure the global asyncio engine used by concurrent request handlers.
+
+    Args:
+        dsn: Optional database connection string. If omitted, ``DB_DSN`` is read from
+            the environment.
+        pooled: Set when connecting through PgBouncer in transaction mode; see
+            :func:`engine_settings`.
+
+    Raises:
+        RuntimeError: If no DSN is provided or found in the environment.
+    """
+
+    from sqlalchemy.ext.asyncio import (
+        AsyncSession,
+        async_sessionmaker,
+        create_async_engine,
+    )
+
+    database_dsn = _resolve_dsn(dsn)
+
+    global _ASYNC_ENGINE, _ASYNC_SESSION_FACTORY
+    _ASYNC_ENGINE = create_async_engine(database_dsn, **engine_settings(pooled=pooled))
+    _ASYNC_SESSION_FACTORY = async_sessionmaker(
+        _ASYNC_ENGINE, class_=AsyncSession, expire_on_commit=False
+    )
+
+
 def get_engine() -> Engine:
     """Return the configured SQLAlchemy engine.
 
@@ -63,9 +152,10 @@ def session_scope() -> Generator[Session, None, None]:
         RuntimeError: If the session factory has not been configured.
     """
 
-    if _SESSION_FACTORY is None:
+    factory = _SESSION_FACTORY
+    if factory is None:
         raise RuntimeError("Session factory is not configured.")
-    session: Session = _SESSION_FACTORY()
+    session: Session = factory()
     try:
         yield session
         session.commit()
@@ -76,9 +166,61 @@ def session_scope() -> Generator[Session, None, None]:
         session.close()
 
 
+@contextmanager
+def read_only_session_scope() -> Generator[Session, None, None]:
+    """Provide a session whose transaction is ``READ ONLY``.
+
+    Intended for pure read paths such as ``RunRepository.get``/``list``,
+    ``StepRepository.get``/``list_for_run`` and ``EventRepository.list_for_run``.
+    Postgres skips transaction id assignment for read-only transactions, and
+    the scope ends with a rollback since there is nothing to commit.
+
+    Yields:
+        A SQLAlchemy session.
+
+    Raises:
+        RuntimeError: If the session factory has not been configured.
+    """
+
+    factory = _SESSION_FACTORY
+    if factory is None:
+        raise RuntimeError("Session factory is not configured.")
+    session: Session = factory()
+    try:
+        session.connection(execution_options={"postgresql_readonly": True})
+        yield session
+    finally:
+        session.rollback()
+        session.close()
+
+
+@asynccontextmanager
+async def async_session_scope() -> AsyncGenerator[AsyncSession, None]:
+    """Provide an asyncio transactional scope around a series of operations.
+
+    Yields:
+        A SQLAlchemy asyncio session.
+
+    Raises:
+        RuntimeError: If the async session factory has not been configured.
+    """
+
+    factory = _ASYNC_SESSION_FACTORY
+    if factory is None:
+        raise RuntimeError("Async session factory is not configured.")
+    async with factory() as session:
+        try:
+            yield session
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
+
+
 def get_session_factory() -> sessionmaker[Session]:
     """Return the configured session factory."""
 
-    if _SESSION_FACTORY is None:
+    factory = _SESSION_FACTORY
+    if factory is None:
         raise RuntimeError("Session factory is not configured.")
-    return _SESSION_FACTORY
+    return factory
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 from datetime import datetime, timezone
 
 from core.events.types import (
@@ -31,6 +32,7 @@ def test_step_event_to_dict_contains_expected_fields() -> None:
     assert payload["event_type"] == LifecycleEventType.STEP_PLANNED.value
     assert payload["duration_ms"] == 42
     assert payload["meta"] == {"phase": "planned"}
+    assert json.loads(json.dumps(payload))["meta"] == {"phase": "planned"}
 
 
 def test_run_status_event_serializes_without_step() -> None:
@@ -72,3 +74,12 @@ def test_step_event_handles_optional_meta() -> None:
 
     payload = event.to_dict()
     assert "meta" not in payload
+
+
+def test_step_event_precomputes_serialised_fields() -> None:
+    timestamp = datetime(2024, 6, 1, 12, 0, tzinfo=timezone.utc)
+    event = StepPlanned(run_id="run-6", state="planned", timestamp=timestamp)
+
+    assert event.iso_timestamp == "2024-06-01T12:00:00+00:00"
+    assert event.event_type_value == "step.planned"
+    assert event == StepPlanned(run_id="run-6", state="planned", timestamp=timestamp)
@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import itertools
 import logging
-from dataclasses import dataclass
+import sys
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from types import MappingProxyType
 from typing import List, Mapping, MutableMapping, Sequence
-from uuid import uuid4
 
 import pytest
 
@@ -22,27 +25,42 @@ from core.events.publisher import EventsPublisher
 from core.events.types import LifecycleEvent, RunStatusChanged, StepCommitted, StepExecuting, StepPlanned, StepValidated
 from core.store.repositories import ArtifactRepo, PRBindingRepo, RunRepo, StepRepo, ValidationReportRepo
 
+_EXPECTED_KINDS = frozenset({"diff", "doc"})
+_TERMINAL_STEP_STATES = frozenset(
+    {sys.intern(StepState.PR_UPDATED.value), sys.intern(StepState.MERGED.value)}
+)
+_FAKE_DIFF = "diff --git a/file.txt b/file.txt\n--- a/file.txt\n+++ b/file.txt\n@@\n+hello"
+_ID_COUNTER = itertools.count()
+
+
+def _fake_id() -> str:
+    """Return a unique id that still parses as a UUID."""
+
+    return f"00000000-0000-0000-0000-{next(_ID_COUNTER):012x}"
+
 
 @dataclass
 class FakeWorkOrder:
     work_order_id: str
     title: str
     objective: str
-    constraints: list[str]
-    acceptance_criteria: list[str]
-    context_files: list[str]
-    dependencies: list[str]
+    constraints: tuple[str, ...]
+    acceptance_criteria: tuple[str, ...]
+    context_files: tuple[str, ...]
+    dependencies: tuple[str, ...]
     return_format: str
 
     def to_dict(self) -> Mapping[str, object]:
+        """Return a read-only view; the collections are shared, not copied."""
+
         return {
             "work_order_id": self.work_order_id,
             "title": self.title,
             "objective": self.objective,
-            "constraints": list(self.constraints),
-            "acceptance_criteria": list(self.acceptance_criteria),
-            "context_files": list(self.context_files),
-            "dependencies": list(self.dependencies),
+            "constraints": self.constraints,
+            "acceptance_criteria": self.acceptance_criteria,
+            "context_files": self.context_files,
+            "dependencies": self.dependencies,
             "return_format": self.return_format,
         }
 
@@ -52,13 +70,20 @@ class FakeCoderResult:
     work_order_id: str
     diff: str
     notes: str | None
+    _cached_dict: Mapping[str, object] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def to_dict(self) -> Mapping[str, object]:
-        return {
-            "work_order_id": self.work_order_id,
-            "diff": self.diff,
-            "notes": self.notes,
-        }
+        """Return a read-only mapping built on first use and reused afterwards."""
+
+        if self._cached_dict is None:
+            self._cached_dict = {
+                "work_order_id": self.work_order_id,
+                "diff": self.diff,
+                "notes": self.notes,
+            }
+        return self._cached_dict
 
 
 @dataclass
@@ -78,9 +103,12 @@ class FakeValidationReport:
 
 
 class RunRepoFake(RunRepo):
-    def __init__(self) -> None:
+    """With ``copy_on_write=False`` configs are stored by reference; do not mutate them."""
+
+    def __init__(self, *, copy_on_write: bool = True) -> None:
         self.runs: MutableMapping[str, MutableMapping[str, object]] = {}
         self._counter = 0
+        self._copy_on_write = copy_on_write
 
     def create_run(
         self,
@@ -99,7 +127,7 @@ class RunRepoFake(RunRepo):
             "base_ref": base_ref,
             "feature_ref": feature_ref,
             "state": status,
-            "config": dict(config or {}),
+            "config": dict(config or {}) if self._copy_on_write else config or {},
         }
         return run_id
 
@@ -111,24 +139,39 @@ class RunRepoFake(RunRepo):
 
 
 class StepRepoFake(StepRepo):
-    def __init__(self) -> None:
-        self.steps: MutableMapping[str, List[MutableMapping[str, object]]] = {}
+    """Stores incoming steps as given and copies one only on its first write.
+
+    With ``copy_on_write=False`` steps are shared with callers and mutated in
+    place; do not reuse them.
+    """
+
+    def __init__(self, *, copy_on_write: bool = True) -> None:
+        self.steps: MutableMapping[str, List[Mapping[str, object]]] = {}
+        self._index: dict[tuple[str, str], int] = {}
+        self._promoted: set[tuple[str, str]] = set()
+        self._copy_on_write = copy_on_write
 
     def create_steps(
         self, run_id: str, steps: Sequence[Mapping[str, object]]
     ) -> Sequence[Mapping[str, object]]:
-        stored: List[MutableMapping[str, object]] = [dict(step) for step in steps]
+        stored = list(steps)
         self.steps[run_id] = stored
+        for position, step in enumerate(stored):
+            key = (run_id, str(step["id"]))
+            self._index[key] = position
+            self._promoted.discard(key)
         return stored
 
     def list_steps(self, run_id: str) -> Sequence[Mapping[str, object]]:
-        return [dict(step) for step in self.steps.get(run_id, [])]
+        stored = self.steps.get(run_id, [])
+        if not self._copy_on_write:
+            return stored
+        return [dict(step) for step in stored]
 
     def update_step_state(self, run_id: str, step_id: str, state: StepState) -> None:
-        for step in self.steps.get(run_id, []):
-            if str(step["id"]) == step_id:
-                step["state"] = state.value
-                break
+        step = self._writable(run_id, step_id)
+        if step is not None:
+            step["state"] = state.value
 
     def update_step_metadata(
         self,
@@ -139,21 +182,52 @@ class StepRepoFake(StepRepo):
         work_order: Mapping[str, object] | None = None,
         coder_result: Mapping[str, object] | None = None,
     ) -> None:
-        for step in self.steps.get(run_id, []):
-            if str(step["id"]) != step_id:
-                continue
-            if plan is not None:
-                step["plan"] = dict(plan)
-            if work_order is not None:
-                step["work_order"] = dict(work_order)
-            if coder_result is not None:
-                step["coder_result"] = dict(coder_result)
-            break
+        step = self._writable(run_id, step_id)
+        if step is None:
+            return
+        if plan is not None:
+            step["plan"] = dict(plan)
+        if work_order is not None:
+            step["work_order"] = dict(work_order)
+        if coder_result is not None:
+            step["coder_result"] = dict(coder_result)
+
+    def _writable(self, run_id: str, step_id: str) -> MutableMapping[str, object] | None:
+        key = (run_id, step_id)
+        position = self._index.get(key)
+        if position is None:
+            return None
+        stored = self.steps[run_id]
+        if self._copy_on_write and key not in self._promoted:
+            stored[position] = dict(stored[position])
+            self._promoted.add(key)
+        return stored[position]  # type: ignore[return-value]
+
+
+@dataclass(slots=True)
+class _Artifact:
+    run_id: str
+    step_id: str
+    kind: str
+    content: str
+    meta: Mapping[str, object]
+
+
+@dataclass(slots=True)
+class _Report:
+    run_id: str
+    step_id: str
+    report: Mapping[str, object]
+
+
+_EMPTY_META: Mapping[str, object] = MappingProxyType({})
 
 
 class ArtifactRepoFake(ArtifactRepo):
+    """Records artifacts as-is; callers must not mutate ``meta`` after adding."""
+
     def __init__(self) -> None:
-        self.artifacts: list[Mapping[str, object]] = []
+        self.artifacts: deque[_Artifact] = deque()
 
     def add(
         self,
@@ -164,20 +238,17 @@ class ArtifactRepoFake(ArtifactRepo):
         content: str,
         meta: Mapping[str, object] | None = None,
     ) -> None:
-        self.artifacts.append(
-            {
-                "run_id": run_id,
-                "step_id": step_id,
-                "kind": kind,
-                "content": content,
-                "meta": dict(meta or {}),
-            }
-        )
+        self.artifacts.append(_Artifact(run_id, step_id, kind, content, meta or _EMPTY_META))
+
+    def add_many(self, items: Sequence[_Artifact]) -> None:
+        self.artifacts.extend(items)
 
 
 class ValidationReportRepoFake(ValidationReportRepo):
+    """Records reports as-is; callers must not mutate ``report`` after adding."""
+
     def __init__(self) -> None:
-        self.reports: list[Mapping[str, object]] = []
+        self.reports: deque[_Report] = deque()
 
     def add(
         self,
@@ -186,7 +257,10 @@ class ValidationReportRepoFake(ValidationReportRepo):
         step_id: str,
         report: Mapping[str, object],
     ) -> None:
-        self.reports.append({"run_id": run_id, "step_id": step_id, "report": dict(report)})
+        self.reports.append(_Report(run_id, step_id, report))
+
+    def add_many(self, items: Sequence[_Report]) -> None:
+        self.reports.extend(items)
 
 
 class PRRepoFake(PRBindingRepo):
@@ -208,34 +282,25 @@ class PlannerFake(PlannerAdapter):
 class SubPlannerFake(SubPlannerAdapter):
     def build_work_order(self, step: Mapping[str, object]) -> FakeWorkOrder:
         return FakeWorkOrder(
-            work_order_id=str(uuid4()),
+            work_order_id=_fake_id(),
             title=str(step.get("title", "")),
             objective=str(step.get("body", "")),
-            constraints=["return unified diff"],
-            acceptance_criteria=[],
-            context_files=[],
-            dependencies=[],
+            constraints=("return unified diff",),
+            acceptance_criteria=(),
+            context_files=(),
+            dependencies=(),
             return_format="unified-diff",
         )
 
 
 class CoderFake(CoderAdapter):
     def execute(self, work_order: FakeWorkOrder) -> FakeCoderResult:
-        diff = "\n".join(
-            [
-                "diff --git a/file.txt b/file.txt",
-                "--- a/file.txt",
-                "+++ b/file.txt",
-                "@@",
-                "+hello",
-            ]
-        )
-        return FakeCoderResult(work_order_id=work_order.work_order_id, diff=diff, notes="did work")
+        return FakeCoderResult(work_order_id=work_order.work_order_id, diff=_FAKE_DIFF, notes="did work")
 
 
 class ValidatorFake(ValidatorService):
     def validate(self, diff: str, base_ref: str, feature_ref: str) -> FakeValidationReport:
-        return FakeValidationReport(step_id=str(uuid4()), fatal=[], warnings=[], metrics={})
+        return FakeValidationReport(step_id=_fake_id(), fatal=[], warnings=[], metrics={})
 
 
 class GitHubClientFake(GitHubClient):
@@ -334,22 +399,21 @@ def test_orchestrator_advances_step(orchestrator_components: Mapping[str, object
     assert run_repo.runs[run_id]["state"] == RunState.COMPLETED
 
     stored_step = step_repo.steps[run_id][0]
-    assert stored_step["state"] in {StepState.PR_UPDATED.value, StepState.MERGED.value}
+    assert stored_step["state"] in _TERMINAL_STEP_STATES
     assert "work_order" in stored_step
     assert "coder_result" in stored_step
 
-    kinds = {artifact["kind"] for artifact in artifact_repo.artifacts}
-    assert kinds == {"diff", "doc"}
+    kinds = {artifact.kind for artifact in artifact_repo.artifacts}
+    assert kinds == _EXPECTED_KINDS
 
     assert len(report_repo.reports) == 1
     assert pr_repo.binding is not None
     assert github.ensure_calls
     assert github.pr_calls
 
-    event_types = [type(event) for event in events.events]
-    assert event_types.count(RunStatusChanged) == 2
-    assert any(isinstance(event, StepPlanned) for event in events.events)
-    assert any(isinstance(event, StepExecuting) for event in events.events)
-    assert any(isinstance(event, StepValidated) for event in events.events)
-    committed_events = [event for event in events.events if isinstance(event, StepCommitted)]
-    assert len(committed_events) >= 1
+    counts = Counter(type(event) for event in events.events)
+    assert counts[RunStatusChanged] == 2
+    assert counts[StepPlanned] >= 1
+    assert counts[StepExecuting] >= 1
+    assert counts[StepValidated] >= 1
+    assert counts[StepCommitted] >= 1
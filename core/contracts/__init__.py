@@ -5,7 +5,7 @@ from .coder_result import CoderResult
 from .events import StepStatusPayload
 from .mapping import ALIASES, STEP_TO_OUTPUT, normalize_step_type
 from .registry import ContractRegistry, register_contract, registry
-from .transforms import DEFAULT_TRANSFORMS, Transform, apply_transforms
+from .transforms import DEFAULT_TRANSFORMS, Transform, apply_transforms, compile_transforms
 from .validation_report import Issue, ValidationReport
 from .version import DEFAULT_VERSION, SCHEMA_NS
 from .work_order import WorkOrder
@@ -26,6 +26,7 @@ __all__ = [
     "ValidationReport",
     "WorkOrder",
     "apply_transforms",
+    "compile_transforms",
     "normalize_step_type",
     "register_contract",
     "registry",
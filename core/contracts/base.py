@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
+import copy
 import json
-from typing import Any, ClassVar, Dict
+from typing import Any, ClassVar, Dict, Tuple, TypeVar
 
 from pydantic import BaseModel, ConfigDict, Field
 
 from .version import DEFAULT_VERSION, SCHEMA_NS
 
+ContractT = TypeVar("ContractT", bound="BaseContract")
+
 
 class ModelVersion:
     """Helpers for contract schema identifiers."""
@@ -31,7 +34,22 @@ class BaseContract(BaseModel):
     __contract_name__: ClassVar[str | None] = None
     __contract_version__: ClassVar[str] = DEFAULT_VERSION
 
+    # Derived from the two attributes above; refreshed when they change.
+    _cached_schema_id: ClassVar[str] = ""
+
+    # Generated schemas keyed by (class, generation arguments); shared by all
+    # subclasses and invalidated when a contract is (re-)registered.
+    _schema_cache: ClassVar[Dict[Tuple[Any, ...], Dict[str, Any]]] = {}
+    _schema_json_cache: ClassVar[Dict[type, str]] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._refresh_schema_id()
+
     def model_post_init(self, __context: Any) -> None:
+        # Registered contracts carry both values as field defaults already.
+        if self.schema_version and self.schema_id:
+            return
         schema_version = self.schema_version or self.contract_version()
         schema_id = self.schema_id or self.default_schema_id()
         object.__setattr__(self, "schema_version", schema_version)
@@ -54,7 +72,39 @@ class BaseContract(BaseModel):
     def default_schema_id(cls) -> str:
         """Return the default schema identifier for the contract."""
 
-        return ModelVersion.make_schema_id(cls.contract_name(), cls.contract_version())
+        return cls._cached_schema_id
+
+    @classmethod
+    def _refresh_schema_id(cls) -> None:
+        cls._cached_schema_id = ModelVersion.make_schema_id(
+            cls.__contract_name__ or cls.__name__,
+            cls.__contract_version__ or DEFAULT_VERSION,
+        )
+
+    @classmethod
+    def apply_schema_defaults(cls) -> None:
+        """Bake the contract's schema version and id into its field defaults."""
+
+        cls._refresh_schema_id()
+        defaults = {
+            "schema_version": cls.contract_version(),
+            "schema_id": cls.default_schema_id(),
+        }
+        for field_name, default in defaults.items():
+            field = copy.copy(cls.__pydantic_fields__[field_name])
+            field.default = default
+            cls.__pydantic_fields__[field_name] = field
+        cls.model_rebuild(force=True)
+
+    @classmethod
+    def trusted_build(cls: type[ContractT], **data: Any) -> ContractT:
+        """Build an instance from already-typed values, skipping validation.
+
+        Only for internal producers that guarantee the field types; schema
+        identifiers are still stamped via ``model_post_init``.
+        """
+
+        return cls.model_construct(**data)
 
     def to_dict(self) -> Dict[str, Any]:
         """Serialize the model to a Python dictionary."""
@@ -68,15 +118,37 @@ class BaseContract(BaseModel):
 
     @classmethod
     def model_json_schema(cls, *args: Any, **kwargs: Any) -> Dict[str, Any]:
-        """Return the JSON schema for the model with an injected identifier."""
+        """Return the JSON schema for the model with an injected identifier.
+
+        Schemas are generated once per class and arguments; callers receive a
+        copy they are free to mutate.
+        """
 
-        schema = super().model_json_schema(*args, **kwargs)
-        schema.setdefault("$id", cls.default_schema_id())
-        return schema
+        key = (cls, args, tuple(sorted(kwargs.items())))
+        schema = BaseContract._schema_cache.get(key)
+        if schema is None:
+            schema = super().model_json_schema(*args, **kwargs)
+            schema.setdefault("$id", cls.default_schema_id())
+            BaseContract._schema_cache[key] = schema
+        return copy.deepcopy(schema)
 
     @classmethod
     def schema_json(cls) -> str:
         """Return the JSON schema for the model."""
 
-        return json.dumps(cls.model_json_schema(), sort_keys=True)
+        cached = BaseContract._schema_json_cache.get(cls)
+        if cached is None:
+            cached = json.dumps(cls.model_json_schema(), sort_keys=True)
+            BaseContract._schema_json_cache[cls] = cached
+        return cached
+
+    @classmethod
+    def clear_schema_cache(cls) -> None:
+        """Drop cached schemas for this class, e.g. after its identity changes."""
+
+        for key in [key for key in BaseContract._schema_cache if key[0] is cls]:
+            del BaseContract._schema_cache[key]
+        BaseContract._schema_json_cache.pop(cls, None)
+
 
+BaseContract._refresh_schema_id()
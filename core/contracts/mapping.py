@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-STEP_TO_OUTPUT = {
+from types import MappingProxyType
+
+STEP_TO_OUTPUT = MappingProxyType({
     "code_generation": "file_patch",
     "code_refactor": "file_patch",
     "code_fix": "file_patch",
@@ -19,9 +21,9 @@ STEP_TO_OUTPUT = {
     "memory_lookup": "context",
     "context_fetch": "context",
     "symbol_lookup": "context",
-}
+})
 
-ALIASES = {
+ALIASES = MappingProxyType({
     "gen_code": "code_generation",
     "refactor_code": "code_refactor",
     "fix_code": "code_fix",
@@ -36,12 +38,13 @@ ALIASES = {
     "lookup_memory": "memory_lookup",
     "fetch_context": "context_fetch",
     "lookup_symbol": "symbol_lookup",
-}
+})
+
+_ALIAS_GET = ALIASES.get
 
 
 def normalize_step_type(step_type: str) -> str:
     """Return the canonical step type for the provided identifier."""
 
-    canonical = ALIASES.get(step_type, step_type)
-    return canonical
+    return _ALIAS_GET(step_type, step_type)
 
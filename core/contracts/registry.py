@@ -10,6 +10,9 @@ from .version import DEFAULT_VERSION
 
 ContractT = TypeVar("ContractT", bound=BaseContract)
 
+# Upper bound on memoized (name_or_alias, version) resolutions per registry.
+_RESOLVED_MAX = 256
+
 
 class ContractRegistry:
     """In-memory registry for contract models."""
@@ -18,6 +21,7 @@ class ContractRegistry:
         self._contracts: Dict[Tuple[str, str], Type[BaseContract]] = {}
         self._default_versions: Dict[str, str] = {}
         self._aliases: Dict[str, Tuple[str, str]] = {}
+        self._resolved: Dict[Tuple[str, str | None], Tuple[str, str]] = {}
 
     def register(
         self,
@@ -32,6 +36,8 @@ class ContractRegistry:
         contract_name = name or model_cls.contract_name()
         model_cls.__contract_name__ = contract_name
         model_cls.__contract_version__ = version
+        model_cls.apply_schema_defaults()
+        model_cls.clear_schema_cache()
 
         key = (contract_name, version)
         if key in self._contracts and self._contracts[key] is not model_cls:
@@ -44,16 +50,22 @@ class ContractRegistry:
             self._aliases[alias] = key
 
         self._aliases.setdefault(contract_name, key)
+        self._resolved.clear()
         return model_cls
 
     def get(self, name_or_alias: str, version: str | None = None) -> Type[BaseContract]:
         """Retrieve a registered contract by name or alias."""
 
-        key = self._resolve_key(name_or_alias, version)
-        try:
-            return self._contracts[key]
-        except KeyError as exc:  # pragma: no cover - defensive
-            raise KeyError(f"Unknown contract: {name_or_alias} (v{key[1]})") from exc
+        key = self._resolved.get((name_or_alias, version))
+        if key is None:
+            key = self._resolve_key(name_or_alias, version)
+            if len(self._resolved) >= _RESOLVED_MAX:
+                self._resolved.clear()
+            self._resolved[(name_or_alias, version)] = key
+        model_cls = self._contracts.get(key)
+        if model_cls is None:
+            raise KeyError(f"Unknown contract: {name_or_alias} (v{key[1]})")
+        return model_cls
 
     def items(self) -> Sequence[Tuple[Tuple[str, str], Type[BaseContract]]]:
         """Return the registered contract mappings."""
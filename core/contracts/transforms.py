@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, Iterable, List, Literal, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Literal, Tuple
 
 
 TransformType = Literal[
@@ -28,72 +28,131 @@ class Transform:
     max_len: int | None = None
 
 
+_Step = Callable[[Dict[str, Any], List[Dict[str, Any]]], None]
+CompiledTransforms = Callable[[Dict[str, Any]], Tuple[Dict[str, Any], List[Dict[str, Any]]]]
+
+
+def _compile_rename(from_field: str, to_field: str) -> _Step:
+    def step(transformed: Dict[str, Any], log: List[Dict[str, Any]]) -> None:
+        if from_field not in transformed:
+            return
+        value = transformed.pop(from_field)
+        if to_field not in transformed:
+            transformed[to_field] = value
+            log.append({"rule": "rename_field", "from": from_field, "to": to_field})
+
+    return step
+
+
+def _compile_coerce(field: str, target_type: type) -> _Step:
+    type_name = target_type.__name__
+
+    def step(transformed: Dict[str, Any], log: List[Dict[str, Any]]) -> None:
+        if field not in transformed:
+            return
+        try:
+            transformed[field] = target_type(transformed[field])
+            log.append({"rule": "coerce_type", "field": field, "type": type_name})
+        except (TypeError, ValueError):
+            log.append({"rule": "coerce_type", "field": field, "type": type_name, "error": "conversion_failed"})
+
+    return step
+
+
+def _compile_default(field: str, default: Any) -> _Step:
+    def step(transformed: Dict[str, Any], log: List[Dict[str, Any]]) -> None:
+        if field in transformed:
+            return
+        transformed[field] = default
+        log.append({"rule": "default_if_missing", "field": field, "value": default})
+
+    return step
+
+
+def _compile_strip(field: str) -> _Step:
+    def step(transformed: Dict[str, Any], log: List[Dict[str, Any]]) -> None:
+        value = transformed.get(field)
+        if isinstance(value, str):
+            stripped = value.strip()
+            if stripped != value:
+                transformed[field] = stripped
+                log.append({"rule": "strip_whitespace", "field": field})
+
+    return step
+
+
+def _compile_clamp(field: str, max_len: int) -> _Step:
+    def step(transformed: Dict[str, Any], log: List[Dict[str, Any]]) -> None:
+        value = transformed.get(field)
+        if isinstance(value, list) and len(value) > max_len:
+            transformed[field] = value[:max_len]
+            log.append({"rule": "clamp_list_len", "field": field, "max_len": max_len})
+
+    return step
+
+
+def _compile_rule(rule: Transform) -> _Step | None:
+    """Return the step implementing ``rule``, or None when it can never apply."""
+
+    if rule.type == "rename_field":
+        if rule.from_field and rule.to_field:
+            return _compile_rename(rule.from_field, rule.to_field)
+    elif rule.type == "coerce_type":
+        if rule.field and rule.target_type is not None:
+            return _compile_coerce(rule.field, rule.target_type)
+    elif rule.type == "default_if_missing":
+        if rule.field:
+            return _compile_default(rule.field, rule.default)
+    elif rule.type == "strip_whitespace":
+        if rule.field:
+            return _compile_strip(rule.field)
+    elif rule.type == "clamp_list_len":
+        if rule.field and rule.max_len is not None:
+            return _compile_clamp(rule.field, rule.max_len)
+    return None
+
+
+def compile_transforms(rules: Iterable[Transform]) -> CompiledTransforms:
+    """Resolve ``rules`` once into a function that applies them to a payload."""
+
+    steps = tuple(step for step in map(_compile_rule, rules) if step is not None)
+
+    def run(payload: Dict[str, Any]) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        transformed = dict(payload)
+        log: List[Dict[str, Any]] = []
+        for step in steps:
+            step(transformed, log)
+        return transformed, log
+
+    return run
+
+
+# Precompiled pipelines for the immutable rule tuples in DEFAULT_TRANSFORMS,
+# keyed by identity; the stored tuple keeps the id from being reused.
+_COMPILED: Dict[int, Tuple[Tuple[Transform, ...], CompiledTransforms]] = {}
+
+
 def apply_transforms(payload: Dict[str, Any], rules: Iterable[Transform]) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
     """Apply normalization transforms to a payload dictionary."""
 
-    transformed = dict(payload)
-    log: List[Dict[str, Any]] = []
-
-    for rule in rules:
-        if rule.type == "rename_field":
-            from_field = rule.from_field
-            to_field = rule.to_field
-            if not from_field or not to_field or from_field not in transformed:
-                continue
-            value = transformed.pop(from_field)
-            if to_field not in transformed:
-                transformed[to_field] = value
-                log.append({"rule": "rename_field", "from": from_field, "to": to_field})
-            else:
-                transformed[to_field] = transformed[to_field]
-        elif rule.type == "coerce_type":
-            field = rule.field
-            target_type = rule.target_type
-            if not field or target_type is None or field not in transformed:
-                continue
-            value = transformed[field]
-            try:
-                transformed[field] = target_type(value)
-                log.append({"rule": "coerce_type", "field": field, "type": target_type.__name__})
-            except (TypeError, ValueError):
-                log.append({"rule": "coerce_type", "field": field, "type": target_type.__name__, "error": "conversion_failed"})
-        elif rule.type == "default_if_missing":
-            field = rule.field
-            if not field or field in transformed:
-                continue
-            transformed[field] = rule.default
-            log.append({"rule": "default_if_missing", "field": field, "value": rule.default})
-        elif rule.type == "strip_whitespace":
-            field = rule.field
-            if not field or field not in transformed:
-                continue
-            value = transformed[field]
-            if isinstance(value, str):
-                stripped = value.strip()
-                if stripped != value:
-                    transformed[field] = stripped
-                    log.append({"rule": "strip_whitespace", "field": field})
-        elif rule.type == "clamp_list_len":
-            field = rule.field
-            max_len = rule.max_len
-            if not field or max_len is None or field not in transformed:
-                continue
-            value = transformed[field]
-            if isinstance(value, list) and len(value) > max_len:
-                transformed[field] = value[:max_len]
-                log.append({"rule": "clamp_list_len", "field": field, "max_len": max_len})
-
-    return transformed, log
-
-
-DEFAULT_TRANSFORMS: Dict[str, List[Transform]] = {
-    "WorkOrder": [
+    entry = _COMPILED.get(id(rules))
+    if entry is not None and entry[0] is rules:
+        return entry[1](payload)
+    return compile_transforms(rules)(payload)
+
+
+DEFAULT_TRANSFORMS: Dict[str, Tuple[Transform, ...]] = {
+    "WorkOrder": (
         Transform(type="rename_field", from_field="depends_on", to_field="dependencies"),
         Transform(type="strip_whitespace", field="title"),
         Transform(type="strip_whitespace", field="objective"),
-    ],
-    "CoderResult": [],
-    "ValidationReport": [],
-    "StepStatusPayload": [],
+    ),
+    "CoderResult": (),
+    "ValidationReport": (),
+    "StepStatusPayload": (),
 }
 
+for _rules in DEFAULT_TRANSFORMS.values():
+    _COMPILED[id(_rules)] = (_rules, compile_transforms(_rules))
+del _rules
+
@@ -4,20 +4,82 @@ from __future__ import annotations
 
 import json
 import sys
+from collections import deque
 from dataclasses import dataclass
-from datetime import datetime
-from typing import IO, Iterable, List, Mapping, Sequence
+from operator import attrgetter
+from typing import IO, Any, Callable, Deque, Dict, Iterable, Iterator, List, Mapping, Sequence, TypeVar, overload
 
 from core.events.publisher import EventsPublisher
 from core.events.types import LifecycleEvent
 
+# Reused across publishes. Payloads are built in sorted key order, so the
+# encoder does not sort them again.
+_ENCODER = json.JSONEncoder()
+
+_T = TypeVar("_T")
+_EVENT_OF = attrgetter("event")
+
+# Free-list of cleared payload dicts shared by all publishers; only the
+# ``retain_payloads=False`` path recycles into it, since retained payloads are
+# still yielded by ``iter_payloads``. Deque append and pop are atomic, so no
+# lock is needed.
+_PAYLOAD_POOL_MAX = 64
+_PAYLOAD_POOL: Deque[Dict[str, object]] = deque(maxlen=_PAYLOAD_POOL_MAX)
+
+
+def _acquire_payload() -> Dict[str, object]:
+    try:
+        return _PAYLOAD_POOL.pop()
+    except IndexError:
+        return {}
+
+
+def _release_payload(payload: Dict[str, object]) -> None:
+    payload.clear()
+    _PAYLOAD_POOL.append(payload)
+
+
+class _ListView(Sequence[_T]):
+    """Read-only view over a live list, optionally projecting each item."""
+
+    __slots__ = ("_items", "_project")
+
+    def __init__(self, items: List[Any], project: Callable[[Any], _T] | None = None) -> None:
+        self._items = items
+        self._project = project
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    @overload
+    def __getitem__(self, index: int) -> _T: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[_T]: ...
+
+    def __getitem__(self, index: int | slice) -> _T | List[_T]:
+        project = self._project
+        if isinstance(index, slice):
+            items = self._items[index]
+            return items if project is None else [project(item) for item in items]
+        item = self._items[index]
+        return item if project is None else project(item)
+
+    def __iter__(self) -> Iterator[_T]:
+        if self._project is None:
+            return iter(self._items)
+        return map(self._project, self._items)
+
 
 @dataclass(frozen=True)
 class CapturedEvent:
-    """Wrapper combining the canonical event and its serialized payload."""
+    """Wrapper combining the canonical event and its serialized payload.
+
+    ``payload`` is None when the publisher does not retain payloads.
+    """
 
     event: LifecycleEvent
-    payload: Mapping[str, object]
+    payload: Mapping[str, object] | None
 
 
 class InMemoryEventsPublisher(EventsPublisher):
@@ -28,60 +90,151 @@ class InMemoryEventsPublisher(EventsPublisher):
     published event is appended to :attr:`events` and emitted as a single
     JSON line on ``stdout`` (or the provided stream) so that the CLI can
     replay the lifecycle transitions in order.
+
+    Lines are left in the stream's buffer and flushed every ``flush_every``
+    events, on :meth:`flush`/:meth:`close`, or on leaving a ``with`` block;
+    pass ``auto_flush=True`` to flush after every event instead.
+
+    With ``retain_payloads=False`` the payload dict used for printing is
+    recycled after each publish and :meth:`iter_payloads` rebuilds payloads
+    from the stored events on demand. ``emit=False`` skips the JSON line
+    entirely (payloads are then built only if :meth:`iter_payloads` asks for
+    them), and ``store=False`` keeps nothing but :attr:`published_count`.
     """
 
-    def __init__(self, stream: IO[str] | None = None) -> None:
+    def __init__(
+        self,
+        stream: IO[str] | None = None,
+        *,
+        flush_every: int = 64,
+        auto_flush: bool = False,
+        retain_payloads: bool = True,
+        store: bool = True,
+        emit: bool = True,
+    ) -> None:
         self._stream: IO[str] = stream or sys.stdout
         self._events: List[CapturedEvent] = []
+        self._flush_every = 1 if auto_flush else max(1, flush_every)
+        self._unflushed = 0
+        self._retain_payloads = retain_payloads
+        self._store = store
+        self._emit = emit
+        self._published = 0
+
+    def __enter__(self) -> InMemoryEventsPublisher:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
 
     @property
     def events(self) -> Sequence[CapturedEvent]:
-        """Expose the captured events for assertions and summaries."""
+        """Expose the captured events as a read-only view (not a snapshot)."""
 
-        return list(self._events)
+        return _ListView(self._events)
+
+    @property
+    def published_count(self) -> int:
+        """Number of events published, including ones that were not stored."""
+
+        return self._published
 
     def publish(self, event: LifecycleEvent) -> None:
         """Persist ``event`` and echo a JSON line for human consumption."""
 
-        payload = self._serialise_event(event)
-        self._events.append(CapturedEvent(event=event, payload=payload))
-        json_record = json.dumps(payload, sort_keys=True)
-        self._stream.write(json_record + "\n")
+        self._published += 1
+        if not self._emit:
+            if self._store:
+                self._events.append(CapturedEvent(event=event, payload=None))
+            return
+        if self._store and self._retain_payloads:
+            payload = self._serialise_event(event, {})
+            self._events.append(CapturedEvent(event=event, payload=payload))
+            self._write(payload)
+        else:
+            payload = self._serialise_event(event, _acquire_payload())
+            if self._store:
+                self._events.append(CapturedEvent(event=event, payload=None))
+            try:
+                self._write(payload)
+            finally:
+                _release_payload(payload)
+
+    def _write(self, payload: Mapping[str, object]) -> None:
+        self._stream.write(_ENCODER.encode(payload) + "\n")
+        self._unflushed += 1
+        if self._unflushed >= self._flush_every:
+            self.flush()
+
+    def flush(self) -> None:
+        """Flush any buffered event lines to the stream."""
+
         self._stream.flush()
+        self._unflushed = 0
+
+    def close(self) -> None:
+        """Flush pending output; the underlying stream is left open."""
+
+        self.flush()
 
     def list_events(self, run_id: str | None = None) -> Sequence[LifecycleEvent]:
-        """Return the published events filtered by ``run_id`` when provided."""
+        """Return the published events filtered by ``run_id`` when provided.
+
+        Without ``run_id`` this is a live read-only view; copy it with
+        ``list()`` to keep a snapshot.
+        """
 
         if run_id is None:
-            return [captured.event for captured in self._events]
+            return _ListView(self._events, _EVENT_OF)
         return [captured.event for captured in self._events if captured.event.run_id == run_id]
 
     def iter_payloads(self) -> Iterable[Mapping[str, object]]:
         """Yield the serialized payloads in the order they were published."""
 
         for captured in self._events:
-            yield captured.payload
-
-    def _serialise_event(self, event: LifecycleEvent) -> Mapping[str, object]:
-        """Serialise ``event`` into a deterministic mapping for printing."""
-
-        timestamp = event.timestamp if isinstance(event.timestamp, datetime) else datetime.fromisoformat(
-            str(event.timestamp)
-        )
-        payload: dict[str, object] = {
-            "ts": timestamp.isoformat(),
-            "level": "info",
-            "run_id": event.run_id,
-            "step_id": event.step_id,
-            "agent": "orchestrator",
-            "phase": event.state,
-            "message": event.event_type.value,
-        }
+            if captured.payload is None:
+                yield self._serialise_event(captured.event, {})
+            else:
+                yield captured.payload
+
+    def _serialise_event(
+        self, event: LifecycleEvent, payload: Dict[str, object]
+    ) -> Dict[str, object]:
+        """Serialise ``event`` into ``payload``, a deterministic mapping for printing.
+
+        Keys are inserted in sorted order (and mappings nested in ``meta``,
+        including inside lists, are rebuilt sorted), so the encoder does not
+        need ``sort_keys``.
+        """
+
+        payload["agent"] = "orchestrator"
         if event.duration_ms is not None:
             payload["duration_ms"] = event.duration_ms
+        payload["level"] = "info"
+        payload["message"] = event.event_type_value
         if event.meta is not None:
-            payload["meta"] = dict(event.meta)
+            payload["meta"] = _sorted_mapping(event.meta)
+        payload["phase"] = event.state
+        payload["run_id"] = event.run_id
+        payload["step_id"] = event.step_id
+        payload["ts"] = event.iso_timestamp
         return payload
 
 
+def _sorted_mapping(mapping: Mapping[str, object]) -> Dict[str, object]:
+    """Return ``mapping`` as a dict whose keys, at every level, are in sorted order."""
+
+    return {key: _sorted_value(value) for key, value in sorted(mapping.items())}
+
+
+def _sorted_value(value: object) -> object:
+    """Sort mapping keys inside ``value``, descending into lists and tuples."""
+
+    if isinstance(value, Mapping):
+        return _sorted_mapping(value)
+    if isinstance(value, (list, tuple)):
+        return [_sorted_value(item) for item in value]
+    return value
+
+
 __all__ = ["CapturedEvent", "InMemoryEventsPublisher"]
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from typing import Mapping
@@ -20,7 +20,7 @@ class LifecycleEventType(str, Enum):
     RUN_STATUS_CHANGED = "run.status_changed"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LifecycleEvent:
     """Base payload emitted by the orchestrator when lifecycle milestones occur."""
 
@@ -31,6 +31,16 @@ class LifecycleEvent:
     step_id: str | None = None
     duration_ms: int | None = None
     meta: Mapping[str, object] | None = None
+    iso_timestamp: str = field(init=False, repr=False, compare=False)
+    event_type_value: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Events are immutable, so the serialised forms are computed once here.
+        timestamp = self.timestamp
+        if not isinstance(timestamp, datetime):
+            timestamp = datetime.fromisoformat(str(timestamp))
+        object.__setattr__(self, "iso_timestamp", timestamp.isoformat())
+        object.__setattr__(self, "event_type_value", self.event_type.value)
 
     @property
     def type(self) -> LifecycleEventType:
@@ -45,8 +55,8 @@ class LifecycleEvent:
             "run_id": self.run_id,
             "step_id": self.step_id,
             "state": self.state,
-            "timestamp": self.timestamp.isoformat(),
-            "event_type": self.event_type.value,
+            "timestamp": self.iso_timestamp,
+            "event_type": self.event_type_value,
         }
         if self.duration_ms is not None:
             payload["duration_ms"] = self.duration_ms
@@ -55,49 +65,49 @@ class LifecycleEvent:
         return payload
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StepPlanned(LifecycleEvent):
     """Event emitted when the orchestrator plans a step."""
 
     event_type: LifecycleEventType = LifecycleEventType.STEP_PLANNED
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StepExecuting(LifecycleEvent):
     """Event emitted when the orchestrator marks a step as executing."""
 
     event_type: LifecycleEventType = LifecycleEventType.STEP_EXECUTING
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StepValidated(LifecycleEvent):
     """Event emitted when the orchestrator validates a step outcome."""
 
     event_type: LifecycleEventType = LifecycleEventType.STEP_VALIDATED
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StepCommitted(LifecycleEvent):
     """Event emitted when the orchestrator commits a step result."""
 
     event_type: LifecycleEventType = LifecycleEventType.STEP_COMMITTED
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StepPaused(LifecycleEvent):
     """Event emitted when the orchestrator pauses a step."""
 
     event_type: LifecycleEventType = LifecycleEventType.STEP_PAUSED
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StepFailed(LifecycleEvent):
     """Event emitted when the orchestrator marks a step as failed."""
 
     event_type: LifecycleEventType = LifecycleEventType.STEP_FAILED
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RunStatusChanged(LifecycleEvent):
     """Event emitted when the overall run state changes."""
 
@@ -2,14 +2,52 @@
 
 from __future__ import annotations
 
+from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from functools import partial
 from itertools import count
-from typing import Collection, Dict, Iterable, List, Mapping, MutableMapping, Sequence
+from types import MappingProxyType
+from typing import Callable, DefaultDict, Dict, Iterable, Iterator, List, Mapping, MutableMapping, Sequence, Sized
 
 from backend.agents.orchestrator.orchestrator_state import RunState, StepState
 from core.store.repositories import ArtifactRepo, PRBindingRepo, RunRepo, StepRepo, ValidationReportRepo
 
+Clock = Callable[[], datetime]
+
+
+_EMPTY: Mapping[str, object] = MappingProxyType({})
+
+
+# Bound once so the per-record hot paths avoid repeated global/attribute lookups.
+_utcnow: Clock = partial(datetime.now, timezone.utc)
+_ARTIFACT_ID = "artifact-{:04d}".format
+_REPORT_ID = "report-{:04d}".format
+
+
+def _as_str(value: object) -> str:
+    """Return ``value`` unchanged when it is already a string, else ``str(value)``."""
+
+    return value if type(value) is str else str(value)  # type: ignore[return-value]
+
+
+def _materialise(candidate: object | None) -> object | None:
+    """Return unsized iterables such as generators as a tuple, else ``candidate``."""
+
+    if isinstance(candidate, Iterable) and not isinstance(candidate, (Sized, str, bytes)):
+        return tuple(candidate)
+    return candidate
+
+
+def _freeze(mapping: Mapping[str, object] | None) -> Mapping[str, object]:
+    """Return a read-only mapping, reusing ``mapping`` when it already is one."""
+
+    if mapping is None:
+        return _EMPTY
+    if isinstance(mapping, MappingProxyType):
+        return mapping
+    return MappingProxyType(dict(mapping))
+
 
 @dataclass
 class RunRecord:
@@ -26,7 +64,12 @@ class RunRecord:
     meta: MutableMapping[str, object] = field(default_factory=dict)
 
     def to_dict(self) -> Mapping[str, object]:
-        """Return a serialisable snapshot of the run."""
+        """Return the run as a mapping whose nested values are read-only proxies.
+
+        ``meta`` is a live view of the record's dict, not a copy. The proxies are
+        not stdlib-JSON-serialisable; convert them (e.g. with a ``default`` hook)
+        before encoding.
+        """
 
         return {
             "id": self.run_id,
@@ -34,10 +77,10 @@ class RunRecord:
             "base_ref": self.base_ref,
             "feature_ref": self.feature_ref,
             "status": self.status,
-            "config": dict(self.config),
+            "config": self.config,
             "created_at": self.created_at,
             "updated_at": self.updated_at,
-            "meta": dict(self.meta),
+            "meta": MappingProxyType(self.meta),
         }
 
 
@@ -53,12 +96,15 @@ class StepRecord:
     state: StepState
     created_at: datetime
     updated_at: datetime
-    plan: MutableMapping[str, object] | None = None
-    work_order: MutableMapping[str, object] | None = None
-    coder_result: MutableMapping[str, object] | None = None
+    plan: Mapping[str, object] | None = None
+    work_order: Mapping[str, object] | None = None
+    coder_result: Mapping[str, object] | None = None
 
     def to_dict(self) -> Mapping[str, object]:
-        """Return a mapping copy suitable for repository consumers."""
+        """Return the step as a mapping; nested mappings are read-only proxies.
+
+        The proxies are not stdlib-JSON-serialisable; convert them before encoding.
+        """
 
         payload: MutableMapping[str, object] = {
             "id": self.step_id,
@@ -70,11 +116,11 @@ class StepRecord:
             "updated_at": self.updated_at,
         }
         if self.plan is not None:
-            payload["plan"] = dict(self.plan)
+            payload["plan"] = self.plan
         if self.work_order is not None:
-            payload["work_order"] = dict(self.work_order)
+            payload["work_order"] = self.work_order
         if self.coder_result is not None:
-            payload["coder_result"] = dict(self.coder_result)
+            payload["coder_result"] = self.coder_result
         return payload
 
 
@@ -99,7 +145,7 @@ class ArtifactRecord:
             "step_id": self.step_id,
             "kind": self.kind,
             "content": self.content,
-            "meta": dict(self.meta),
+            "meta": self.meta,
             "created_at": self.created_at,
         }
 
@@ -117,13 +163,16 @@ class ValidationReportRecord:
     created_at: datetime
 
     def to_dict(self) -> Mapping[str, object]:
-        """Return a copy of the stored validation report."""
+        """Return the stored validation report; ``report`` is a read-only proxy.
+
+        The proxy is not stdlib-JSON-serialisable; convert it before encoding.
+        """
 
         return {
             "id": self.report_id,
             "run_id": self.run_id,
             "step_id": self.step_id,
-            "report": dict(self.report),
+            "report": self.report,
             "fatal_count": self.fatal_count,
             "warnings_count": self.warnings_count,
             "created_at": self.created_at,
@@ -133,7 +182,8 @@ class ValidationReportRecord:
 class InMemoryRunRepo(RunRepo):
     """In-memory implementation of :class:`RunRepo` for demos and tests."""
 
-    def __init__(self) -> None:
+    def __init__(self, *, clock: Clock = _utcnow) -> None:
+        self._clock = clock
         self._runs: Dict[str, RunRecord] = {}
         self._counter = count(1)
 
@@ -148,14 +198,14 @@ class InMemoryRunRepo(RunRepo):
     ) -> str:
         run_index = next(self._counter)
         run_id = f"run-{run_index:04d}"
-        now = datetime.now(timezone.utc)
+        now = self._clock()
         record = RunRecord(
             run_id=run_id,
             repo=repo,
             base_ref=base_ref,
             feature_ref=feature_ref,
             status=status,
-            config=dict(config or {}),
+            config=_freeze(config),
             created_at=now,
             updated_at=now,
         )
@@ -169,51 +219,58 @@ class InMemoryRunRepo(RunRepo):
     def update_run_state(self, run_id: str, state: RunState) -> None:
         record = self._runs[run_id]
         record.status = state
-        record.updated_at = datetime.now(timezone.utc)
+        record.updated_at = self._clock()
 
-    def list_runs(self) -> Sequence[Mapping[str, object]]:
-        """Return all stored runs for inspection."""
+    def iter_runs(self) -> Iterator[Mapping[str, object]]:
+        """Yield all stored runs for inspection."""
 
-        return [record.to_dict() for record in self._runs.values()]
+        for record in self._runs.values():
+            yield record.to_dict()
 
 
 class InMemoryStepRepo(StepRepo):
     """In-memory implementation of :class:`StepRepo`."""
 
-    def __init__(self) -> None:
+    def __init__(self, *, clock: Clock = _utcnow) -> None:
+        self._clock = clock
         self._steps: Dict[str, List[StepRecord]] = {}
+        self._step_index: Dict[tuple[str, str], StepRecord] = {}
 
     def create_steps(
         self, run_id: str, steps: Sequence[Mapping[str, object]]
     ) -> Sequence[Mapping[str, object]]:
-        now = datetime.now(timezone.utc)
+        now = self._clock()
         stored: List[StepRecord] = []
         for step in steps:
-            step_id = str(step.get("id"))
+            index = step.get("index", len(stored))
+            state = step.get("state", StepState.QUEUED)
             stored.append(
                 StepRecord(
                     run_id=run_id,
-                    step_id=step_id,
-                    index=int(step.get("index", len(stored))),
-                    title=str(step.get("title", "")),
-                    body=str(step.get("body", "")),
-                    state=StepState(step.get("state", StepState.QUEUED.value)),
+                    step_id=_as_str(step.get("id")),
+                    index=index if type(index) is int else int(index),  # type: ignore[arg-type]
+                    title=_as_str(step.get("title", "")),
+                    body=_as_str(step.get("body", "")),
+                    state=state if isinstance(state, StepState) else StepState(state),
                     created_at=now,
                     updated_at=now,
                 )
             )
+        for record in self._steps.get(run_id, ()):
+            self._step_index.pop((run_id, record.step_id), None)
         self._steps[run_id] = stored
+        for record in stored:
+            self._step_index[(run_id, record.step_id)] = record
         return [record.to_dict() for record in stored]
 
     def list_steps(self, run_id: str) -> Sequence[Mapping[str, object]]:
         return [record.to_dict() for record in self._steps.get(run_id, [])]
 
     def update_step_state(self, run_id: str, step_id: str, state: StepState) -> None:
-        for record in self._steps.get(run_id, []):
-            if record.step_id == step_id:
-                record.state = state
-                record.updated_at = datetime.now(timezone.utc)
-                break
+        record = self._step_index.get((run_id, step_id))
+        if record is not None:
+            record.state = state
+            record.updated_at = self._clock()
 
     def update_step_metadata(
         self,
@@ -224,17 +281,16 @@ class InMemoryStepRepo(StepRepo):
         work_order: Mapping[str, object] | None = None,
         coder_result: Mapping[str, object] | None = None,
     ) -> None:
-        for record in self._steps.get(run_id, []):
-            if record.step_id != step_id:
-                continue
-            if plan is not None:
-                record.plan = dict(plan)
-            if work_order is not None:
-                record.work_order = dict(work_order)
-            if coder_result is not None:
-                record.coder_result = dict(coder_result)
-            record.updated_at = datetime.now(timezone.utc)
-            break
+        record = self._step_index.get((run_id, step_id))
+        if record is None:
+            return
+        if plan is not None:
+            record.plan = _freeze(plan)
+        if work_order is not None:
+            record.work_order = _freeze(work_order)
+        if coder_result is not None:
+            record.coder_result = _freeze(coder_result)
+        record.updated_at = self._clock()
 
     def list_step_states(self, run_id: str) -> Iterable[StepState]:
         """Yield the current states for each step in ``run_id``."""
@@ -242,12 +298,20 @@ class InMemoryStepRepo(StepRepo):
         for record in self._steps.get(run_id, []):
             yield record.state
 
+    def iter_step_states(self, run_id: str) -> Iterator[tuple[str, StepState]]:
+        """Yield ``(step_id, state)`` pairs for ``run_id`` without building snapshots."""
+
+        for record in self._steps.get(run_id, []):
+            yield record.step_id, record.state
+
 
 class InMemoryArtifactRepo(ArtifactRepo):
     """In-memory implementation of :class:`ArtifactRepo`."""
 
-    def __init__(self) -> None:
+    def __init__(self, *, clock: Clock = _utcnow) -> None:
+        self._clock = clock
         self._artifacts: List[ArtifactRecord] = []
+        self._by_step: DefaultDict[str, List[ArtifactRecord]] = defaultdict(list)
         self._counter = count(1)
 
     def add(
@@ -259,22 +323,47 @@ class InMemoryArtifactRepo(ArtifactRepo):
         content: str,
         meta: Mapping[str, object] | None = None,
     ) -> None:
-        artifact_id = f"artifact-{next(self._counter):04d}"
+        self._append(run_id, step_id, kind, content, meta, self._clock())
+
+    def add_many(self, artifacts: Iterable[Mapping[str, object]]) -> None:
+        """Store several artifacts, given as ``add`` keyword mappings, with one timestamp."""
+
+        now = self._clock()
+        for artifact in artifacts:
+            self._append(
+                str(artifact["run_id"]),
+                str(artifact["step_id"]),
+                str(artifact["kind"]),
+                str(artifact["content"]),
+                artifact.get("meta"),  # type: ignore[arg-type]
+                now,
+            )
+
+    def _append(
+        self,
+        run_id: str,
+        step_id: str,
+        kind: str,
+        content: str,
+        meta: Mapping[str, object] | None,
+        created_at: datetime,
+    ) -> None:
         record = ArtifactRecord(
-            artifact_id=artifact_id,
+            artifact_id=_ARTIFACT_ID(next(self._counter)),
             run_id=run_id,
             step_id=step_id,
             kind=kind,
             content=content,
-            meta=dict(meta or {}),
-            created_at=datetime.now(timezone.utc),
+            meta=_freeze(meta),
+            created_at=created_at,
         )
         self._artifacts.append(record)
+        self._by_step[step_id].append(record)
 
     def list_artifacts(self, step_id: str) -> Sequence[Mapping[str, object]]:
         """Return artifacts associated with ``step_id``."""
 
-        return [record.to_dict() for record in self._artifacts if record.step_id == step_id]
+        return [record.to_dict() for record in self._by_step.get(step_id, ())]
 
     def all_artifacts(self) -> Sequence[Mapping[str, object]]:
         """Return all stored artifacts."""
@@ -285,8 +374,10 @@ class InMemoryArtifactRepo(ArtifactRepo):
 class InMemoryValidationReportRepo(ValidationReportRepo):
     """In-memory implementation of :class:`ValidationReportRepo`."""
 
-    def __init__(self) -> None:
+    def __init__(self, *, clock: Clock = _utcnow) -> None:
+        self._clock = clock
         self._reports: List[ValidationReportRecord] = []
+        self._by_run: DefaultDict[str, List[ValidationReportRecord]] = defaultdict(list)
         self._counter = count(1)
 
     def add(
@@ -296,41 +387,45 @@ class InMemoryValidationReportRepo(ValidationReportRepo):
         step_id: str,
         report: Mapping[str, object],
     ) -> None:
-        fatal = report.get("fatal")
-        warnings = report.get("warnings")
+        # Generators have no len(); materialise them once so the frozen report
+        # keeps the findings and the counts below are exact.
+        fatal = _materialise(report.get("fatal"))
+        warnings = _materialise(report.get("warnings"))
+        changed = {
+            key: value
+            for key, value in (("fatal", fatal), ("warnings", warnings))
+            if value is not report.get(key)
+        }
+        if changed:
+            report = {**report, **changed}
         fatal_count = self._safe_len(fatal)
         warnings_count = self._safe_len(warnings)
         record = ValidationReportRecord(
-            report_id=f"report-{next(self._counter):04d}",
+            report_id=_REPORT_ID(next(self._counter)),
             run_id=run_id,
             step_id=step_id,
-            report=dict(report),
+            report=_freeze(report),
             fatal_count=fatal_count,
             warnings_count=warnings_count,
-            created_at=datetime.now(timezone.utc),
+            created_at=self._clock(),
         )
         self._reports.append(record)
+        self._by_run[run_id].append(record)
 
     def list_reports(self, run_id: str | None = None) -> Sequence[Mapping[str, object]]:
         """Return stored reports, optionally filtered by ``run_id``."""
 
-        records = self._reports
-        if run_id is not None:
-            records = [record for record in records if record.run_id == run_id]
+        records = self._reports if run_id is None else self._by_run.get(run_id, ())
         return [record.to_dict() for record in records]
 
     @staticmethod
     def _safe_len(candidate: object | None) -> int:
         """Return ``len(candidate)`` when the value behaves like a collection."""
 
-        if candidate is None:
-            return 0
-        if isinstance(candidate, (str, bytes)):
+        if candidate is None or isinstance(candidate, (str, bytes)):
             return 0
-        if isinstance(candidate, Collection):
+        if isinstance(candidate, Sized):
             return len(candidate)
-        if isinstance(candidate, Iterable):
-            return sum(1 for _ in candidate)
         return 0
 
 
@@ -14,6 +14,8 @@ if str(REPO_ROOT) not in sys.path:
 from backend.agents.orchestrator.orchestrator_state import StepState
 from backend.agents.orchestrator.wiring_demo import DemoOrchestratorContext, build_demo_orchestrator
 
+_TERMINAL_STATES = frozenset({StepState.PR_UPDATED, StepState.MERGED})
+
 DEMO_STEPS: Sequence[dict[str, object]] = (
     {
         "title": "Add Settings route scaffold",
@@ -36,6 +38,7 @@ def main() -> int:
     run_id = orchestrator.start_run(repo="org/demo-repo", base_ref="main", steps=list(DEMO_STEPS))
 
     _drain_steps(context, run_id)
+    context.events.flush()
     _print_event_summary(context, run_id)
     _print_artifact_summary(context, run_id)
 
@@ -45,32 +48,30 @@ def main() -> int:
 def _drain_steps(context: DemoOrchestratorContext, run_id: str) -> None:
     """Advance steps sequentially until the run reaches a terminal state."""
 
-    while True:
-        step_records = context.step_repo.list_steps(run_id)
-        pending = [record for record in step_records if record.get("state") not in {StepState.PR_UPDATED.value, StepState.MERGED.value}]
-        if not pending:
-            break
-        orchestrator = context.orchestrator
-        orchestrator.advance_step(run_id)
+    step_repo = context.step_repo
+    while any(state not in _TERMINAL_STATES for _, state in step_repo.iter_step_states(run_id)):
+        context.orchestrator.advance_step(run_id)
 
 
 def _print_event_summary(context: DemoOrchestratorContext, run_id: str) -> None:
     """Print the lifecycle events emitted during the run."""
 
-    for event in context.events.list_events(run_id):
-        step_id = event.step_id or "-"
-        print(
-            f"{event.timestamp.isoformat()} run={event.run_id} step={step_id} "
-            f"state={event.state} event={event.event_type.value}"
-        )
+    lines = [
+        f"{event.iso_timestamp} run={event.run_id} step={event.step_id or '-'} "
+        f"state={event.state} event={event.event_type_value}\n"
+        for event in context.events.list_events(run_id)
+    ]
+    sys.stdout.write("".join(lines))
 
 
 def _print_artifact_summary(context: DemoOrchestratorContext, run_id: str) -> None:
     """Print a short artifact summary to highlight diff persistence."""
 
+    lines: list[str] = []
     for step in context.step_repo.list_steps(run_id):
         artifacts = context.artifact_repo.list_artifacts(str(step["id"]))
-        print(f"Artifacts for {step['id']}: {[artifact['kind'] for artifact in artifacts]}")
+        lines.append(f"Artifacts for {step['id']}: {[artifact['kind'] for artifact in artifacts]}\n")
+    sys.stdout.write("".join(lines))
 
 
 if __name__ == "__main__":
@@ -8,7 +8,7 @@ import sys
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any, Iterable, Mapping, Sequence
+from typing import Any, Iterable, Mapping
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 if str(REPO_ROOT) not in sys.path:
@@ -19,6 +19,10 @@ from backend.agents.orchestrator.orchestrator_state import StepState
 from backend.agents.orchestrator.wiring_demo import DemoOrchestratorContext, build_demo_orchestrator
 from scripts.demo_happy_path import DEMO_STEPS
 
+_TERMINAL_STATES: frozenset[StepState] = frozenset(
+    {StepState.MERGED, StepState.PR_UPDATED, StepState.FAILED}
+)
+
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Run the demo orchestrator and persist outputs to disk")
@@ -40,11 +44,12 @@ def main() -> int:
 
     run_id = orchestrator.start_run(repo=args.repo, base_ref=args.base_ref, steps=list(DEMO_STEPS))
     _drain_steps(context, run_id)
+    context.events.flush()
 
     export_dir = args.output
     export_dir.mkdir(parents=True, exist_ok=True)
 
-    _write_json(export_dir / "events.json", [payload for payload in context.events.iter_payloads()])
+    _write_json(export_dir / "events.json", context.events.iter_payloads())
     _write_json(export_dir / "run.json", context.run_repo.get_run(run_id))
     _write_json(export_dir / "steps.json", list(context.step_repo.list_steps(run_id)))
     _write_json(export_dir / "artifacts.json", list(context.artifact_repo.all_artifacts()))
@@ -57,28 +62,35 @@ def main() -> int:
 
 
 def _drain_steps(context: DemoOrchestratorContext, run_id: str) -> None:
-    while True:
-        step_records = list(context.step_repo.list_steps(run_id))
-        pending = [record for record in step_records if record.get("state") not in _terminal_states()]
-        if not pending:
-            break
+    step_repo = context.step_repo
+    while any(state not in _TERMINAL_STATES for _, state in step_repo.iter_step_states(run_id)):
         context.orchestrator.advance_step(run_id)
 
 
-def _terminal_states() -> frozenset[str]:
-    return frozenset({state.value for state in StepState if state in {StepState.MERGED, StepState.PR_UPDATED, StepState.FAILED}})
+def _write_json(path: Path, payload: Any) -> None:
+    """Encode ``payload`` straight into ``path`` without building the whole document.
 
+    Lists (and other non-mapping iterables, e.g. generators) are written one
+    element at a time, producing the same text as ``json.dumps(indent=2)``.
+    """
 
-def _write_json(path: Path, payload: Any) -> None:
-    data = _normalise(payload)
-    path.write_text(json.dumps(data, indent=2, sort_keys=True, default=_json_default), encoding="utf-8")
+    with path.open("w", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE) as handle:
+        if isinstance(payload, Mapping) or not _is_iterable(payload):
+            for chunk in _ENCODER.iterencode(payload):
+                handle.write(chunk)
+            return
 
+        separator = "[\n  "
+        for item in payload:
+            handle.write(separator)
+            for chunk in _ENCODER.iterencode(item):
+                handle.write(chunk.replace("\n", "\n  "))
+            separator = ",\n  "
+        handle.write("[]" if separator == "[\n  " else "\n]")
 
-def _normalise(payload: Any) -> Any:
-    if isinstance(payload, Sequence) and not isinstance(payload, (str, bytes, bytearray)):
-        return list(payload)
-    return payload
 
+def _is_iterable(payload: Any) -> bool:
+    return isinstance(payload, Iterable) and not isinstance(payload, (str, bytes, bytearray))
 
 
 def _json_default(value: Any) -> Any:
@@ -88,9 +100,14 @@ def _json_default(value: Any) -> Any:
         return value.value
     if isinstance(value, Path):
         return str(value)
+    if isinstance(value, Mapping):
+        return dict(value)
     return value
 
 
+_WRITE_BUFFER_SIZE = 1 << 20
+_ENCODER = json.JSONEncoder(indent=2, sort_keys=True, default=_json_default)
+
 
 def _export_diffs(export_dir: Path, artifacts: Iterable[Mapping[str, object]]) -> None:
     for artifact in artifacts:
@@ -2,9 +2,22 @@
 
 from __future__ import annotations
 
+import itertools
 import sys
+from collections.abc import Callable
 from pathlib import Path
+from uuid import UUID
+
+import pytest
 
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
+
+
+@pytest.fixture
+def fake_uuid() -> Callable[[], UUID]:
+    """Return a factory of cheap, distinct UUIDs for building test payloads."""
+
+    counter = itertools.count(1)
+    return lambda: UUID(int=next(counter))
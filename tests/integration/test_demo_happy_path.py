@@ -2,10 +2,40 @@
 
 from __future__ import annotations
 
-from backend.agents.orchestrator.orchestrator_state import StepState
-from backend.agents.orchestrator.wiring_demo import build_demo_orchestrator
+import sys
+from collections import Counter
+from operator import attrgetter
+
+from backend.agents.orchestrator.orchestrator_state import RunState, StepState
+from backend.agents.orchestrator.wiring_demo import DemoOrchestratorContext, build_demo_orchestrator
 from scripts.demo_happy_path import DEMO_STEPS
 
+_PR_UPDATED = sys.intern(StepState.PR_UPDATED.value)
+_MERGED = sys.intern(StepState.MERGED.value)
+_TERMINAL_STEP_STATES = frozenset({_PR_UPDATED, _MERGED})
+_TERMINAL_RUN_STATES = frozenset({RunState.COMPLETED.value, RunState.FAILED.value})
+_MAX_ADVANCES = 50
+_EVENT_TYPE = attrgetter("event_type.value")
+
+
+def _drain_until_terminal(context: DemoOrchestratorContext, run_id: str) -> None:
+    """Advance the run until its events report a terminal run status.
+
+    Only events published since the previous advance are inspected, so the
+    step repository is never polled while draining.
+    """
+
+    events = context.events.list_events()
+    cursor = 0
+    for _ in range(_MAX_ADVANCES):
+        new_events = events[cursor:]
+        cursor += len(new_events)
+        for event in new_events:
+            if event.run_id == run_id and event.step_id is None and event.state in _TERMINAL_RUN_STATES:
+                return
+        context.orchestrator.advance_step(run_id)
+    raise AssertionError(f"run {run_id} did not finish within {_MAX_ADVANCES} advances")
+
 
 def test_demo_happy_path_executes_full_lifecycle(monkeypatch) -> None:
     """Ensure the orchestrator with fakes runs both steps without pausing."""
@@ -16,31 +46,24 @@ def test_demo_happy_path_executes_full_lifecycle(monkeypatch) -> None:
         repo="org/demo-repo", base_ref="main", steps=list(DEMO_STEPS)
     )
 
-    terminal_states = {StepState.PR_UPDATED.value, StepState.MERGED.value}
-    while True:
-        step_records = context.step_repo.list_steps(run_id)
-        if all(record.get("state") in terminal_states for record in step_records):
-            break
-        context.orchestrator.advance_step(run_id)
+    _drain_until_terminal(context, run_id)
+    snapshot = context.snapshot(run_id)
+
+    assert snapshot.steps
+    assert all(step["state"] in _TERMINAL_STEP_STATES for step in snapshot.steps)
+
+    events = snapshot.events
+    assert events
+    assert _EVENT_TYPE(events[0]) == "run.status_changed"
+    assert _EVENT_TYPE(events[-1]) == "run.status_changed"
+    counts = Counter(map(_EVENT_TYPE, events))
+    assert counts["step.planned"] == 2
+    assert counts["step.executing"] == 2
+    assert counts["step.validated"] == 2
+    assert counts["step.committed"] >= 4
 
-    step_states = {record["id"]: record["state"] for record in context.step_repo.list_steps(run_id)}
-    assert step_states
-    assert all(state in terminal_states for state in step_states.values())
-
-    events = context.events.list_events(run_id)
-    event_types = [event.event_type.value for event in events]
-    assert event_types[:1] == ["run.status_changed"]
-    assert event_types.count("step.planned") == 2
-    assert event_types.count("step.executing") == 2
-    assert event_types.count("step.validated") == 2
-    committed_events = [event for event in events if event.event_type.value == "step.committed"]
-    assert len(committed_events) >= 4
-    assert event_types[-1] == "run.status_changed"
-
-    artifacts = context.artifact_repo.all_artifacts()
-    diff_artifacts = [artifact for artifact in artifacts if artifact["kind"] == "diff"]
+    diff_artifacts = [artifact for artifact in snapshot.artifacts if artifact["kind"] == "diff"]
     assert diff_artifacts, "expected diff artifact to be persisted"
 
-    reports = context.report_repo.list_reports(run_id)
-    assert reports
-    assert all(report["fatal_count"] == 0 for report in reports)
+    assert snapshot.reports
+    assert all(report["fatal_count"] == 0 for report in snapshot.reports)
@@ -3,11 +3,9 @@
 from __future__ import annotations
 
 import logging
-import sys
-from pathlib import Path
-from typing import Mapping
+from typing import Callable, Mapping
 
-sys.path.append(str(Path(__file__).resolve().parents[3]))
+import pytest
 
 from backend.agents.shared.base_agent import BaseAgent, StoreProtocol
 from core.events import NoOpEventsPublisher
@@ -48,17 +46,21 @@ class DummyAgent(BaseAgent):
         return {"executed": True, "context": context}
 
 
-def test_base_agent_runs_lifecycle() -> None:
-    stream = logging.StreamHandler()
+@pytest.fixture(scope="module")
+def dummy_agent_factory() -> Callable[[], DummyAgent]:
+    """Configure the agent logger once and hand out fresh agents per test."""
+
     logger = logging.getLogger("dummy-agent")
     logger.setLevel(logging.DEBUG)
-    logger.handlers = [stream]
+    logger.handlers = [logging.NullHandler()]
+    return lambda: DummyAgent(logger)
+
 
-    agent = DummyAgent(logger)
+def test_base_agent_runs_lifecycle(dummy_agent_factory: Callable[[], DummyAgent]) -> None:
+    agent = dummy_agent_factory()
     result = agent.run("run-1", "step-1")
 
     assert agent.prepare_called is True
     assert agent.context_built == {"run": "run-1", "step": "step-1"}
     assert result["executed"] is True
     assert agent.config["feature"] == "on"
-
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Sequence
+from uuid import UUID
+
+import pytest
+
+from backend.agents.validator.report_model import ValidationReport
+from backend.api import server
+
+
+@pytest.fixture
+def dispatched(monkeypatch: pytest.MonkeyPatch) -> list[tuple[Sequence[str], ...]]:
+    calls: list[tuple[Sequence[str], ...]] = []
+
+    async def _fake_run_all(
+        step_id: UUID, python_paths: Sequence[str], js_paths: Sequence[str]
+    ) -> ValidationReport:
+        calls.append((python_paths, js_paths))
+        return ValidationReport(step_id=step_id)
+
+    monkeypatch.setattr(server, "run_all_validators_async", _fake_run_all)
+    return calls
+
+
+def test_handle_validate_passes_repo_relative_paths(
+    dispatched: list[tuple[Sequence[str], ...]],
+) -> None:
+    asyncio.run(
+        server.handle_validate(
+            {"python_paths": ["backend/foo.py"], "js_paths": ["web/app.tsx"]}
+        )
+    )
+
+    assert dispatched == [(["backend/foo.py"], ["web/app.tsx"])]
+
+
+@pytest.mark.parametrize(
+    "python_paths",
+    [
+        "backend/foo.py",
+        [3],
+        ["--config=evil.toml"],
+        ["/etc/passwd"],
+        ["../outside.py"],
+        ["backend/../../outside.py"],
+    ],
+)
+def test_handle_validate_rejects_unsafe_paths(
+    dispatched: list[tuple[Sequence[str], ...]], python_paths: object
+) -> None:
+    with pytest.raises(ValueError):
+        asyncio.run(server.handle_validate({"python_paths": python_paths}))
+
+    assert dispatched == []
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
-from uuid import uuid4
+from collections.abc import Callable
+from uuid import UUID
+
+import pytest
 
 from backend.agents.coder import diff_utils
 from backend.agents.coder.coder_adapter import BaseCoderAdapter
@@ -14,9 +17,9 @@ class DummyCoder(BaseCoderAdapter):
     pass
 
 
-def _make_work_order() -> WorkOrder:
+def _make_work_order(fake_uuid: Callable[[], UUID]) -> WorkOrder:
     return WorkOrder(
-        work_order_id=uuid4(),
+        work_order_id=fake_uuid(),
         title="Add login",
         objective="Implement POST /login",
         constraints=["Focus on auth handler", "Do not add or modify dependencies."],
@@ -27,8 +30,10 @@ def _make_work_order() -> WorkOrder:
     )
 
 
-def test_coder_prompt_contains_constraints_and_criteria() -> None:
-    work_order = _make_work_order()
+def test_coder_prompt_contains_constraints_and_criteria(
+    fake_uuid: Callable[[], UUID],
+) -> None:
+    work_order = _make_work_order(fake_uuid)
     prompt_one = build_coder_prompt(work_order)
     prompt_two = DummyCoder().build_coder_prompt(work_order)
     assert prompt_one == prompt_two
@@ -45,6 +50,16 @@ def test_is_unified_diff_and_summary() -> None:
     assert summary == {"changed_files": 1, "additions": 2, "deletions": 1}
 
 
+@pytest.mark.parametrize("n_hunks", [1, 100, 10000])
+def test_summarize_unified_diff_scales_with_hunks(n_hunks: int) -> None:
+    header = "diff --git a/app.py b/app.py\n--- a/app.py\n+++ b/app.py\n@@ -1 +1 @@\n"
+    diff_text = header + "\n".join(f"+add{i}\n-del{i}" for i in range(n_hunks))
+
+    summary = diff_utils.summarize_unified_diff(diff_text)
+
+    assert summary == {"changed_files": 1, "additions": n_hunks, "deletions": n_hunks}
+
+
 def test_find_new_files_detects_created_paths() -> None:
     diff_text = """diff --git a/dev/null b/docs/new.md\nnew file mode 100644\nindex 0000000..1111111\n--- /dev/null\n+++ b/docs/new.md\n@@ -0,0 +1,2 @@\n+hello\n+world\n"""
     assert diff_utils.is_unified_diff(diff_text)
@@ -0,0 +1,20 @@
+"""Tests for step type mapping tables."""
+
+from __future__ import annotations
+
+import pytest
+
+from core.contracts import ALIASES, STEP_TO_OUTPUT, normalize_step_type
+
+
+def test_normalize_step_type_resolves_aliases_and_passes_through() -> None:
+    assert normalize_step_type("gen_code") == "code_generation"
+    assert normalize_step_type("code_generation") == "code_generation"
+    assert normalize_step_type("unknown") == "unknown"
+
+
+def test_mapping_tables_are_read_only() -> None:
+    with pytest.raises(TypeError):
+        ALIASES["new"] = "code_generation"  # type: ignore[index]
+    with pytest.raises(TypeError):
+        STEP_TO_OUTPUT["new"] = "file_patch"  # type: ignore[index]
@@ -12,16 +12,18 @@ from core.contracts import Issue, ValidationReport, WorkOrder
 from core.contracts.version import DEFAULT_VERSION, SCHEMA_NS
 
 
+_WO_STATIC = (
+    ("title", "  Build feature  "),
+    ("objective", "  Ship clean diff  "),
+    ("constraints", ("no deps",)),
+    ("acceptance_criteria", ("tests pass",)),
+    ("context_files", ("README.md",)),
+    ("return_format", "unified-diff"),
+)
+
+
 def _work_order_payload() -> dict:
-    return {
-        "work_order_id": uuid4(),
-        "title": "  Build feature  ",
-        "objective": "  Ship clean diff  ",
-        "constraints": ["no deps"],
-        "acceptance_criteria": ["tests pass"],
-        "context_files": ["README.md"],
-        "return_format": "unified-diff",
-    }
+    return {"work_order_id": uuid4(), **dict(_WO_STATIC)}
 
 
 def test_work_order_rejects_extra_fields() -> None:
@@ -40,7 +42,11 @@ def test_work_order_serialization_and_schema_fields() -> None:
 
     serialized = work_order.to_dict()
     assert serialized["schema_version"] == DEFAULT_VERSION
-    assert json.loads(work_order.to_json())["schema_id"] == work_order.schema_id
+    assert serialized["schema_id"] == work_order.schema_id
+
+    decoded = json.loads(work_order.to_json())
+    assert decoded["schema_id"] == work_order.schema_id
+    assert decoded["schema_version"] == DEFAULT_VERSION
 
     schema = json.loads(WorkOrder.schema_json())
     assert schema["$id"].endswith(f"/WorkOrder/{DEFAULT_VERSION}")
@@ -57,3 +63,12 @@ def test_validation_report_nested_model() -> None:
     assert report.fatal[0].code == "ERR"
     assert report.metrics["tests_run"] == 3
 
+
+def test_trusted_build_matches_validated_construction() -> None:
+    validated = WorkOrder(**_work_order_payload())
+
+    trusted = WorkOrder.trusted_build(**validated.model_dump())
+
+    assert trusted == validated
+    assert trusted.schema_id == WorkOrder.default_schema_id()
+    assert trusted.dependencies == []
@@ -5,7 +5,7 @@ from __future__ import annotations
 import pytest
 
 from core.contracts import BaseContract, registry
-from core.contracts.registry import register_contract
+from core.contracts.registry import ContractRegistry, register_contract
 from core.contracts.version import DEFAULT_VERSION
 
 
@@ -34,3 +34,57 @@ def test_registry_registers_new_contract_with_alias() -> None:
     alias_lookup = registry.get("demo")
     assert alias_lookup is DemoContract
 
+
+def test_contract_schema_is_cached_and_reset_on_registration() -> None:
+    class CachedContract(BaseContract):
+        value: str
+
+    first = CachedContract.model_json_schema()
+    first["mutated"] = True
+    assert "mutated" not in CachedContract.model_json_schema()
+    assert CachedContract.schema_json() is CachedContract.schema_json()
+
+    registry.register(CachedContract, name="CachedContract", version="9.9.9")
+
+    assert CachedContract.model_json_schema()["$id"].endswith("/CachedContract/9.9.9")
+
+
+def test_registration_bakes_schema_identity_into_field_defaults() -> None:
+    @register_contract(name="StampedContract", version="2.0.0")
+    class StampedContract(BaseContract):
+        value: str
+
+    fields = StampedContract.model_fields
+    assert fields["schema_version"].default == "2.0.0"
+    assert fields["schema_id"].default.endswith("/StampedContract/2.0.0")
+    assert StampedContract(value="x").schema_id == fields["schema_id"].default
+
+
+def test_registry_resolution_cache_follows_new_registrations() -> None:
+    local = ContractRegistry()
+
+    class Versioned(BaseContract):
+        value: str
+
+    local.register(Versioned, name="Versioned", version="1.0", aliases=["versioned"])
+    assert local.get("versioned") is Versioned
+    with pytest.raises(KeyError, match=r"Unknown contract: versioned \(v2.0\)"):
+        local.get("versioned", version="2.0")
+
+    class VersionedV2(BaseContract):
+        value: str
+
+    local.register(VersionedV2, name="Versioned", version="2.0")
+    assert local.get("versioned", version="2.0") is VersionedV2
+    assert local.get("versioned") is Versioned
+
+
+def test_schema_id_is_computed_at_class_creation() -> None:
+    class Named(BaseContract):
+        __contract_name__ = "CustomName"
+
+    assert Named.default_schema_id().endswith(f"/CustomName/{DEFAULT_VERSION}")
+
+    ContractRegistry().register(Named, name="Renamed", version="3.0")
+    assert Named.default_schema_id().endswith("/Renamed/3.0")
+    assert Named().schema_id == Named.default_schema_id()
@@ -2,7 +2,12 @@
 
 from __future__ import annotations
 
-from core.contracts.transforms import DEFAULT_TRANSFORMS, Transform, apply_transforms
+from core.contracts.transforms import (
+    DEFAULT_TRANSFORMS,
+    Transform,
+    apply_transforms,
+    compile_transforms,
+)
 
 
 def test_work_order_default_transforms_applied() -> None:
@@ -30,3 +35,18 @@ def test_clamp_list_transform() -> None:
     assert transformed["items"] == [1, 2]
     assert log == [{"rule": "clamp_list_len", "field": "items", "max_len": 2}]
 
+
+def test_compiled_transforms_match_apply_transforms() -> None:
+    rules = [
+        Transform(type="coerce_type", field="count", target_type=int),
+        Transform(type="coerce_type", field="ratio", target_type=float),
+        Transform(type="default_if_missing", field="labels", default=[]),
+    ]
+    payload = {"count": "3", "ratio": "n/a"}
+
+    transformed, log = compile_transforms(rules)(payload)
+
+    assert (transformed, log) == apply_transforms(payload, rules)
+    assert transformed == {"count": 3, "ratio": "n/a", "labels": []}
+    assert log[1] == {"rule": "coerce_type", "field": "ratio", "type": "float", "error": "conversion_failed"}
+    assert payload == {"count": "3", "ratio": "n/a"}
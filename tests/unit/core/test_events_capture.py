@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import io
+import json
+from datetime import datetime, timezone
+
+from core.events.capture import InMemoryEventsPublisher
+from core.events.types import StepPlanned
+
+_TIMESTAMP = datetime(2024, 6, 1, 12, 0, tzinfo=timezone.utc)
+
+
+class _CountingStream(io.StringIO):
+    def __init__(self) -> None:
+        super().__init__()
+        self.flushes = 0
+
+    def flush(self) -> None:
+        self.flushes += 1
+        super().flush()
+
+
+def _event(step: int) -> StepPlanned:
+    return StepPlanned(run_id="run-1", state="planned", timestamp=_TIMESTAMP, step_id=f"step-{step}")
+
+
+def test_publisher_flushes_in_batches_and_on_exit() -> None:
+    stream = _CountingStream()
+
+    with InMemoryEventsPublisher(stream, flush_every=2) as publisher:
+        for step in range(3):
+            publisher.publish(_event(step))
+        assert stream.flushes == 1
+
+    assert stream.flushes == 2
+    lines = stream.getvalue().splitlines()
+    assert [json.loads(line)["step_id"] for line in lines] == ["step-0", "step-1", "step-2"]
+
+
+def test_publisher_auto_flush_flushes_every_event() -> None:
+    stream = _CountingStream()
+    publisher = InMemoryEventsPublisher(stream, auto_flush=True)
+
+    publisher.publish(_event(0))
+    publisher.publish(_event(1))
+
+    assert stream.flushes == 2
+
+
+def test_publisher_without_retained_payloads_rebuilds_them() -> None:
+    stream = io.StringIO()
+    publisher = InMemoryEventsPublisher(stream, retain_payloads=False)
+
+    publisher.publish(_event(0))
+    publisher.publish(_event(1))
+
+    assert all(captured.payload is None for captured in publisher.events)
+    payloads = list(publisher.iter_payloads())
+    assert [payload["step_id"] for payload in payloads] == ["step-0", "step-1"]
+    assert [json.loads(line) for line in stream.getvalue().splitlines()] == payloads
+
+
+def test_publisher_store_and_emit_toggles() -> None:
+    silent = InMemoryEventsPublisher(io.StringIO(), emit=False)
+    silent.publish(_event(0))
+    assert [payload["step_id"] for payload in silent.iter_payloads()] == ["step-0"]
+
+    stream = io.StringIO()
+    stateless = InMemoryEventsPublisher(stream, store=False)
+    stateless.publish(_event(0))
+    assert len(stateless.events) == 0
+    assert stateless.published_count == 1
+    assert json.loads(stream.getvalue())["step_id"] == "step-0"
+
+
+def test_publisher_event_views_track_new_events() -> None:
+    publisher = InMemoryEventsPublisher(io.StringIO())
+    events = publisher.list_events()
+
+    publisher.publish(_event(0))
+    publisher.publish(_event(1))
+
+    assert len(events) == 2
+    assert events[-1].step_id == "step-1"
+    assert [event.step_id for event in events[:1]] == ["step-0"]
+    assert [captured.event for captured in publisher.events] == list(events)
+
+
+def test_publisher_lines_match_sorted_key_encoding() -> None:
+    stream = io.StringIO()
+    publisher = InMemoryEventsPublisher(stream)
+    event = StepPlanned(
+        run_id="run-1",
+        state="planned",
+        timestamp=_TIMESTAMP,
+        step_id="step-1",
+        duration_ms=5,
+        meta={
+            "step_index": 0,
+            "patch": {"deletions": 0, "additions": 2},
+            "files": [{"z": 1, "a": 2}, ({"y": [{"c": 3, "b": 4}]},)],
+        },
+    )
+
+    publisher.publish(event)
+
+    line = stream.getvalue().rstrip("\n")
+    assert line == json.dumps(json.loads(line), sort_keys=True)
@@ -0,0 +1,39 @@
+"""Tests for the structured JSON log formatter."""
+
+from __future__ import annotations
+
+import json
+import logging
+from datetime import datetime, timezone
+
+from backend.core.logging import JsonLogFormatter
+
+
+def _make_record(message: str, meta: dict[str, object] | None = None) -> logging.LogRecord:
+    record = logging.LogRecord("tests.logging", logging.INFO, __file__, 1, message, None, None)
+    if meta is not None:
+        record.meta = meta
+    return record
+
+
+def test_formatter_emits_fields_in_canonical_order() -> None:
+    formatter = JsonLogFormatter()
+
+    payload = json.loads(formatter.format(_make_record("hello", {"run_id": "run-1"})))
+
+    assert list(payload) == ["ts", "level", "logger", "message", "meta"]
+    assert payload["level"] == "INFO"
+    assert payload["logger"] == "tests.logging"
+    assert payload["message"] == "hello"
+    assert payload["meta"] == {"run_id": "run-1"}
+
+
+def test_formatter_timestamp_is_utc_iso8601() -> None:
+    formatter = JsonLogFormatter()
+    before = datetime.now(timezone.utc).replace(microsecond=0)
+
+    first = datetime.fromisoformat(json.loads(formatter.format(_make_record("a")))["ts"])
+    second = datetime.fromisoformat(json.loads(formatter.format(_make_record("b")))["ts"])
+
+    assert first.utcoffset() == timezone.utc.utcoffset(None)
+    assert before <= first <= second
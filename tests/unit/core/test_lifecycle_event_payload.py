@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import json
+from datetime import datetime, timezone
+
+from backend.core.events.lifecycle import (
+    LifecycleEvent,
+    LifecycleEventPayload,
+    LifecycleEventType,
+)
+
+_OCCURRED_AT = datetime(2024, 6, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def test_typed_payload_encodes_only_set_keys() -> None:
+    event = LifecycleEvent(
+        event_type=LifecycleEventType.STEP_VALIDATED,
+        run_id="run-1",
+        step_id="step-1",
+        occurred_at=_OCCURRED_AT,
+        payload=LifecycleEventPayload(status="validated"),
+    )
+
+    assert json.loads(event.to_json()) == {
+        "event_type": "step.validated",
+        "run_id": "run-1",
+        "step_id": "step-1",
+        "occurred_at": "2024-06-01T12:00:00+00:00",
+        "payload": {"status": "validated"},
+    }
+
+
+def test_mapping_payload_is_still_supported() -> None:
+    event = LifecycleEvent(
+        event_type=LifecycleEventType.RUN_CREATED,
+        run_id="run-1",
+        step_id=None,
+        occurred_at=_OCCURRED_AT,
+        payload={"custom": "value"},
+    )
+
+    assert event.payload_dict() == {"custom": "value"}
+    assert json.loads(event.to_json())["step_id"] is None
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from types import MappingProxyType
+
+import pytest
+
+from backend.agents.orchestrator.orchestrator_state import RunState
+from core.store.memory_repos import InMemoryArtifactRepo, InMemoryRunRepo, InMemoryValidationReportRepo
+
+_NOW = datetime(2024, 6, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def test_artifact_add_many_uses_one_clock_read() -> None:
+    reads: list[datetime] = []
+
+    def clock() -> datetime:
+        reads.append(_NOW)
+        return _NOW
+
+    repo = InMemoryArtifactRepo(clock=clock)
+    repo.add_many(
+        [
+            {"run_id": "run-1", "step_id": "step-1", "kind": "diff", "content": "+a"},
+            {"run_id": "run-1", "step_id": "step-2", "kind": "doc", "content": "notes", "meta": {"n": 1}},
+        ]
+    )
+
+    assert len(reads) == 1
+    assert [artifact["kind"] for artifact in repo.list_artifacts("step-2")] == ["doc"]
+    assert all(artifact["created_at"] == _NOW for artifact in repo.all_artifacts())
+
+
+def test_run_snapshot_shares_a_read_only_config() -> None:
+    repo = InMemoryRunRepo(clock=lambda: _NOW)
+    config = {"feature_branch": "demo"}
+    run_id = repo.create_run(
+        repo="org/repo", base_ref="main", feature_ref="demo-1", status=RunState.QUEUED, config=config
+    )
+    config["feature_branch"] = "changed"
+
+    first = repo.get_run(run_id)
+    second = repo.get_run(run_id)
+
+    assert first["config"] == {"feature_branch": "demo"}
+    assert first["config"] is second["config"]
+    with pytest.raises(TypeError):
+        first["config"]["feature_branch"] = "mutated"  # type: ignore[index]
+
+
+def test_report_counts_do_not_consume_iterators() -> None:
+    repo = InMemoryValidationReportRepo(clock=lambda: _NOW)
+    fatal = iter(["E1", "E2"])
+
+    repo.add(run_id="run-1", step_id="step-1", report={"fatal": fatal, "warnings": ("W1",)})
+
+    (stored,) = repo.list_reports("run-1")
+    assert stored["fatal_count"] == 2
+    assert stored["warnings_count"] == 1
+    assert list(stored["report"]["fatal"]) == ["E1", "E2"]
+
+
+def test_read_only_mappings_are_stored_without_copying() -> None:
+    repo = InMemoryArtifactRepo(clock=lambda: _NOW)
+    meta = MappingProxyType({"lines": 3})
+
+    repo.add(run_id="run-1", step_id="step-1", kind="diff", content="+a", meta=meta)
+    repo.add(run_id="run-1", step_id="step-1", kind="doc", content="notes")
+
+    first, second = repo.list_artifacts("step-1")
+    assert first["meta"] is meta
+    assert second["meta"] == {}
+
+
+def test_report_counts_generator_findings() -> None:
+    repo = InMemoryValidationReportRepo(clock=lambda: _NOW)
+    fatal = (code for code in ("E1", "E2", "E3"))
+
+    repo.add(run_id="run-1", step_id="step-1", report={"fatal": fatal})
+
+    (stored,) = repo.list_reports("run-1")
+    assert stored["fatal_count"] == 3
+    assert stored["warnings_count"] == 0
+    assert stored["report"]["fatal"] == ("E1", "E2", "E3")
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import pytest
+
+from backend.core.store import session as session_module
+
+
+class _RecordingSession:
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+
+    def connection(self, execution_options: dict[str, object]) -> None:
+        self.calls.append(f"connection:{sorted(execution_options)}")
+
+    def commit(self) -> None:
+        self.calls.append("commit")
+
+    def rollback(self) -> None:
+        self.calls.append("rollback")
+
+    def close(self) -> None:
+        self.calls.append("close")
+
+
+def test_session_scope_commits_and_closes(monkeypatch: pytest.MonkeyPatch) -> None:
+    created = _RecordingSession()
+    monkeypatch.setattr(session_module, "_SESSION_FACTORY", lambda: created)
+
+    with session_module.session_scope() as session:
+        assert session is created
+
+    assert created.calls == ["commit", "close"]
+
+
+def test_session_scope_rolls_back_on_error(monkeypatch: pytest.MonkeyPatch) -> None:
+    created = _RecordingSession()
+    monkeypatch.setattr(session_module, "_SESSION_FACTORY", lambda: created)
+
+    with pytest.raises(ValueError):
+        with session_module.session_scope():
+            raise ValueError("boom")
+
+    assert created.calls == ["rollback", "close"]
+
+
+def test_session_scope_requires_configuration(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(session_module, "_SESSION_FACTORY", None)
+
+    with pytest.raises(RuntimeError, match="not configured"):
+        with session_module.session_scope():
+            pass
+
+
+def test_read_only_session_scope_never_commits(monkeypatch: pytest.MonkeyPatch) -> None:
+    created = _RecordingSession()
+    monkeypatch.setattr(session_module, "_SESSION_FACTORY", lambda: created)
+
+    with session_module.read_only_session_scope() as session:
+        assert session is created
+
+    assert created.calls == [
+        "connection:['postgresql_readonly']",
+        "rollback",
+        "close",
+    ]
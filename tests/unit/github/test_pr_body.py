@@ -10,14 +10,18 @@ def test_render_pr_body_includes_required_sections() -> None:
         metrics={"tests": "0 failed", "lint": "clean"},
     )
 
-    assert "## Summary" in body
-    assert "## Changes" in body
-    assert "## Validation" in body
-    assert "## Metrics" in body
-    assert "## Links" in body
-    assert "- Run ID: `run-123`" in body
-    assert "- Implemented feature branch scaffold" in body
-    assert "- tests: 0 failed" in body
+    cursor = 0
+    for section in ("## Summary", "## Changes", "## Validation", "## Metrics", "## Links"):
+        cursor = body.find(section, cursor)
+        assert cursor >= 0, section
+
+    required = (
+        "- Run ID: `run-123`",
+        "- Implemented feature branch scaffold",
+        "- tests: 0 failed",
+    )
+    missing = [line for line in required if line not in body]
+    assert not missing
 
 
 def test_render_step_update_lists_acceptance_criteria_and_validators() -> None:
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from uuid import uuid4
+from collections.abc import Callable
+from uuid import UUID
 
 from backend.agents.planner.prompt_templates import (
     build_planner_summary,
@@ -11,8 +12,8 @@ from backend.agents.planner.prompt_templates import (
 from backend.agents.planner.sub_planner_adapter import BasicSubPlanner
 
 
-def _make_step() -> dict[str, object]:
-    work_order_id = uuid4()
+def _make_step(fake_uuid: Callable[[], UUID]) -> dict[str, object]:
+    work_order_id = fake_uuid()
     return {
         "work_order_id": work_order_id,
         "title": "  Implement login endpoint  ",
@@ -23,24 +24,24 @@ def _make_step() -> dict[str, object]:
     }
 
 
-def test_planner_templates_are_deterministic() -> None:
-    step = _make_step()
+def test_planner_templates_are_deterministic(fake_uuid: Callable[[], UUID]) -> None:
+    step = _make_step(fake_uuid)
     first = build_planner_summary(step)
     second = build_planner_summary(step)
     assert first == second
 
 
-def test_work_order_brief_is_deterministic() -> None:
+def test_work_order_brief_is_deterministic(fake_uuid: Callable[[], UUID]) -> None:
     planner = BasicSubPlanner()
-    work_order = planner.build_work_order(_make_step())
+    work_order = planner.build_work_order(_make_step(fake_uuid))
     brief_one = build_work_order_brief(work_order.to_dict())
     brief_two = build_work_order_brief(work_order.to_dict())
     assert brief_one == brief_two
 
 
-def test_basic_sub_planner_normalizes_fields() -> None:
+def test_basic_sub_planner_normalizes_fields(fake_uuid: Callable[[], UUID]) -> None:
     planner = BasicSubPlanner()
-    step = _make_step()
+    step = _make_step(fake_uuid)
     work_order = planner.build_work_order(step)
 
     assert work_order.title == "Implement login endpoint"
@@ -54,10 +55,12 @@ def test_basic_sub_planner_normalizes_fields() -> None:
     assert "Generated work order brief" in "\n".join(planner.transform_log)
 
 
-def test_basic_sub_planner_defaults_context_allowlist_when_missing() -> None:
+def test_basic_sub_planner_defaults_context_allowlist_when_missing(
+    fake_uuid: Callable[[], UUID],
+) -> None:
     planner = BasicSubPlanner()
     step = {
-        "work_order_id": uuid4(),
+        "work_order_id": fake_uuid(),
         "title": "Add search",
         "objective": "Implement search endpoint",
     }
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import io
+import subprocess
 from collections.abc import Sequence
 from unittest import mock
 
@@ -8,9 +10,20 @@ import pytest
 from tools import changed_files
 
 
-class _CompletedProcess:
-    def __init__(self, stdout: str) -> None:
-        self.stdout = stdout
+class _FakePopen:
+    def __init__(self, stdout: bytes, returncode: int = 0) -> None:
+        self.stdout = io.BytesIO(stdout)
+        self.stderr = io.BytesIO(b"fatal: bad revision" if returncode else b"")
+        self.returncode = returncode
+
+    def __enter__(self) -> _FakePopen:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        return None
+
+    def wait(self) -> int:
+        return self.returncode
 
 
 @pytest.mark.parametrize(
@@ -28,25 +41,22 @@ class _CompletedProcess:
     ],
 )
 def test_changed_files_git_stats(numstat_output, new_files_output, expected):
-    command_outputs = {
-        ("git", "diff", "--numstat", "origin/main...HEAD"): numstat_output,
-        (
-            "git",
-            "diff",
-            "--name-only",
-            "--diff-filter=A",
-            "origin/main...HEAD",
-        ): new_files_output,
-    }
+    # Each command runs once per call, so one prebuilt process per command suffices.
+    numstat_process = _FakePopen(numstat_output.encode())
+    new_files_process = _FakePopen(new_files_output.encode())
 
-    def fake_run(command: Sequence[str], capture_output: bool, text: bool, check: bool):
-        key = tuple(command)
-        return _CompletedProcess(stdout=command_outputs[key])
+    def fake_popen(command: Sequence[str], stdout: object, stderr: object):
+        return numstat_process if "--numstat" in command else new_files_process
 
     with mock.patch.object(changed_files, "subprocess") as subprocess_mock:
-        subprocess_mock.run.side_effect = fake_run
+        subprocess_mock.Popen.side_effect = fake_popen
         files = changed_files.list_changed_files("origin/main")
 
+    commands = {tuple(call.args[0]) for call in subprocess_mock.Popen.call_args_list}
+    assert commands == {
+        ("git", "diff", "--numstat", "origin/main...HEAD"),
+        ("git", "diff", "--name-only", "--diff-filter=A", "origin/main...HEAD"),
+    }
     assert {file.path for file in files} == set(expected)
     for file in files:
         additions, deletions, is_new = expected[file.path]
@@ -55,6 +65,41 @@ def test_changed_files_git_stats(numstat_output, new_files_output, expected):
         assert file.is_new_file is is_new
 
 
+def test_changed_files_passes_pathspecs_to_git():
+    with mock.patch.object(changed_files, "subprocess") as subprocess_mock:
+        subprocess_mock.Popen.side_effect = lambda command, stdout, stderr: _FakePopen(
+            b""
+        )
+        changed_files.list_changed_files("origin/main", pathspecs=("*.py", "*.ts"))
+
+    commands = {tuple(call.args[0]) for call in subprocess_mock.Popen.call_args_list}
+    assert commands == {
+        ("git", "diff", "--numstat", "origin/main...HEAD", "--", "*.py", "*.ts"),
+        (
+            "git",
+            "diff",
+            "--name-only",
+            "--diff-filter=A",
+            "origin/main...HEAD",
+            "--",
+            "*.py",
+            "*.ts",
+        ),
+    }
+
+
+def test_changed_files_raises_when_git_fails():
+    with mock.patch.object(changed_files, "subprocess") as subprocess_mock:
+        subprocess_mock.CalledProcessError = subprocess.CalledProcessError
+        subprocess_mock.Popen.side_effect = lambda command, stdout, stderr: _FakePopen(
+            b"", returncode=128
+        )
+        with pytest.raises(subprocess.CalledProcessError) as excinfo:
+            changed_files.list_changed_files("missing")
+
+    assert excinfo.value.stderr == b"fatal: bad revision"
+
+
 def test_summarize_changed_files_counts_lines_and_new_files():
     files = [
         changed_files.ChangedFile(
@@ -69,3 +114,19 @@ def test_summarize_changed_files_counts_lines_and_new_files():
 
     assert summary.total_changed_lines == 8
     assert summary.new_files_count == 1
+
+
+def test_scan_changed_files_returns_summary_and_raw_paths():
+    numstat_process = _FakePopen(b"3\t1\ta.py\n2\t2\tb.ts\n-\t-\tlogo.png\n")
+    new_files_process = _FakePopen(b"a.py\n")
+
+    def fake_popen(command: Sequence[str], stdout: object, stderr: object):
+        return numstat_process if "--numstat" in command else new_files_process
+
+    with mock.patch.object(changed_files, "subprocess") as subprocess_mock:
+        subprocess_mock.Popen.side_effect = fake_popen
+        summary, paths = changed_files.scan_changed_files("origin/main")
+
+    assert paths == [b"a.py", b"b.ts", b"logo.png"]
+    assert summary.total_changed_lines == 8
+    assert summary.new_files_count == 1
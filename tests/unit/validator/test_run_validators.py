@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import io
+import uuid
+from unittest import mock
+
+from backend.agents.validator.report_model import ValidationReport
+from tools import run_validators
+
+
+def test_clean_report_template_matches_model_serialization():
+    step_id = uuid.UUID(int=1)
+
+    expected = ValidationReport(step_id=step_id).model_dump_json(indent=2) + "\n"
+
+    assert run_validators._CLEAN_REPORT_TEMPLATE % step_id == expected
+
+
+def test_main_writes_clean_report_for_docs_only_diff():
+    summary = mock.Mock()
+    stdout = io.StringIO()
+    with (
+        mock.patch.object(
+            run_validators, "scan_changed_files", return_value=(summary, [b"README.md"])
+        ),
+        mock.patch.object(run_validators, "check_diff_size", return_value=None),
+        mock.patch.object(run_validators.sys, "stdout", stdout),
+    ):
+        exit_code = run_validators.main(["--base-ref", "origin/main"])
+
+    assert exit_code == 0
+    report = ValidationReport.model_validate_json(stdout.getvalue())
+    assert not report.has_fatal
+    assert report.warnings == ()
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
 import json
-import uuid
+from collections.abc import Callable
+from uuid import UUID
+
+import pytest
+from pydantic import ValidationError
 
 from backend.agents.validator.report_model import (
     FatalItem,
@@ -10,8 +14,8 @@ from backend.agents.validator.report_model import (
 )
 
 
-def test_validation_report_serialization_and_schema():
-    step_id = uuid.uuid4()
+def test_validation_report_serialization_and_schema(fake_uuid: Callable[[], UUID]):
+    step_id = fake_uuid()
     report = ValidationReport(
         step_id=step_id,
         fatal=[
@@ -36,7 +40,7 @@ def test_validation_report_serialization_and_schema():
     assert payload["fatal"][0]["code"] == "PY_RUFF"
     assert payload["warnings"][0]["file"] == "frontend/app.tsx"
 
-    json_payload = json.dumps(report.model_dump(mode="json"))
+    json_payload = report.model_dump_json()
     assert "Unused import" in json_payload
 
     schema = report.model_json_schema()
@@ -45,3 +49,23 @@ def test_validation_report_serialization_and_schema():
     assert fatal_schema["type"] == "array"
     fatal_def = schema["$defs"]["FatalItem"]
     assert fatal_def["properties"]["code"]["type"] == "string"
+
+
+def test_validation_report_is_frozen_and_caches_serialization(
+    fake_uuid: Callable[[], UUID],
+):
+    report = ValidationReport(
+        step_id=fake_uuid(),
+        fatal=[FatalItem(code="PY_MYPY", file="backend/foo.py", line=3, msg="boom")],
+    )
+
+    assert isinstance(report.fatal, tuple)
+    with pytest.raises(ValidationError):
+        report.fatal = ()
+
+    assert report.serialized_dict is report.serialized_dict
+    assert json.loads(report.serialized_json) == report.serialized_dict
+
+    cleared = report.model_copy(update={"fatal": ()})
+    assert cleared.serialized_dict["fatal"] == []
+    assert report.serialized_dict["fatal"][0]["code"] == "PY_MYPY"
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import uuid
+from collections.abc import Sequence
+
+import pytest
+
+from backend.agents.validator import dispatch, js_validator, python_validator
+from backend.agents.validator.process import CommandResult
+
+_RUFF_OUTPUT = json.dumps(
+    [
+        {
+            "code": "F401",
+            "filename": "backend/foo.py",
+            "location": {"row": 3},
+            "message": "Unused import.",
+        }
+    ]
+)
+_ESLINT_OUTPUT = json.dumps(
+    [
+        {
+            "filePath": "frontend/app.tsx",
+            "messages": [
+                {"severity": 1, "ruleId": "no-console", "message": "Console.", "line": 2}
+            ],
+        }
+    ]
+)
+
+
+async def _fake_run_command_async(argv: Sequence[str]) -> CommandResult:
+    tool = argv[0]
+    if tool == "ruff":
+        return CommandResult(returncode=1, stdout=_RUFF_OUTPUT, stderr="")
+    if tool == "eslint":
+        return CommandResult(returncode=0, stdout=_ESLINT_OUTPUT, stderr="")
+    return CommandResult(returncode=0, stdout="", stderr="")
+
+
+def test_run_all_validators_async_merges_backend_results(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(python_validator, "run_command_async", _fake_run_command_async)
+    monkeypatch.setattr(js_validator, "run_command_async", _fake_run_command_async)
+    step_id = uuid.uuid4()
+
+    report = asyncio.run(
+        dispatch.run_all_validators_async(
+            step_id, ["backend/foo.py"], ["frontend/app.tsx"]
+        )
+    )
+
+    assert report.step_id == step_id
+    assert [item.code for item in report.fatal] == ["F401"]
+    assert [item.code for item in report.warnings] == ["no-console"]
+    assert report.metrics.lint_errors == 1
+
+
+def test_run_all_validators_async_skips_empty_partitions(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    async def _unexpected(argv: Sequence[str]) -> CommandResult:
+        raise AssertionError(f"unexpected subprocess: {argv}")
+
+    monkeypatch.setattr(python_validator, "run_command_async", _unexpected)
+    monkeypatch.setattr(js_validator, "run_command_async", _unexpected)
+
+    report = asyncio.run(dispatch.run_all_validators_async(uuid.uuid4(), [], []))
+
+    assert not report.has_fatal
+    assert report.warnings == ()
+
+
+def test_ruff_parallel_batches_large_path_sets(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[list[str]] = []
+
+    def _fake_run_command(argv: Sequence[str]) -> CommandResult:
+        batch = list(argv[len(python_validator._RUFF_COMMAND) :])
+        calls.append(batch)
+        findings = [
+            {"code": "F401", "filename": path, "location": {"row": 1}, "message": "x"}
+            for path in batch
+        ]
+        return CommandResult(returncode=1, stdout=json.dumps(findings), stderr="")
+
+    monkeypatch.setattr(python_validator, "run_command", _fake_run_command)
+    paths = [f"pkg/module_{index}.py" for index in range(250)]
+
+    fatal = python_validator._run_ruff_parallel(paths, io_threads=4)
+
+    assert len(calls) == 4
+    assert sorted(item.file for item in fatal) == sorted(paths)
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from backend.agents.validator.js_validator import _parse_tsc
+from backend.agents.validator.process import CommandResult
+from backend.agents.validator.python_validator import _parse_mypy
+
+
+def test_parse_mypy_extracts_errors_and_surfaces_unexpected_lines() -> None:
+    stdout = (
+        "  pkg/mod.py:12: error: Incompatible types  [assignment]  \n"
+        "\n"
+        "pkg/other.py:3:5: error: Missing return\n"
+        "pkg/other.py: note: See docs\r\n"
+        "Found 2 errors in 2 files (checked 3 source files)\n"
+    )
+
+    fatal = _parse_mypy(CommandResult(returncode=1, stdout=stdout, stderr=""))
+
+    assert [(item.file, item.line, item.msg) for item in fatal] == [
+        ("pkg/mod.py", 12, "Incompatible types  [assignment]"),
+        ("pkg/other.py", 3, "Missing return"),
+        ("", None, "pkg/other.py: note: See docs"),
+    ]
+
+
+def test_parse_mypy_falls_back_to_stderr() -> None:
+    fatal = _parse_mypy(CommandResult(returncode=2, stdout="", stderr=" boom \n"))
+
+    assert [(item.file, item.msg) for item in fatal] == [("", "boom")]
+
+
+def test_parse_tsc_extracts_coordinates() -> None:
+    stdout = (
+        "src/app.ts(3,7): error TS2322: Type 'x' is not assignable.\n"
+        "   \n"
+        "error TS6053: File 'missing.ts' not found.\n"
+    )
+
+    fatal = _parse_tsc(CommandResult(returncode=2, stdout=stdout, stderr=""))
+
+    assert [(item.file, item.line, item.msg) for item in fatal] == [
+        ("src/app.ts", 3, "error TS2322: Type 'x' is not assignable."),
+        ("", None, "error TS6053: File 'missing.ts' not found."),
+    ]
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import pytest
+
+from backend.agents.validator import pipeline
+from backend.agents.validator.pipeline import PipelineConfig, run_pipeline
+
+
+def test_run_pipeline_returns_results_in_batch_order() -> None:
+    paths = [f"file_{index}.py" for index in range(10)]
+    config = PipelineConfig(io_threads=3, workers=2, queue_depth=1, batch_size=2)
+
+    results = run_pipeline(paths, list, len, config)
+
+    assert results == [2, 2, 2, 2, 2]
+
+
+def test_run_pipeline_reraises_stage_errors() -> None:
+    def _execute(batch: Sequence[str]) -> list[str]:
+        if "bad.py" in batch:
+            raise RuntimeError("tool crashed")
+        return list(batch)
+
+    config = PipelineConfig(io_threads=2, workers=1, queue_depth=1, batch_size=1)
+
+    with pytest.raises(RuntimeError, match="tool crashed"):
+        run_pipeline(["a.py", "bad.py", "c.py"], _execute, len, config)
+
+
+def test_pipeline_config_reads_environment(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("VALIDATOR_IO_THREADS", "6")
+    monkeypatch.setenv("VALIDATOR_WORKERS", "3")
+    monkeypatch.setenv("VALIDATOR_QUEUE_DEPTH", "not-a-number")
+
+    config = pipeline.PipelineConfig.from_env()
+
+    assert (config.io_threads, config.workers, config.queue_depth) == (6, 3, 16)
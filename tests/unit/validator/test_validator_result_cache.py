@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from collections.abc import Iterator, Sequence
+from pathlib import Path
+
+import pytest
+
+from backend.agents.validator import _result_cache, python_validator
+from backend.agents.validator.process import CommandResult
+
+
+@pytest.fixture
+def ruff_calls(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> Iterator[list[list[str]]]:
+    calls: list[list[str]] = []
+
+    def _fake_run_command(argv: Sequence[str]) -> CommandResult:
+        if list(argv) == ["ruff", "--version"]:
+            return CommandResult(returncode=0, stdout="ruff 0.4.0\n", stderr="")
+        targets = list(argv[4:])
+        calls.append(targets)
+        findings = [
+            {
+                "code": "F401",
+                "filename": target,
+                "location": {"row": 1},
+                "message": "Unused import.",
+            }
+            for target in targets
+            if Path(target).name == "dirty.py"
+        ]
+        return CommandResult(
+            returncode=1 if findings else 0, stdout=json.dumps(findings), stderr=""
+        )
+
+    monkeypatch.setenv("VALIDATOR_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(_result_cache, "run_command", _fake_run_command)
+    monkeypatch.setattr(python_validator, "run_command", _fake_run_command)
+
+    async def _fake_run_command_async(argv: Sequence[str]) -> CommandResult:
+        return _fake_run_command(argv)
+
+    monkeypatch.setattr(
+        python_validator, "run_command_async", _fake_run_command_async
+    )
+    _result_cache._tool_version.cache_clear()
+    yield calls
+    _result_cache._tool_version.cache_clear()
+
+
+def test_ruff_results_are_replayed_for_unchanged_files(
+    tmp_path: Path, ruff_calls: list[list[str]]
+) -> None:
+    clean = tmp_path / "clean.py"
+    dirty = tmp_path / "dirty.py"
+    clean.write_text("x = 1\n")
+    dirty.write_text("import os\n")
+    paths = [str(clean), str(dirty)]
+
+    first = python_validator._run_ruff_cached(paths)
+    second = python_validator._run_ruff_cached(paths)
+
+    assert ruff_calls == [paths]
+    assert [item.file for item in first] == [str(dirty)]
+    assert second == first
+
+    clean.write_text("x = 2\n")
+    python_validator._run_ruff_cached(paths)
+
+    assert ruff_calls[-1] == [str(clean)]
+
+
+def test_identical_files_at_different_paths_keep_their_own_findings(
+    tmp_path: Path, ruff_calls: list[list[str]]
+) -> None:
+    paths = []
+    for directory in ("a", "b"):
+        (tmp_path / directory).mkdir()
+        target = tmp_path / directory / "dirty.py"
+        target.write_text("import os\n")
+        paths.append(str(target))
+
+    first = python_validator._run_ruff_cached(paths)
+    second = python_validator._run_ruff_cached(paths)
+
+    assert ruff_calls == [paths]
+    assert [item.file for item in first] == paths
+    assert sorted(item.file for item in second) == paths
+
+
+def test_async_ruff_results_are_replayed_and_shelf_is_released(
+    tmp_path: Path, ruff_calls: list[list[str]]
+) -> None:
+    dirty = tmp_path / "dirty.py"
+    dirty.write_text("import os\n")
+    paths = [str(dirty)]
+
+    first = asyncio.run(python_validator._run_ruff_cached_async(paths))
+    second = asyncio.run(python_validator._run_ruff_cached_async(paths))
+
+    assert ruff_calls == [paths]
+    assert second == first
+    assert not _result_cache._shelf_lock("ruff").locked()
+
+
+def test_result_cache_is_disabled_without_directory(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.delenv("VALIDATOR_CACHE_DIR", raising=False)
+
+    with _result_cache.open_result_cache("ruff", ("ruff", "--version"), ()) as cache:
+        assert cache is None
@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
-import argparse
+import re
 import subprocess
 import sys
-from collections.abc import Iterable, Sequence
+import threading
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -14,12 +17,22 @@ if TYPE_CHECKING:
     from backend.agents.validator.size_guards import DiffSummary
 
 
+_REPO_ROOT_LOCK = threading.Lock()
+_REPO_ROOT_INSERTED = False
+
+
 def _ensure_repo_root() -> None:
-    repo_root = Path(__file__).resolve().parents[1]
-    if str(repo_root) not in sys.path:
-        sys.path.insert(0, str(repo_root))
+    global _REPO_ROOT_INSERTED
+    with _REPO_ROOT_LOCK:
+        if _REPO_ROOT_INSERTED:
+            return
+        repo_root = str(Path(__file__).resolve().parents[1])
+        if repo_root not in sys.path:
+            sys.path.insert(0, repo_root)
+        _REPO_ROOT_INSERTED = True
 
 
+@lru_cache(maxsize=1)
 def _import_diff_summary():
     _ensure_repo_root()
     from backend.agents.validator.size_guards import DiffSummary
@@ -37,49 +50,84 @@ class ChangedFile:
     is_new_file: bool = False
 
 
-def _run_git(command: Sequence[str]) -> str:
-    result = subprocess.run(
-        command,
-        capture_output=True,
-        text=True,
-        check=True,
-    )
-    return result.stdout
+# One ``git diff --numstat`` row: additions, deletions (``-`` for binary files), path.
+_NUMSTAT_RE = re.compile(rb"(\d+|-)\t(\d+|-)\t(.+)$")
+
+
+def _iter_git_lines(command: Sequence[str]) -> Iterator[bytes]:
+    """Yield ``command``'s stdout line by line while git is still writing it.
+
+    Raises :class:`subprocess.CalledProcessError` once the output is drained if
+    the command failed, matching ``subprocess.run(..., check=True)``.
+    """
+
+    with subprocess.Popen(
+        command, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+    ) as process:
+        yield from process.stdout
+        stderr = process.stderr.read()
+        returncode = process.wait()
+    if returncode:
+        raise subprocess.CalledProcessError(returncode, command, stderr=stderr)
+
+
+def _new_file_paths(diff_range: str, pathspecs: Sequence[str] = ()) -> frozenset[bytes]:
+    command = [
+        "git",
+        "diff",
+        "--name-only",
+        "--diff-filter=A",
+        diff_range,
+        *_pathspec_args(pathspecs),
+    ]
+    return frozenset(line.strip() for line in _iter_git_lines(command) if line.strip())
+
+
+def _pathspec_args(pathspecs: Sequence[str]) -> list[str]:
+    return ["--", *pathspecs] if pathspecs else []
 
 
 def _diff_range(base_ref: str, head_ref: str = "HEAD") -> str:
     return f"{base_ref}...{head_ref}"
 
 
-def list_changed_files(base_ref: str, head_ref: str = "HEAD") -> list[ChangedFile]:
-    """Return metadata about files changed relative to the provided base ref."""
-
-    diff_range = _diff_range(base_ref, head_ref)
-    numstat_output = _run_git(["git", "diff", "--numstat", diff_range])
-    new_files_output = _run_git(
-        ["git", "diff", "--name-only", "--diff-filter=A", diff_range]
-    )
-    new_files = {line.strip() for line in new_files_output.splitlines() if line.strip()}
-
-    changed: list[ChangedFile] = []
-    for line in numstat_output.splitlines():
-        parts = line.split("\t")
-        if len(parts) < 3:
-            continue
-        additions_raw, deletions_raw, *path_parts = parts
-        path = path_parts[-1]
-        additions = int(additions_raw) if additions_raw.isdigit() else 0
-        deletions = int(deletions_raw) if deletions_raw.isdigit() else 0
-        changed.append(
-            ChangedFile(
-                path=path,
-                additions=additions,
-                deletions=deletions,
-                is_new_file=path in new_files,
-            )
+def _numstat_rows(
+    diff_range: str, pathspecs: Sequence[str]
+) -> tuple[list[tuple[bytes, bytes, bytes]], frozenset[bytes]]:
+    """Return raw ``(additions, deletions, path)`` rows and the new file paths."""
+
+    numstat_command = ["git", "diff", "--numstat", diff_range]
+    numstat_command.extend(_pathspec_args(pathspecs))
+    # Drain both git pipes concurrently; numstat rows are parsed as they arrive.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        new_files_future = executor.submit(_new_file_paths, diff_range, pathspecs)
+        rows = [
+            match.groups()
+            for match in map(_NUMSTAT_RE.match, _iter_git_lines(numstat_command))
+            if match is not None
+        ]
+        return rows, new_files_future.result()
+
+
+def list_changed_files(
+    base_ref: str, head_ref: str = "HEAD", pathspecs: Sequence[str] = ()
+) -> list[ChangedFile]:
+    """Return metadata about files changed relative to the provided base ref.
+
+    ``pathspecs`` (e.g. ``("*.py",)``) are passed through to git so files
+    outside them are never listed.
+    """
+
+    rows, new_files = _numstat_rows(_diff_range(base_ref, head_ref), pathspecs)
+    return [
+        ChangedFile(
+            path=path.decode(),
+            additions=int(additions) if additions != b"-" else 0,
+            deletions=int(deletions) if deletions != b"-" else 0,
+            is_new_file=path in new_files,
         )
-
-    return changed
+        for additions, deletions, path in rows
+    ]
 
 
 def changed_file_paths(files: Iterable[ChangedFile]) -> list[str]:
@@ -103,7 +151,38 @@ def summarize_changed_files(files: Iterable[ChangedFile]) -> DiffSummary:
     )
 
 
+def scan_changed_files(
+    base_ref: str, head_ref: str = "HEAD", pathspecs: Sequence[str] = ()
+) -> tuple[DiffSummary, list[bytes]]:
+    """Return the size-guard summary and changed paths from one pass over the diff.
+
+    Paths stay as the raw bytes git printed so callers can filter them before
+    paying for a decode (``os.fsdecode``) on the ones they keep.
+    """
+
+    rows, new_files = _numstat_rows(_diff_range(base_ref, head_ref), pathspecs)
+    diff_summary_cls = _import_diff_summary()
+    paths: list[bytes] = []
+    total_lines = 0
+    new_files_count = 0
+    for additions, deletions, path in rows:
+        paths.append(path)
+        if additions != b"-":
+            total_lines += int(additions)
+        if deletions != b"-":
+            total_lines += int(deletions)
+        if path in new_files:
+            new_files_count += 1
+    summary = diff_summary_cls(
+        total_changed_lines=total_lines, new_files_count=new_files_count
+    )
+    return summary, paths
+
+
 def main(argv: Sequence[str] | None = None) -> int:
+    # Imported here so run_validators, which reuses this module, skips argparse.
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="List files changed against a base ref."
     )
@@ -117,9 +196,14 @@ def main(argv: Sequence[str] | None = None) -> int:
         default="HEAD",
         help="Head git ref to compare against (defaults to HEAD).",
     )
+    parser.add_argument(
+        "pathspecs",
+        nargs="*",
+        help="Optional git pathspecs limiting the listed files (e.g. '*.py').",
+    )
     args = parser.parse_args(argv)
 
-    files = list_changed_files(args.base_ref, args.head_ref)
+    files = list_changed_files(args.base_ref, args.head_ref, args.pathspecs)
     for path in changed_file_paths(files):
         print(path)
 
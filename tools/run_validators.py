@@ -2,86 +2,237 @@
 
 from __future__ import annotations
 
-import argparse
-import json
+import os
 import sys
 from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
+from typing import NoReturn
 from uuid import uuid4
 
 
+_REPO_ROOT = str(Path(__file__).resolve().parents[1])
+
+
 def _ensure_repo_root() -> None:
-    repo_root = Path(__file__).resolve().parents[1]
-    if str(repo_root) not in sys.path:
-        sys.path.insert(0, str(repo_root))
+    if _REPO_ROOT not in sys.path:
+        sys.path.insert(0, _REPO_ROOT)
 
 
-def _filter_paths(paths: Sequence[str], suffixes: Sequence[str]) -> list[str]:
-    return [path for path in paths if Path(path).suffix in suffixes]
+_ensure_repo_root()
 
+from backend.agents.validator.report_model import (  # noqa: E402
+    FatalItem,
+    Metrics,
+    ValidationReport,
+    WarningItem,
+)
+from backend.agents.validator.size_guards import check_diff_size  # noqa: E402
+from tools.changed_files import scan_changed_files  # noqa: E402
 
-def main(argv: Sequence[str] | None = None) -> int:
-    _ensure_repo_root()
-    from backend.agents.validator.js_validator import run_js_validators
+
+@dataclass(frozen=True, slots=True)
+class _NoFindings:
+    """Stand-in result for a language with no changed files."""
+
+    fatal: tuple[FatalItem, ...] = ()
+    warnings: tuple[WarningItem, ...] = ()
+    lint_errors: int = 0
+
+
+_NO_FINDINGS = _NoFindings()
+
+
+@lru_cache(maxsize=1)
+def _import_python_backend():
     from backend.agents.validator.python_validator import run_python_validators
-    from backend.agents.validator.report_model import Metrics, ValidationReport
-    from backend.agents.validator.size_guards import check_diff_size
-    from tools.changed_files import (
-        changed_file_paths,
-        list_changed_files,
-        summarize_changed_files,
-    )
 
-    parser = argparse.ArgumentParser(description="Run validators for changed files.")
-    parser.add_argument(
-        "--base-ref",
-        required=True,
-        help="Base git reference used to determine changed files.",
-    )
-    parser.add_argument(
-        "--head-ref",
-        default="HEAD",
-        help="Head git reference used to determine changed files (default: HEAD).",
-    )
-    args = parser.parse_args(argv)
+    return run_python_validators
+
 
-    changed = list_changed_files(args.base_ref, args.head_ref)
-    summary = summarize_changed_files(changed)
+@lru_cache(maxsize=1)
+def _import_js_backend():
+    from backend.agents.validator.js_validator import run_js_validators
 
-    report = ValidationReport(step_id=uuid4())
+    return run_js_validators
 
-    size_guard_fatal = check_diff_size(summary)
-    if size_guard_fatal:
-        report.fatal.append(size_guard_fatal)
-        report.metrics = Metrics(
-            lint_errors=len(report.fatal),
-            tests_run=0,
-            tests_failed=0,
-        )
-        print(json.dumps(report.model_dump(mode="json"), indent=2))
-        return 1
 
-    paths = changed_file_paths(changed)
-    python_files = _filter_paths(paths, (".py",))
-    js_files = _filter_paths(paths, (".js", ".ts", ".tsx"))
+_PYTHON_SUFFIXES = (b".py",)
+_JS_SUFFIXES = (b".js", b".ts", b".tsx")
+
+
+def _split_paths(paths: Sequence[bytes]) -> tuple[list[str], list[str]]:
+    """Split raw git ``paths`` into Python and JS/TS files in a single pass.
+
+    Matching happens on bytes; only the paths that are kept get decoded.
+    """
+
+    python_files: list[str] = []
+    js_files: list[str] = []
+    for path in paths:
+        if path.endswith(_PYTHON_SUFFIXES):
+            python_files.append(os.fsdecode(path))
+        elif path.endswith(_JS_SUFFIXES):
+            js_files.append(os.fsdecode(path))
+    return python_files, js_files
+
+
+_USAGE = "usage: run_validators.py --base-ref BASE_REF [--head-ref HEAD_REF]"
+
 
-    lint_errors = 0
+def _parse_args(argv: Sequence[str]) -> tuple[str, str]:
+    """Return ``(base_ref, head_ref)`` from ``argv``; exits with status 2 on bad input.
 
-    python_result = run_python_validators(python_files)
-    report.fatal.extend(python_result.fatal)
-    report.warnings.extend(python_result.warnings)
-    lint_errors += python_result.lint_errors
+    The two flags do not justify argparse's import and parser construction cost.
+    """
 
-    js_result = run_js_validators(js_files)
-    report.fatal.extend(js_result.fatal)
-    report.warnings.extend(js_result.warnings)
-    lint_errors += js_result.lint_errors
+    base_ref: str | None = None
+    head_ref = "HEAD"
+    args = iter(argv)
+    for arg in args:
+        if arg in ("-h", "--help"):
+            sys.stdout.write(_USAGE + "\n")
+            raise SystemExit(0)
+        flag, sep, value = arg.partition("=")
+        if flag not in ("--base-ref", "--head-ref"):
+            _usage_error(f"unrecognized argument: {arg}")
+        if not sep:
+            following = next(args, None)
+            if following is None:
+                _usage_error(f"argument {flag}: expected one argument")
+            value = following
+        if flag == "--base-ref":
+            base_ref = value
+        else:
+            head_ref = value
+    if base_ref is None:
+        _usage_error("the following arguments are required: --base-ref")
+    return base_ref, head_ref
 
-    report.metrics = Metrics(lint_errors=lint_errors, tests_run=0, tests_failed=0)
+
+def _usage_error(message: str) -> NoReturn:
+    sys.stderr.write(f"{_USAGE}\nrun_validators.py: error: {message}\n")
+    raise SystemExit(2)
+
+
+# ``model_dump_json(indent=2)`` of a report with no findings and zero metrics;
+# only the step id varies, so the clean case skips the serializer entirely.
+_CLEAN_REPORT_TEMPLATE = """{
+  "step_id": "%s",
+  "fatal": [],
+  "warnings": [],
+  "metrics": {
+    "lint_errors": 0,
+    "tests_run": 0,
+    "tests_failed": 0
+  }
+}
+"""
+
+
+def _write_report(report: ValidationReport) -> None:
+    """Write ``report`` to stdout as indented JSON in one serializer pass."""
+
+    _write_stdout(report.model_dump_json(indent=2) + "\n")
+
+
+def _write_stdout(document: str) -> None:
+    """Write ``document`` straight to the stdout file descriptor.
+
+    Streams without one (e.g. a ``StringIO`` under test) fall back to ``write``.
+    """
+
+    try:
+        fd = sys.stdout.fileno()
+    except (AttributeError, OSError):
+        sys.stdout.write(document)
+        return
+    sys.stdout.flush()
+    pending = memoryview(document.encode("utf-8"))
+    while pending:
+        pending = pending[os.write(fd, pending) :]
+
+
+def _report_clean(emit: bool) -> int:
+    """Report a run with nothing to validate and return its exit code."""
+
+    if emit:
+        _write_stdout(_CLEAN_REPORT_TEMPLATE % uuid4())
+    return 0
+
+
+def main(argv: Sequence[str] | None = None, *, emit: bool = True) -> int:
+    """Validate the changed files and return the process exit code.
+
+    With ``emit=False`` no report is built or written; only the exit code is
+    computed, which suits callers that run ``main`` in-process repeatedly.
+    """
+
+    base_ref, head_ref = _parse_args(sys.argv[1:] if argv is None else argv)
+
+    summary, paths = scan_changed_files(base_ref, head_ref)
+    if not paths:
+        return _report_clean(emit)
+
+    size_guard_fatal = check_diff_size(summary)
+    if size_guard_fatal:
+        if emit:
+            # Reports are assembled from already-validated findings and
+            # counters, so both are built with ``model_construct`` instead of
+            # re-running validation.
+            report = ValidationReport.model_construct(
+                step_id=uuid4(),
+                fatal=(size_guard_fatal,),
+                metrics=Metrics.model_construct(
+                    lint_errors=1, tests_run=0, tests_failed=0
+                ),
+            )
+            _write_report(report)
+        return 1
+
+    python_files, js_files = _split_paths(paths)
+    if not python_files and not js_files:
+        return _report_clean(emit)
+
+    # Each backend is imported only when its language has changed files; the
+    # two run side by side since both mostly wait on linter subprocesses.
+    python_future = js_future = None
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        if python_files:
+            python_future = executor.submit(_import_python_backend(), python_files)
+        if js_files:
+            js_future = executor.submit(_import_js_backend(), js_files)
+    python_result = python_future.result() if python_future else _NO_FINDINGS
+    js_result = js_future.result() if js_future else _NO_FINDINGS
+
+    if not emit:
+        return 1 if python_result.fatal or js_result.fatal else 0
+    if not (
+        python_result.fatal
+        or js_result.fatal
+        or python_result.warnings
+        or js_result.warnings
+        or python_result.lint_errors
+        or js_result.lint_errors
+    ):
+        return _report_clean(emit)
+
+    report = ValidationReport.model_construct(
+        step_id=uuid4(),
+        fatal=(*python_result.fatal, *js_result.fatal),
+        warnings=(*python_result.warnings, *js_result.warnings),
+        metrics=Metrics.model_construct(
+            lint_errors=python_result.lint_errors + js_result.lint_errors,
+            tests_run=0,
+            tests_failed=0,
+        ),
+    )
 
     exit_code = 1 if report.has_fatal else 0
 
-    print(json.dumps(report.model_dump(mode="json"), indent=2))
+    _write_report(report)
     return exit_code
 
 